@@ -0,0 +1,119 @@
+"""Admission control: shed load before the database pool turns into a queue.
+
+When more requests wait for a pooled connection than the pool can serve
+within its timeout, new requests are rejected up front with 503 and
+``Retry-After`` instead of piling up behind the pool and failing one by one
+with timeouts. Statement, lock and pool timeouts raised while a request is
+already running are answered the same way; any other database error
+propagates to the default 500 handling untouched.
+"""
+
+from collections.abc import Iterable
+from typing import Any
+
+from fastapi import status
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import DBAPIError, TimeoutError as PoolTimeoutError
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.database import CountingQueuePool
+
+# SQLSTATE of statement_timeout (query_canceled) and lock_timeout (lock_not_available)
+OVERLOAD_SQLSTATES = frozenset({"57014", "55P03"})
+
+OVERLOAD_DETAIL = "Service is overloaded, retry later"
+
+_stats = {"rejected": 0, "timeouts": 0}
+
+
+def _overload_response() -> JSONResponse:
+    """Build the 503 response with a retry hint."""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": OVERLOAD_DETAIL},
+        headers={"Retry-After": str(settings.db_admission_retry_after_seconds)},
+    )
+
+
+def _is_overload(exc: PoolTimeoutError | DBAPIError) -> bool:
+    """Check whether a database error is a pool, statement or lock timeout."""
+    if isinstance(exc, PoolTimeoutError):
+        return True
+    return getattr(exc.orig, "sqlstate", None) in OVERLOAD_SQLSTATES
+
+
+class AdmissionControlMiddleware:
+    """Reject requests with 503 while the pool wait queue is over the limit.
+
+    Requests that hit a database timeout before their response started are
+    answered with the same 503.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        pool: CountingQueuePool,
+        max_waiters: int,
+        exempt_paths: Iterable[str] = (),
+    ) -> None:
+        """Initialize middleware.
+
+        Args:
+            app: Wrapped ASGI application.
+            pool: Pool whose wait queue is watched.
+            max_waiters: Waiting callers at which requests are rejected, 0 disables.
+            exempt_paths: Paths always admitted, e.g. health checks.
+        """
+        self.app = app
+        self.pool = pool
+        self.max_waiters = max_waiters
+        self.exempt_paths = frozenset(exempt_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Admit or reject an HTTP request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        if (
+            self.max_waiters > 0
+            and self.pool.waiting >= self.max_waiters
+            and scope["path"] not in self.exempt_paths
+        ):
+            _stats["rejected"] += 1
+            await _overload_response()(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_tracked(message: Message) -> None:
+            nonlocal response_started
+            response_started |= message["type"] == "http.response.start"
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_tracked)
+        except (PoolTimeoutError, DBAPIError) as exc:
+            if response_started or not _is_overload(exc):
+                raise
+            _stats["timeouts"] += 1
+            await _overload_response()(scope, receive, send)
+
+
+def get_admission_stats(pool: CountingQueuePool) -> dict[str, Any]:
+    """Get pool occupancy and load-shedding counters of this worker.
+
+    Args:
+        pool: Engine connection pool.
+
+    Returns:
+        dict: Pool state and rejected/timed-out request counters.
+    """
+    return {
+        "pool_size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "waiting": pool.waiting,
+        "max_waiters": settings.db_admission_max_waiters,
+        **_stats,
+    }
@@ -0,0 +1,38 @@
+"""Tracking of background work running outside any request.
+
+Tasks registered here are kept referenced until they finish, and
+:func:`drain_background_tasks` lets shutdown wait for them.
+"""
+
+import asyncio
+
+_tasks: set[asyncio.Task] = set()
+
+
+def track_task(task: asyncio.Task) -> asyncio.Task:
+    """Keep a task referenced until it finishes so shutdown can drain it.
+
+    Args:
+        task: Running task; its result is handled by the caller.
+
+    Returns:
+        asyncio.Task: The same task.
+    """
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+    return task
+
+
+async def drain_background_tasks(timeout: float) -> None:
+    """Wait for running background tasks, cancelling those still running after timeout.
+
+    Args:
+        timeout: Seconds to wait.
+    """
+    if not _tasks:
+        return
+    _, pending = await asyncio.wait(set(_tasks), timeout=timeout)
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.wait(pending)
@@ -0,0 +1,308 @@
+"""Redis response cache with tag-based invalidation.
+
+Hot read endpoints store their serialized JSON body (plus response headers)
+in Redis under a key derived from the endpoint and its parameters. Every
+entry is registered in one or more tag sets, e.g. ``vacancy:42`` or
+``track:*``. Service mutations call :func:`invalidate_on_commit` with the
+tags they affect, and :func:`app.core.database.get_db` drops the tagged
+entries once the transaction has committed, so readers never re-cache
+data that is about to be rolled back.
+
+A concurrent reader can still store a value loaded just before the commit;
+such entries live at most for their TTL. Redis failures are logged and
+treated as misses, and ``CACHE_ENABLED=false`` bypasses Redis entirely.
+
+Expensive endpoints use :func:`get_or_compute`, which coalesces concurrent
+misses of a key into one computation and refreshes hot entries in the
+background shortly before they expire.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+
+from fastapi import Response
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.singleflight import should_refresh_early, single_flight
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "cache:"
+TAG_PREFIX = "cache:tag:"
+
+# Tag sets outlive any entry they point to; refreshed on every write
+TAG_TTL_SECONDS = 24 * 60 * 60
+
+# Session.info key collecting tags to invalidate after commit
+PENDING_TAGS_KEY = "cache_pending_tags"
+
+# Serialized body and headers produced by a compute function
+ComputedBody = tuple[bytes, dict[str, str] | None]
+
+_redis: Redis | None = None
+_stats: defaultdict[str, dict[str, int]] = defaultdict(
+    lambda: {"hits": 0, "misses": 0, "errors": 0, "early_refreshes": 0}
+)
+
+
+def get_redis() -> Redis:
+    """Get the shared Redis client, creating it on first use.
+
+    Returns:
+        Redis: Async Redis client.
+    """
+    global _redis
+    if _redis is None:
+        _redis = Redis.from_url(settings.redis_url)
+    return _redis
+
+
+async def close_redis() -> None:
+    """Close the shared Redis client."""
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+
+
+def tag(entity: str, entity_id: Any = "*") -> str:
+    """Build a cache tag.
+
+    Args:
+        entity: Entity name, e.g. ``vacancy``.
+        entity_id: Entity ID, ``*`` for the whole collection.
+
+    Returns:
+        str: Tag such as ``vacancy:42`` or ``track:*``.
+    """
+    return f"{entity}:{entity_id}"
+
+
+def cache_key(namespace: str, **params: Any) -> str:
+    """Build a cache key for an endpoint and its parameters.
+
+    Args:
+        namespace: Endpoint name used in metrics, e.g. ``tracks:list``.
+        **params: Parameters that change the response.
+
+    Returns:
+        str: Cache key.
+    """
+    raw = json.dumps(params, sort_keys=True, default=str)
+    digest = hashlib.sha1(raw.encode("utf-8")).hexdigest()[:20]
+    return f"{KEY_PREFIX}{namespace}:{digest}"
+
+
+def _namespace(key: str) -> str:
+    """Extract the metrics namespace from a cache key."""
+    return key.removeprefix(KEY_PREFIX).rsplit(":", 1)[0]
+
+
+def _json_response(body: bytes, headers: dict[str, str] | None) -> Response:
+    """Build a JSON response from a serialized body."""
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def _read(key: str) -> tuple[bytes, dict[str, Any]] | None:
+    """Read an entry and its metadata, counting hits and misses."""
+    if not settings.cache_enabled:
+        return None
+    stats = _stats[_namespace(key)]
+    try:
+        payload = await get_redis().get(key)
+    except RedisError as exc:
+        stats["errors"] += 1
+        logger.warning("Cache read failed for %s: %s", key, exc)
+        return None
+    if payload is None:
+        stats["misses"] += 1
+        return None
+    stats["hits"] += 1
+    raw_meta, body = payload.split(b"\n", 1)
+    return body, json.loads(raw_meta)
+
+
+async def get_cached_response(key: str) -> Response | None:
+    """Get a cached response.
+
+    Args:
+        key: Key from :func:`cache_key`.
+
+    Returns:
+        Response | None: Cached response or None on miss.
+    """
+    entry = await _read(key)
+    if entry is None:
+        return None
+    body, meta = entry
+    return _json_response(body, meta["headers"])
+
+
+async def cache_response(
+    key: str,
+    body: bytes,
+    tags: Iterable[str],
+    ttl: int | None = None,
+    headers: dict[str, str] | None = None,
+    delta: float = 0.0,
+) -> Response:
+    """Store a serialized JSON body under tags and return it as a response.
+
+    Args:
+        key: Key from :func:`cache_key`.
+        body: Serialized JSON body.
+        tags: Tags invalidating this entry.
+        ttl: Time to live in seconds, defaults to ``cache_ttl_seconds``.
+        headers: Response headers stored with the body.
+        delta: Seconds the body took to compute, used for early refresh.
+
+    Returns:
+        Response: JSON response with the given body and headers.
+    """
+    if settings.cache_enabled:
+        ttl = ttl or settings.cache_ttl_seconds
+        meta = {"headers": headers, "delta": delta, "expires_at": time.time() + ttl}
+        payload = json.dumps(meta).encode("utf-8") + b"\n" + body
+        try:
+            async with get_redis().pipeline(transaction=True) as pipe:
+                pipe.set(key, payload, ex=ttl)
+                for item in tags:
+                    pipe.sadd(TAG_PREFIX + item, key)
+                    pipe.expire(TAG_PREFIX + item, TAG_TTL_SECONDS)
+                await pipe.execute()
+        except RedisError as exc:
+            _stats[_namespace(key)]["errors"] += 1
+            logger.warning("Cache write failed for %s: %s", key, exc)
+    return _json_response(body, headers)
+
+
+async def _compute_and_store(
+    key: str,
+    tags: list[str],
+    compute: Callable[[], Awaitable[ComputedBody]],
+    ttl: int | None,
+) -> ComputedBody:
+    """Compute a body, timing it, and store it in the cache."""
+    started = time.perf_counter()
+    body, headers = await compute()
+    await cache_response(
+        key, body, tags, ttl=ttl, headers=headers, delta=time.perf_counter() - started
+    )
+    return body, headers
+
+
+async def _refresh(
+    key: str,
+    tags: list[str],
+    compute: Callable[[], Awaitable[ComputedBody]],
+    ttl: int | None,
+) -> None:
+    """Recompute an entry in the background, logging failures."""
+    try:
+        await _compute_and_store(key, tags, compute, ttl)
+    except Exception as exc:
+        logger.warning("Early refresh failed for %s: %s", key, exc)
+
+
+async def get_or_compute(
+    key: str,
+    tags: Iterable[str],
+    compute: Callable[[], Awaitable[ComputedBody]],
+    ttl: int | None = None,
+) -> Response:
+    """Serve a cached response, computing it at most once per worker on miss.
+
+    Concurrent misses of the same key wait for a single computation. A hit
+    close to expiry may trigger a background refresh (XFetch) while the
+    cached body is still served. ``compute`` runs outside the request, so
+    it must open its own database session.
+
+    Args:
+        key: Key from :func:`cache_key`.
+        tags: Tags invalidating this entry.
+        compute: Coroutine function returning the serialized body and headers.
+        ttl: Time to live in seconds, defaults to ``cache_ttl_seconds``.
+
+    Returns:
+        Response: JSON response.
+    """
+    tags = list(tags)
+    entry = await _read(key)
+    if entry is not None:
+        body, meta = entry
+        if (
+            not single_flight.in_flight(key)
+            and should_refresh_early(
+                meta["delta"], meta["expires_at"], settings.cache_early_refresh_beta
+            )
+        ):
+            _stats[_namespace(key)]["early_refreshes"] += 1
+            single_flight.start(key, lambda: _refresh(key, tags, compute, ttl))
+        return _json_response(body, meta["headers"])
+
+    body, headers = await single_flight.do(
+        key, lambda: _compute_and_store(key, tags, compute, ttl)
+    )
+    return _json_response(body, headers)
+
+
+async def invalidate_tags(*tags: str) -> None:
+    """Delete all entries registered under the given tags.
+
+    Args:
+        *tags: Tags to invalidate.
+    """
+    if not settings.cache_enabled or not tags:
+        return
+    tag_keys = [TAG_PREFIX + item for item in tags]
+    redis = get_redis()
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            for tag_key in tag_keys:
+                pipe.smembers(tag_key)
+            members = await pipe.execute()
+        await redis.delete(*set().union(*members), *tag_keys)
+    except RedisError as exc:
+        logger.warning("Cache invalidation failed for %s: %s", tags, exc)
+
+
+def invalidate_on_commit(db: AsyncSession, *tags: str) -> None:
+    """Schedule tag invalidation for when the session's transaction commits.
+
+    Args:
+        db: Database session of the mutation.
+        *tags: Tags affected by the mutation.
+    """
+    db.info.setdefault(PENDING_TAGS_KEY, set()).update(tags)
+
+
+async def invalidate_committed(db: AsyncSession) -> None:
+    """Invalidate tags collected by :func:`invalidate_on_commit`.
+
+    Args:
+        db: Database session whose transaction has just committed.
+    """
+    tags = db.info.pop(PENDING_TAGS_KEY, None)
+    if tags:
+        await invalidate_tags(*tags)
+
+
+def get_cache_stats() -> dict[str, Any]:
+    """Get hit/miss counters of this worker.
+
+    Returns:
+        dict: Kill switch state and counters per endpoint namespace.
+    """
+    return {
+        "enabled": settings.cache_enabled,
+        "namespaces": {name: dict(counters) for name, counters in _stats.items()},
+        "single_flight": single_flight.get_stats(),
+    }
@@ -1,11 +1,17 @@
 """Database configuration and session management."""
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Any
 
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session, SessionTransaction
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
 
+from app.core.cache import invalidate_committed
 from app.core.config import settings
 
 
@@ -15,10 +21,51 @@ class Base(DeclarativeBase):
     pass
 
 
+class CountingQueuePool(AsyncAdaptedQueuePool):
+    """Connection pool that counts callers waiting for a connection.
+
+    The count drives load shedding in
+    :class:`app.core.admission.AdmissionControlMiddleware`.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize pool."""
+        super().__init__(*args, **kwargs)
+        self.waiting = 0
+
+    def exhausted(self) -> bool:
+        """Whether every connection, overflow included, is checked out."""
+        if self._max_overflow < 0:
+            return False
+        return self.checkedout() >= self.size() + self._max_overflow
+
+    def connect(self) -> PoolProxiedConnection:
+        """Check out a connection, counting the caller if it has to wait."""
+        if not self.exhausted():
+            return super().connect()
+        self.waiting += 1
+        try:
+            return super().connect()
+        finally:
+            self.waiting -= 1
+
+
+# Interactive limits of every connection, sent in the startup packet so they
+# cost no round trip; bulk work raises them per transaction
+SERVER_SETTINGS = {
+    "statement_timeout": str(settings.db_statement_timeout_ms),
+    "lock_timeout": str(settings.db_lock_timeout_ms),
+}
+
 engine = create_async_engine(
     settings.database_url,
     echo=True,
     future=True,
+    poolclass=CountingQueuePool,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout_seconds,
+    connect_args={"server_settings": SERVER_SETTINGS},
 )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -29,15 +76,111 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+# (statement_timeout, lock_timeout) overrides in ms of the current route or
+# job; None keeps the connection value
+_db_timeouts: ContextVar[tuple[int | None, int | None] | None] = ContextVar(
+    "db_timeouts", default=None
+)
+
+
+@event.listens_for(Session, "after_begin")
+def _apply_db_timeouts(
+    session: Session, transaction: SessionTransaction, connection: Connection
+) -> None:
+    """Apply the timeout overrides of the current route to a transaction that has just begun.
+
+    Only transactions with overrides pay the extra round trip. ``SET LOCAL``
+    semantics: the values end with the transaction, so the pooled
+    connection goes back with :data:`SERVER_SETTINGS`.
+    """
+    overrides = {
+        name: str(value)
+        for name, value in zip(("statement_timeout", "lock_timeout"), _db_timeouts.get() or ())
+        if value is not None
+    }
+    if not overrides:
+        return
+    connection.execute(
+        text(
+            "SELECT "
+            + ", ".join(f"set_config('{name}', :{name}, true)" for name in overrides)
+        ),
+        overrides,
+    )
+
+
+@contextmanager
+def statement_timeouts(
+    statement_ms: int | None = None, lock_ms: int | None = None
+) -> Iterator[None]:
+    """Override ``statement_timeout``/``lock_timeout`` of transactions begun inside.
+
+    Args:
+        statement_ms: Statement timeout in ms, 0 disables, None keeps
+            ``DB_STATEMENT_TIMEOUT_MS``.
+        lock_ms: Lock wait timeout in ms, 0 disables, None keeps ``DB_LOCK_TIMEOUT_MS``.
+    """
+    token = _db_timeouts.set((statement_ms, lock_ms))
+    try:
+        yield
+    finally:
+        _db_timeouts.reset(token)
+
+
+def db_timeouts(
+    statement_ms: int | None = None, lock_ms: int | None = None
+) -> Callable[[], AsyncGenerator[None, Any]]:
+    """Build a route dependency overriding the database timeouts of the request.
+
+    Connections start with ``DB_STATEMENT_TIMEOUT_MS``/``DB_LOCK_TIMEOUT_MS``;
+    bulk routes raise them with ``Depends(db_timeouts(statement_ms=60000))``.
+
+    Args:
+        statement_ms: Statement timeout in ms, 0 disables, None keeps
+            ``DB_STATEMENT_TIMEOUT_MS``.
+        lock_ms: Lock wait timeout in ms, 0 disables, None keeps ``DB_LOCK_TIMEOUT_MS``.
+
+    Returns:
+        Callable: Dependency applying the overrides for the request.
+    """
+
+    async def dependency() -> AsyncGenerator[None, Any]:
+        with statement_timeouts(statement_ms, lock_ms):
+            yield
+
+    return dependency
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, Any]:
-    """Get database session.
+    """Get a request-scoped unit of work.
+
+    The session is lazy: it checks out a pooled connection and begins the
+    transaction only when the handler runs its first statement, so requests
+    answered from cache or rejected early never touch the pool. The
+    transaction is committed once after the handler returns and rolled back
+    if the handler raises. Services must only execute/flush and never
+    commit on their own. Cache tags scheduled by the services are
+    invalidated after a successful commit.
 
     Yields:
         AsyncSession: Database session.
     """
     async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
+        await session.commit()
+        await invalidate_committed(session)
+
+
+async def release_connection(db: AsyncSession) -> None:
+    """Commit the request transaction early and return its connection to the pool.
+
+    For handlers that are done with the database but still await other
+    I/O (Redis, coalesced computations). The commit costs nothing extra:
+    it would otherwise run when the request ends. The session stays usable
+    and checks out a connection again on its next statement.
+
+    Args:
+        db: Request database session from :func:`get_db`.
+    """
+    await db.commit()
+    await invalidate_committed(db)
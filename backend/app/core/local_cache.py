@@ -0,0 +1,368 @@
+"""In-process (L1) response cache invalidated through Postgres LISTEN/NOTIFY.
+
+Tiny, rarely changing data (tracks, active vacancies) is served straight
+from the memory of each worker. Statement-level triggers on the source
+tables ``pg_notify`` the table name on :data:`INVALIDATION_CHANNEL`; the
+notification is delivered only after the writing transaction commits, to
+every worker on every node, which then drops the entries built from that
+table.
+
+Coherence rules:
+
+* The cache is bypassed until the listener connection is established and
+  flushed whenever it is lost, since notifications may have been missed.
+* Entries are always loaded from Postgres, never from Redis, and a load
+  that overlapped an invalidation of its tables is not stored.
+
+Other in-process caches reuse the listener: they :func:`subscribe` to a
+payload prefix and receive keyed notifications ``<prefix>:<key>``, sent by
+triggers on their source tables. :class:`KeyedCache` implements such a
+cache of arbitrary values with the same coherence rules.
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, Generic, TypeVar
+
+import asyncpg
+from fastapi import Response
+from sqlalchemy.engine import make_url
+
+from app.core.config import settings
+from app.core.singleflight import single_flight
+
+logger = logging.getLogger(__name__)
+
+# Must match the channel used by the notify_cache_invalidation() trigger
+INVALIDATION_CHANNEL = "cache_invalidation"
+
+# Listener keepalive and reconnect delay in seconds
+LISTENER_PING_INTERVAL = 30
+LISTENER_RETRY_DELAY = 5
+
+# Serialized body and headers produced by a loader
+LoadedBody = tuple[bytes, dict[str, str] | None]
+
+V = TypeVar("V")
+
+
+class LocalCache:
+    """Bounded LRU of serialized responses grouped by source table."""
+
+    def __init__(self, max_entries: int) -> None:
+        """Initialize cache.
+
+        Args:
+            max_entries: Maximum number of cached responses.
+        """
+        self.max_entries = max_entries
+        self._ready = asyncio.Event()
+        self._entries: OrderedDict[str, tuple[bytes, dict[str, str] | None, tuple[str, ...]]] = (
+            OrderedDict()
+        )
+        self._generations: dict[str, int] = {}
+        self._epoch = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @property
+    def ready(self) -> bool:
+        """Whether the invalidation listener is connected."""
+        return self._ready.is_set()
+
+    @ready.setter
+    def ready(self, value: bool) -> None:
+        if value:
+            self._ready.set()
+        else:
+            self._ready.clear()
+
+    async def wait_ready(self, timeout: float) -> bool:
+        """Wait until the invalidation listener is connected.
+
+        Returns at once if the listener is not running.
+
+        Args:
+            timeout: Seconds to wait.
+
+        Returns:
+            bool: True if the listener is connected.
+        """
+        if _listener_task is None or _listener_task.done():
+            return self.ready
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._ready.wait(), timeout=timeout)
+        return self.ready
+
+    @property
+    def active(self) -> bool:
+        """Whether entries may be served and stored."""
+        return settings.local_cache_enabled and self.ready
+
+    def _generation(self, tables: tuple[str, ...]) -> tuple[int, ...]:
+        """Get invalidation counters of the cache and the given tables."""
+        return (self._epoch, *(self._generations.get(table, 0) for table in tables))
+
+    def invalidate(self, table: str) -> None:
+        """Drop all entries built from a table.
+
+        Args:
+            table: Source table name.
+        """
+        self._generations[table] = self._generations.get(table, 0) + 1
+        self.invalidations += 1
+        stale = [key for key, entry in self._entries.items() if table in entry[2]]
+        for key in stale:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all entries and fence in-flight loads."""
+        self._epoch += 1
+        self._entries.clear()
+
+    async def get_or_load(
+        self,
+        key: str,
+        tables: Iterable[str],
+        load: Callable[[], Awaitable[LoadedBody]],
+    ) -> Response:
+        """Serve a JSON response from memory or load and store it.
+
+        Args:
+            key: Cache key, see :func:`app.core.cache.cache_key`.
+            tables: Tables the response is built from.
+            load: Coroutine function returning the serialized body and headers.
+
+        Returns:
+            Response: JSON response.
+        """
+        tables = tuple(tables)
+        if self.active:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return Response(content=entry[0], media_type="application/json", headers=entry[1])
+            self.misses += 1
+
+        generation = self._generation(tables)
+        body, headers = await load()
+        if self.active and self._generation(tables) == generation:
+            self._entries[key] = (body, headers, tables)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get counters of this worker.
+
+        Returns:
+            dict: State, size and hit/miss/invalidation counters.
+        """
+        return {
+            "enabled": settings.local_cache_enabled,
+            "listening": self.ready,
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
+
+
+local_cache = LocalCache(max_entries=settings.local_cache_max_entries)
+
+_listener_task: asyncio.Task | None = None
+
+# Handlers of keyed notifications by payload prefix, see subscribe()
+_subscribers: dict[str, Callable[[str | None], None]] = {}
+
+
+def subscribe(prefix: str, handler: Callable[[str | None], None]) -> None:
+    """Receive notifications ``<prefix>:<key>`` on this worker.
+
+    The handler is called with the key, or with None when everything must
+    be dropped: on a bare ``<prefix>`` payload and whenever the listener
+    connects or disconnects.
+
+    Args:
+        prefix: Payload prefix, must not be a table name.
+        handler: Callback invalidating the key.
+    """
+    _subscribers[prefix] = handler
+
+
+class KeyedCache(Generic[V]):
+    """Bounded LRU of values with per-entry expiry, invalidated by key.
+
+    Values are served only while the invalidation listener is connected.
+    The cache subscribes to notifications ``<prefix>:<key>``; a bare
+    ``<prefix>`` drops everything.
+    """
+
+    def __init__(self, prefix: str, max_entries: int, ttl: float, enabled: bool = True) -> None:
+        """Initialize cache and subscribe to its notifications.
+
+        Args:
+            prefix: Notification prefix, also used for single-flight keys.
+            max_entries: Maximum number of cached values.
+            ttl: Seconds a value is served from memory.
+            enabled: Whether the cache is used at all.
+        """
+        self.prefix = prefix
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.enabled = enabled
+        self._entries: OrderedDict[str, tuple[float, V]] = OrderedDict()
+        self._epoch = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        subscribe(prefix, self.invalidate)
+
+    @property
+    def active(self) -> bool:
+        """Whether values may be served and stored."""
+        return self.enabled and local_cache.ready
+
+    def invalidate(self, key: str | None) -> None:
+        """Drop one value, or all of them.
+
+        Args:
+            key: Cache key, None to drop everything.
+        """
+        self._epoch += 1
+        self.invalidations += 1
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    async def get_or_load(self, key: str, load: Callable[[], Awaitable[V]]) -> V:
+        """Serve a value from memory or load and store it.
+
+        Concurrent misses of a key share one load; a load that overlapped
+        an invalidation is returned but not stored.
+
+        Args:
+            key: Cache key.
+            load: Coroutine function loading the value.
+
+        Returns:
+            Cached or loaded value.
+        """
+        if self.active:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        async def load_and_store() -> V:
+            epoch = self._epoch
+            value = await load()
+            if self.active and self._epoch == epoch:
+                self._entries[key] = (time.monotonic() + self.ttl, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            return value
+
+        return await single_flight.do(f"{self.prefix}:{key}", load_and_store)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get counters of this worker.
+
+        Returns:
+            dict: State, size and hit/miss/invalidation counters.
+        """
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
+
+
+def _flush() -> None:
+    """Drop the in-process cache and every subscriber's entries."""
+    local_cache.clear()
+    for handler in _subscribers.values():
+        handler(None)
+
+
+def _listener_dsn() -> str:
+    """Convert the SQLAlchemy database URL into a plain asyncpg DSN."""
+    url = make_url(settings.database_url).set(drivername="postgresql")
+    return url.render_as_string(hide_password=False)
+
+
+def _on_notification(
+    connection: asyncpg.Connection, pid: int, channel: str, payload: str
+) -> None:
+    """Invalidate the table or subscriber key named in a notification."""
+    prefix, _, key = payload.partition(":")
+    handler = _subscribers.get(prefix)
+    if handler is not None:
+        handler(key or None)
+    else:
+        local_cache.invalidate(payload)
+
+
+async def _listen_once() -> None:
+    """Hold one LISTEN connection until it is lost."""
+    connection: asyncpg.Connection | None = None
+    try:
+        connection = await asyncpg.connect(_listener_dsn())
+        lost = asyncio.Event()
+        connection.add_termination_listener(lambda _: lost.set())
+        await connection.add_listener(INVALIDATION_CHANNEL, _on_notification)
+        _flush()
+        local_cache.ready = True
+        while not lost.is_set():
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(lost.wait(), timeout=LISTENER_PING_INTERVAL)
+            if not lost.is_set():
+                await connection.execute("SELECT 1")
+    finally:
+        local_cache.ready = False
+        if connection is not None and not connection.is_closed():
+            connection.terminate()
+        _flush()
+
+
+async def _listen() -> None:
+    """Keep a LISTEN connection open, reconnecting on any failure until cancelled."""
+    while True:
+        try:
+            await _listen_once()
+        except (OSError, asyncpg.PostgresError, asyncpg.InterfaceError) as exc:
+            logger.warning("Cache invalidation listener disconnected: %s", exc)
+        except Exception:
+            # E.g. a failing subscriber; caches stay bypassed until reconnected
+            logger.exception("Cache invalidation listener failed")
+        await asyncio.sleep(LISTENER_RETRY_DELAY)
+
+
+def start_invalidation_listener() -> None:
+    """Start the LISTEN task of this worker."""
+    global _listener_task
+    if (settings.local_cache_enabled or _subscribers) and _listener_task is None:
+        _listener_task = asyncio.create_task(_listen())
+
+
+async def stop_invalidation_listener() -> None:
+    """Stop the LISTEN task of this worker."""
+    global _listener_task
+    if _listener_task is not None:
+        _listener_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _listener_task
+        _listener_task = None
@@ -1,14 +1,34 @@
-"""Security utilities for authentication and authorization."""
+"""Security utilities for authentication and authorization.
 
+bcrypt is deliberately slow (about 100-300 ms per call at the default
+cost), so async code must not call :func:`verify_password` or
+:func:`get_password_hash` directly: :data:`password_hasher` runs them on a
+small dedicated thread pool (bcrypt releases the GIL) and rejects new work
+with 503 once too many hashes are queued, so a login burst neither blocks
+the event loop nor grows an unbounded backlog.
+
+Verified access tokens are remembered by digest until their ``exp``, so
+repeated requests with the same token skip signature verification and
+payload parsing.
+"""
+
+import asyncio
 import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, TypeVar
 
 import bcrypt
 import jwt
+from fastapi import HTTPException, status
 
 from app.core.config import settings
 
+T = TypeVar("T")
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash.
@@ -35,11 +55,144 @@ def get_password_hash(password: str) -> str:
     Returns:
         str: Hashed password.
     """
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
     hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
     return hashed.decode('utf-8')
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a hash was made with a cost other than ``bcrypt_rounds``.
+
+    Args:
+        hashed_password: Hash in modular crypt format, e.g. ``$2b$12$...``.
+
+    Returns:
+        bool: True if the password should be hashed again.
+    """
+    try:
+        rounds = int(hashed_password.split("$")[2])
+    except (IndexError, ValueError):
+        return True
+    return rounds != settings.bcrypt_rounds
+
+
+class PasswordHasher:
+    """Bounded thread pool running bcrypt off the event loop."""
+
+    def __init__(self, workers: int, max_waiters: int) -> None:
+        """Initialize hasher; threads are started on first use.
+
+        Args:
+            workers: Hashes computed in parallel.
+            max_waiters: Queued hashes at which new ones are rejected, 0 disables.
+        """
+        self.workers = workers
+        self.max_waiters = max_waiters
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending = 0
+        self._stats = {
+            "completed": 0,
+            "rejected": 0,
+            "max_queued": 0,
+            "wait_seconds": 0.0,
+            "run_seconds": 0.0,
+        }
+
+    @staticmethod
+    def _timed(fn: Callable[..., T], *args: Any) -> tuple[T, float, float]:
+        """Call ``fn`` in a worker thread, recording start and end times."""
+        started = time.perf_counter()
+        return fn(*args), started, time.perf_counter()
+
+    async def _run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run a hashing function on the pool.
+
+        Raises:
+            HTTPException: 503 if the queue is full.
+        """
+        queued = max(self._pending - self.workers, 0)
+        if self.max_waiters > 0 and queued >= self.max_waiters:
+            self._stats["rejected"] += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Service is overloaded, retry later",
+                headers={"Retry-After": str(settings.db_admission_retry_after_seconds)},
+            )
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="password-hash"
+            )
+
+        self._pending += 1
+        self._stats["max_queued"] = max(self._stats["max_queued"], self._pending - self.workers)
+        submitted = time.perf_counter()
+        try:
+            result, started, finished = await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._timed, fn, *args
+            )
+        finally:
+            self._pending -= 1
+        self._stats["completed"] += 1
+        self._stats["wait_seconds"] += started - submitted
+        self._stats["run_seconds"] += finished - started
+        return result
+
+    async def hash(self, password: str) -> str:
+        """Hash a password, see :func:`get_password_hash`.
+
+        Args:
+            password: Plain text password.
+
+        Returns:
+            str: Hashed password.
+        """
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password, see :func:`verify_password`.
+
+        Args:
+            plain_password: Plain text password.
+            hashed_password: Hashed password.
+
+        Returns:
+            bool: True if password matches, False otherwise.
+        """
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    def shutdown(self) -> None:
+        """Stop the worker threads after queued hashes finish."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get pool occupancy and timing counters of this worker.
+
+        Returns:
+            dict: Running/queued hashes, rejections and mean wait/run times.
+        """
+        completed = self._stats["completed"] or 1
+        return {
+            "workers": self.workers,
+            "bcrypt_rounds": settings.bcrypt_rounds,
+            "running": min(self._pending, self.workers),
+            "queued": max(self._pending - self.workers, 0),
+            "max_waiters": self.max_waiters,
+            "max_queued": self._stats["max_queued"],
+            "completed": self._stats["completed"],
+            "rejected": self._stats["rejected"],
+            "avg_wait_ms": round(self._stats["wait_seconds"] * 1000 / completed, 2),
+            "avg_run_ms": round(self._stats["run_seconds"] * 1000 / completed, 2),
+        }
+
+
+password_hasher = PasswordHasher(
+    workers=settings.password_hash_workers,
+    max_waiters=settings.password_hash_max_waiters,
+)
+
+
 def create_access_token(data: dict[str, Any], expires_delta: timedelta | None = None) -> str:
     """Create a JWT access token.
 
@@ -62,17 +215,97 @@ def create_access_token(data: dict[str, Any], expires_delta: timedelta | None =
     return encoded_jwt
 
 
+class VerifiedTokenCache:
+    """Bounded LRU of verified token digests and payloads, expiring at ``exp``."""
+
+    def __init__(self, max_entries: int) -> None:
+        """Initialize cache.
+
+        Args:
+            max_entries: Maximum number of cached tokens, 0 disables.
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[bytes, tuple[float, dict[str, Any]]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def digest(token: str) -> bytes:
+        """Get the cache key of a token.
+
+        Args:
+            token: Encoded JWT.
+
+        Returns:
+            bytes: SHA-256 digest of the token.
+        """
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, digest: bytes) -> dict[str, Any] | None:
+        """Get the payload of a verified, unexpired token.
+
+        Args:
+            digest: Token digest.
+
+        Returns:
+            dict | None: Payload, shared between callers, or None on miss.
+        """
+        entry = self._entries.get(digest)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry[0] <= time.time():
+            del self._entries[digest]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(digest)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, digest: bytes, payload: dict[str, Any]) -> None:
+        """Remember a verified token until its ``exp``.
+
+        Args:
+            digest: Token digest.
+            payload: Verified payload.
+        """
+        expires_at = payload.get("exp")
+        if self.max_entries <= 0 or not isinstance(expires_at, int | float):
+            return
+        self._entries[digest] = (float(expires_at), payload)
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get counters of this worker.
+
+        Returns:
+            dict: Size and hit/miss counters.
+        """
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+verified_tokens = VerifiedTokenCache(max_entries=settings.auth_token_cache_max_entries)
+
+
 def decode_access_token(token: str) -> dict[str, Any] | None:
-    """Decode a JWT access token.
+    """Decode a JWT access token, reusing earlier verifications.
 
     Args:
         token: JWT token to decode.
 
     Returns:
-        dict | None: Decoded token data or None if invalid.
+        dict | None: Decoded token data or None if invalid. The dict is
+        shared with later callers and must not be modified.
     """
+    digest = verified_tokens.digest(token)
+    payload = verified_tokens.get(digest)
+    if payload is not None:
+        return payload
     try:
         payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-        return payload
     except jwt.PyJWTError:
         return None
+    verified_tokens.put(digest, payload)
+    return payload
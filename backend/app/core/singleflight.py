@@ -0,0 +1,108 @@
+"""Request coalescing (single-flight) and probabilistic early refresh.
+
+Concurrent callers asking for the same key share one in-flight computation
+instead of each hitting Postgres when a hot cache entry expires. The
+computation runs as its own task, so a cancelled caller does not cancel
+it for the others; it must therefore not use a request-scoped session.
+
+:func:`should_refresh_early` implements the XFetch rule: an entry is
+recomputed before it expires with a probability that grows as expiry
+nears and with how long the value took to compute, which spreads refreshes
+of hot keys over time across workers.
+"""
+
+import asyncio
+import math
+import random
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from app.core.background import track_task
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Coalesce concurrent calls by key within this worker."""
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._calls: dict[str, asyncio.Task] = {}
+        self.shared = 0
+
+    def in_flight(self, key: str) -> bool:
+        """Check whether a computation for the key is running.
+
+        Args:
+            key: Computation key.
+
+        Returns:
+            bool: True if a computation is in flight.
+        """
+        return key in self._calls
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        """Remove a finished call, marking its exception as retrieved."""
+        self._calls.pop(key, None)
+        if not task.cancelled():
+            task.exception()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get coalescing counters of this worker.
+
+        Returns:
+            dict: In-flight computations and calls that joined one.
+        """
+        return {"in_flight": len(self._calls), "shared": self.shared}
+
+    def start(self, key: str, fn: Callable[[], Awaitable[T]]) -> asyncio.Task:
+        """Start ``fn`` for the key unless a computation is already in flight.
+
+        Args:
+            key: Computation key.
+            fn: Coroutine function computing the value.
+
+        Returns:
+            asyncio.Task: The in-flight computation.
+        """
+        task = self._calls.get(key)
+        if task is not None:
+            self.shared += 1
+            return task
+        task = track_task(asyncio.ensure_future(fn()))
+        self._calls[key] = task
+        task.add_done_callback(lambda done: self._forget(key, done))
+        return task
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fn`` once for all concurrent callers of the same key.
+
+        Args:
+            key: Computation key.
+            fn: Coroutine function computing the value.
+
+        Returns:
+            The value computed by the single in-flight call. Exceptions are
+            propagated to every waiting caller.
+        """
+        return await asyncio.shield(self.start(key, fn))
+
+
+def should_refresh_early(delta: float, expires_at: float, beta: float = 1.0) -> bool:
+    """Decide whether to recompute a cached value before it expires (XFetch).
+
+    Args:
+        delta: Seconds the value took to compute.
+        expires_at: Unix time when the value expires.
+        beta: Eagerness; values above 1 favour earlier refreshes.
+
+    Returns:
+        bool: True if this caller should refresh the value now.
+    """
+    if delta <= 0 or beta <= 0:
+        return False
+    return time.time() - delta * beta * math.log(random.random() or 1e-12) >= expires_at
+
+
+single_flight = SingleFlight()
@@ -0,0 +1,82 @@
+"""Startup warm-up of connection pools and external dependencies.
+
+A freshly started worker would otherwise pay for TCP/TLS handshakes,
+Postgres authentication and DNS lookups on its first requests. Every step
+is best-effort: failures are logged and the worker still starts.
+"""
+
+import asyncio
+import logging
+
+from sqlalchemy import text
+
+from app.core.cache import get_redis
+from app.core.config import settings
+from app.core.database import engine
+
+logger = logging.getLogger(__name__)
+
+
+async def warm_db_pool(connections: int) -> int:
+    """Open pool connections concurrently and return them to the pool.
+
+    Failures are logged and never abort startup.
+
+    Args:
+        connections: Number of connections to open.
+
+    Returns:
+        int: Number of connections opened and checked.
+    """
+    if connections <= 0:
+        return 0
+    results = await asyncio.gather(
+        *(engine.connect().start() for _ in range(connections)), return_exceptions=True
+    )
+    opened = [result for result in results if not isinstance(result, BaseException)]
+    errors = [result for result in results if isinstance(result, BaseException)]
+    pings = await asyncio.gather(
+        *(conn.execute(text("SELECT 1")) for conn in opened), return_exceptions=True
+    )
+    errors.extend(ping for ping in pings if isinstance(ping, BaseException))
+    closed = await asyncio.gather(*(conn.close() for conn in opened), return_exceptions=True)
+    errors.extend(close for close in closed if isinstance(close, BaseException))
+    warmed = sum(not isinstance(ping, BaseException) for ping in pings)
+    if errors:
+        logger.warning("Warmed %d of %d DB connections: %s", warmed, connections, errors[0])
+    return warmed
+
+
+async def ping_redis() -> bool:
+    """Connect to Redis and check that it responds.
+
+    Returns:
+        bool: True if Redis answered the ping.
+    """
+    if not settings.cache_enabled:
+        return False
+    try:
+        return await asyncio.wait_for(
+            get_redis().ping(), timeout=settings.startup_ping_timeout_seconds
+        )
+    except Exception as exc:
+        logger.warning("Redis ping failed: %s", exc)
+        return False
+
+
+async def ping_ml_service() -> bool:
+    """Check that the ML service health endpoint responds.
+
+    Returns:
+        bool: True if the ML service is healthy.
+    """
+    # Imported lazily: the HTTP client stack is not needed to serve the API
+    import httpx
+
+    try:
+        async with httpx.AsyncClient(timeout=settings.startup_ping_timeout_seconds) as client:
+            response = await client.get(f"{settings.ml_service_url}/health")
+        return response.status_code == 200
+    except httpx.HTTPError as exc:
+        logger.warning("ML service ping failed: %s", exc)
+        return False
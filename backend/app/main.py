@@ -1,33 +1,38 @@
 """Main FastAPI application entry point."""
 
-from fastapi import FastAPI, Request
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from fastapi import APIRouter, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from app.core.admission import AdmissionControlMiddleware, get_admission_stats
+from app.core.background import drain_background_tasks, track_task
+from app.core.cache import close_redis, get_cache_stats
 from app.core.config import settings
+from app.core.database import AsyncSessionLocal, engine
 from app.core.exceptions import BaseAppException
-
-app = FastAPI(
-    title="X5 Recruitment System API",
-    description="API для системы рекрутинга X5 Group",
-    version="0.1.0",
-    docs_url="/api/docs",
-    redoc_url="/api/redoc",
-    openapi_url="/api/openapi.json",
+from app.core.security import password_hasher, verified_tokens
+from app.core.local_cache import (
+    local_cache,
+    start_invalidation_listener,
+    stop_invalidation_listener,
 )
+from app.core.warmup import ping_ml_service, ping_redis, warm_db_pool
+from app.shared.conditional import ETAG_HEADER, LAST_MODIFIED_HEADER
+from app.shared.pagination import NEXT_CURSOR_HEADER
+from app.shared.responses import PydanticJSONResponse
 
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=[settings.frontend_url],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+logger = logging.getLogger(__name__)
+
+system_router = APIRouter()
 
 
 # Exception handlers
-@app.exception_handler(BaseAppException)
 async def app_exception_handler(request: Request, exc: BaseAppException) -> JSONResponse:
     """Handle application exceptions.
 
@@ -44,7 +49,7 @@ async def app_exception_handler(request: Request, exc: BaseAppException) -> JSON
     )
 
 
-@app.get("/")
+@system_router.get("/")
 async def root() -> dict[str, str]:
     """Root endpoint.
 
@@ -54,7 +59,7 @@ async def root() -> dict[str, str]:
     return {"message": "X5 Recruitment System API"}
 
 
-@app.get("/health")
+@system_router.get("/health")
 async def health() -> dict[str, str]:
     """Health check endpoint.
 
@@ -64,17 +69,157 @@ async def health() -> dict[str, str]:
     return {"status": "healthy"}
 
 
-# Register module routers
-from app.modules.auth.router import router as auth_router
-from app.modules.candidates.router import router as candidates_router
-from app.modules.hiring_managers.router import router as hiring_managers_router
-from app.modules.vacancies.pools_router import router as pools_router
-from app.modules.vacancies.tracks_router import router as tracks_router
-from app.modules.vacancies.vacancies_router import router as vacancies_router
-
-app.include_router(auth_router, prefix="/api/auth", tags=["auth"])
-app.include_router(candidates_router, prefix="/api/candidates", tags=["candidates"])
-app.include_router(hiring_managers_router, prefix="/api/hiring-managers", tags=["hiring-managers"])
-app.include_router(tracks_router, prefix="/api/tracks", tags=["tracks"])
-app.include_router(vacancies_router, prefix="/api/vacancies", tags=["vacancies"])
-app.include_router(pools_router, prefix="/api/candidate-pools", tags=["candidate-pools"])
+@system_router.get("/metrics/cache")
+async def cache_metrics() -> dict[str, Any]:
+    """Response cache metrics endpoint.
+
+    Returns:
+        dict: Redis and in-process cache counters of this worker.
+    """
+    from app.modules.telegram.identity import identity_cache
+
+    return {
+        **get_cache_stats(),
+        "local": local_cache.get_stats(),
+        "telegram_identity": identity_cache.get_stats(),
+    }
+
+
+@system_router.get("/metrics/db")
+async def db_metrics() -> dict[str, Any]:
+    """Connection pool and load-shedding metrics endpoint.
+
+    Returns:
+        dict: Pool occupancy and rejected request counters of this worker.
+    """
+    return get_admission_stats(engine.pool)
+
+
+@system_router.get("/metrics/auth")
+async def auth_metrics() -> dict[str, Any]:
+    """Authentication metrics endpoint.
+
+    Returns:
+        dict: Password hashing queue, token and user cache counters of this worker.
+    """
+    from app.modules.auth.service import user_cache
+
+    return {
+        **password_hasher.get_stats(),
+        "token_cache": verified_tokens.get_stats(),
+        "user_cache": user_cache.get_stats(),
+    }
+
+
+async def prime_local_caches() -> None:
+    """Load the first pages of tracks and active vacancies into the in-process cache."""
+    from app.modules.vacancies.tracks_router import list_tracks_response
+    from app.modules.vacancies.vacancies_router import list_vacancies_response
+    from app.shared.enums import VacancyStatus
+
+    if not settings.local_cache_enabled:
+        return
+    if not await local_cache.wait_ready(timeout=settings.startup_ping_timeout_seconds):
+        logger.warning("Cache invalidation listener not connected, skipping cache priming")
+        return
+    try:
+        async with AsyncSessionLocal() as db:
+            await list_tracks_response(db)
+            await list_tracks_response(db, active_only=True)
+            await list_vacancies_response(db, status=VacancyStatus.ACTIVE)
+    except Exception as exc:
+        logger.warning("Cache priming failed: %s", exc)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Warm up on startup and drain on shutdown.
+
+    Startup opens ``db_warmup_connections`` pool connections, pings Redis
+    and primes the in-process caches, so that the first requests of a new
+    worker run at steady-state latency. The ML service is pinged in the
+    background once startup is done, so its HTTP client stack is not
+    imported on the startup path. Shutdown
+    stops listeners, waits for background computations, stops the password
+    hashing threads, then closes Redis and disposes of the engine.
+
+    Args:
+        app: Application instance.
+    """
+    start_invalidation_listener()
+    await asyncio.gather(warm_db_pool(settings.db_warmup_connections), ping_redis())
+    await prime_local_caches()
+    track_task(asyncio.create_task(ping_ml_service()))
+
+    yield
+
+    await stop_invalidation_listener()
+    await drain_background_tasks(timeout=settings.shutdown_drain_timeout_seconds)
+    # Waits for queued hashes, off the event loop
+    await asyncio.to_thread(password_hasher.shutdown)
+    await close_redis()
+    await engine.dispose()
+
+
+def create_app() -> FastAPI:
+    """Build the FastAPI application.
+
+    Module routers are imported here rather than at module import time.
+
+    Returns:
+        FastAPI: Configured application.
+    """
+    from app.modules.auth.router import router as auth_router
+    from app.modules.candidates.router import router as candidates_router
+    from app.modules.hiring_managers.router import router as hiring_managers_router
+    from app.modules.telegram.router import router as telegram_router
+    from app.modules.vacancies.pools_router import router as pools_router
+    from app.modules.vacancies.tracks_router import router as tracks_router
+    from app.modules.vacancies.vacancies_router import router as vacancies_router
+
+    app = FastAPI(
+        title="X5 Recruitment System API",
+        description="API для системы рекрутинга X5 Group",
+        version="0.1.0",
+        docs_url="/api/docs",
+        redoc_url="/api/redoc",
+        openapi_url="/api/openapi.json",
+        default_response_class=PydanticJSONResponse,
+        lifespan=lifespan,
+    )
+
+    # Load shedding and database timeouts; added before CORS so that 503
+    # responses carry CORS headers
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        pool=engine.pool,
+        max_waiters=settings.db_admission_max_waiters,
+        exempt_paths=[route.path for route in system_router.routes],
+    )
+
+    # CORS middleware
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=[settings.frontend_url],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER, ETAG_HEADER, LAST_MODIFIED_HEADER],
+    )
+
+    app.add_exception_handler(BaseAppException, app_exception_handler)
+
+    # Register routers
+    app.include_router(system_router)
+    app.include_router(auth_router, prefix="/api/auth", tags=["auth"])
+    app.include_router(candidates_router, prefix="/api/candidates", tags=["candidates"])
+    app.include_router(hiring_managers_router, prefix="/api/hiring-managers", tags=["hiring-managers"])
+    app.include_router(tracks_router, prefix="/api/tracks", tags=["tracks"])
+    app.include_router(vacancies_router, prefix="/api/vacancies", tags=["vacancies"])
+    app.include_router(pools_router, prefix="/api/candidate-pools", tags=["candidate-pools"])
+    app.include_router(telegram_router, prefix="/api/telegram", tags=["telegram"])
+
+    return app
+
+
+app = create_app()
@@ -0,0 +1,30 @@
+"""pool listing keyset index
+
+Revision ID: 3fa9c61e0b7d
+Revises: d41e7b29c3f5
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3fa9c61e0b7d'
+down_revision: Union[str, None] = 'd41e7b29c3f5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_candidate_pools_vacancy_created_at_id',
+        'candidate_pools',
+        ['vacancy_id', 'created_at', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_candidate_pools_vacancy_created_at_id', table_name='candidate_pools')
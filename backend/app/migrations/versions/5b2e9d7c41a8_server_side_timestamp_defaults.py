@@ -0,0 +1,36 @@
+"""server side timestamp defaults
+
+Revision ID: 5b2e9d7c41a8
+Revises: abc123def456
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b2e9d7c41a8'
+down_revision: Union[str, None] = 'abc123def456'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Tables whose timestamps are now filled by PostgreSQL and read back via RETURNING
+TIMESTAMPED_TABLES = ['tracks', 'vacancies', 'candidate_pools', 'candidates', 'hiring_managers']
+
+
+def upgrade() -> None:
+    for table in TIMESTAMPED_TABLES:
+        op.alter_column(table, 'created_at', server_default=sa.text('now()'))
+        op.alter_column(table, 'updated_at', server_default=sa.text('now()'))
+    op.alter_column('interview_feedbacks', 'created_at', server_default=sa.text('now()'))
+
+
+def downgrade() -> None:
+    op.alter_column('interview_feedbacks', 'created_at', server_default=None)
+    for table in TIMESTAMPED_TABLES:
+        op.alter_column(table, 'updated_at', server_default=None)
+        op.alter_column(table, 'created_at', server_default=None)
@@ -0,0 +1,65 @@
+"""candidate search indexes
+
+Revision ID: 6d8e21b4a0f3
+Revises: 3fa9c61e0b7d
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6d8e21b4a0f3'
+down_revision: Union[str, None] = '3fa9c61e0b7d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Must match SEARCH_VECTOR_EXPRESSION in app/modules/candidates/models.py
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('russian', full_name), 'A') || "
+    "setweight(to_tsvector('russian', coalesce(university, '')), 'B') || "
+    "setweight(jsonb_to_tsvector('russian', achievements, '[\"string\"]'), 'C')"
+)
+
+
+def upgrade() -> None:
+    # Rewrites the table once to fill the generated column
+    op.add_column(
+        'candidates',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+            nullable=False,
+            comment='Полнотекстовый индекс: имя (A), университет (B), достижения (C)',
+        ),
+    )
+    op.create_index(
+        'idx_candidates_search_vector', 'candidates', ['search_vector'],
+        unique=False, postgresql_using='gin',
+    )
+    op.create_index(
+        'idx_candidates_domains', 'candidates', ['domains'],
+        unique=False, postgresql_using='gin', postgresql_ops={'domains': 'jsonb_path_ops'},
+    )
+    op.create_index(
+        'idx_candidates_preferred_tracks', 'candidates', ['preferred_tracks'],
+        unique=False, postgresql_using='gin', postgresql_ops={'preferred_tracks': 'jsonb_path_ops'},
+    )
+    op.create_index(
+        'idx_candidates_location_lower', 'candidates', [sa.text('lower(location) text_pattern_ops')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_candidates_location_lower', table_name='candidates')
+    op.drop_index('idx_candidates_preferred_tracks', table_name='candidates')
+    op.drop_index('idx_candidates_domains', table_name='candidates')
+    op.drop_index('idx_candidates_search_vector', table_name='candidates')
+    op.drop_column('candidates', 'search_vector')
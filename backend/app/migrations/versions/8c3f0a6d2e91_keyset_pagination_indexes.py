@@ -0,0 +1,31 @@
+"""keyset pagination indexes
+
+Revision ID: 8c3f0a6d2e91
+Revises: 5b2e9d7c41a8
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c3f0a6d2e91'
+down_revision: Union[str, None] = '5b2e9d7c41a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Tables listed with keyset pagination over (created_at, id)
+PAGINATED_TABLES = ['candidates', 'hiring_managers', 'tracks', 'vacancies']
+
+
+def upgrade() -> None:
+    for table in PAGINATED_TABLES:
+        op.create_index(f'idx_{table}_created_at_id', table, ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    for table in PAGINATED_TABLES:
+        op.drop_index(f'idx_{table}_created_at_id', table_name=table)
@@ -0,0 +1,43 @@
+"""typeahead trigram indexes
+
+Revision ID: a27c4f9e15b6
+Revises: 6d8e21b4a0f3
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a27c4f9e15b6'
+down_revision: Union[str, None] = '6d8e21b4a0f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'idx_candidates_full_name_trgm', 'candidates', ['full_name'],
+        unique=False, postgresql_using='gin', postgresql_ops={'full_name': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'idx_candidates_phone_digits_trgm', 'candidates',
+        [sa.text("regexp_replace(phone, '\\D', '', 'g') gin_trgm_ops")],
+        unique=False, postgresql_using='gin',
+    )
+    op.create_index(
+        'idx_hiring_managers_full_name_trgm', 'hiring_managers',
+        [sa.text("(first_name || ' ' || last_name) gin_trgm_ops")],
+        unique=False, postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_hiring_managers_full_name_trgm', table_name='hiring_managers')
+    op.drop_index('idx_candidates_phone_digits_trgm', table_name='candidates')
+    op.drop_index('idx_candidates_full_name_trgm', table_name='candidates')
+    # pg_trgm stays installed: other objects or databases may depend on it
@@ -0,0 +1,70 @@
+"""users cache invalidation trigger
+
+Revision ID: b3f6c8e2d917
+Revises: e5b09d3c7a41
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3f6c8e2d917'
+down_revision: Union[str, None] = 'e5b09d3c7a41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Must match app.core.local_cache.INVALIDATION_CHANNEL
+CHANNEL = 'cache_invalidation'
+
+# Must match app.modules.auth.service.USER_CACHE_PREFIX
+PREFIX = 'auth_user'
+
+
+def upgrade() -> None:
+    # Row-level, so workers drop only the changed users; covers updates made
+    # outside the API, e.g. blocking an account in SQL
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION notify_user_invalidation() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('{CHANNEL}', '{PREFIX}:' || OLD.id::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_users_cache_invalidation
+        AFTER UPDATE OR DELETE ON users
+        FOR EACH ROW EXECUTE FUNCTION notify_user_invalidation()
+        """
+    )
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION notify_users_truncate() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('{CHANNEL}', '{PREFIX}');
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_users_truncate_cache_invalidation
+        AFTER TRUNCATE ON users
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_users_truncate()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER IF EXISTS trg_users_truncate_cache_invalidation ON users')
+    op.execute('DROP TRIGGER IF EXISTS trg_users_cache_invalidation ON users')
+    op.execute('DROP FUNCTION IF EXISTS notify_users_truncate()')
+    op.execute('DROP FUNCTION IF EXISTS notify_user_invalidation()')
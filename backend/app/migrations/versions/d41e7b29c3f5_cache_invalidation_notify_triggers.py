@@ -0,0 +1,51 @@
+"""cache invalidation notify triggers
+
+Revision ID: d41e7b29c3f5
+Revises: 8c3f0a6d2e91
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41e7b29c3f5'
+down_revision: Union[str, None] = '8c3f0a6d2e91'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Must match app.core.local_cache.INVALIDATION_CHANNEL
+CHANNEL = 'cache_invalidation'
+
+# Tables served from the in-process cache of every worker
+NOTIFY_TABLES = ['tracks', 'vacancies']
+
+
+def upgrade() -> None:
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION notify_cache_invalidation() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('{CHANNEL}', TG_TABLE_NAME);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for table in NOTIFY_TABLES:
+        op.execute(
+            f"""
+            CREATE TRIGGER trg_{table}_cache_invalidation
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION notify_cache_invalidation()
+            """
+        )
+
+
+def downgrade() -> None:
+    for table in NOTIFY_TABLES:
+        op.execute(f'DROP TRIGGER IF EXISTS trg_{table}_cache_invalidation ON {table}')
+    op.execute('DROP FUNCTION IF EXISTS notify_cache_invalidation()')
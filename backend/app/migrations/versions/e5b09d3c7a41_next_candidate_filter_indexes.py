@@ -0,0 +1,40 @@
+"""next candidate filter indexes
+
+Revision ID: e5b09d3c7a41
+Revises: a27c4f9e15b6
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b09d3c7a41'
+down_revision: Union[str, None] = 'a27c4f9e15b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Must match TRACK_PRIORITY_LEVELS in app/modules/candidates/models.py
+TRACK_PRIORITY_LEVELS = 3
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_candidates_university_lower', 'candidates',
+        [sa.text('lower(university) text_pattern_ops')], unique=False,
+    )
+    for level in range(TRACK_PRIORITY_LEVELS):
+        op.create_index(
+            f'idx_candidates_track_priority_{level}', 'candidates',
+            [sa.text(f'(preferred_tracks -> {level})'), 'course'], unique=False,
+        )
+
+
+def downgrade() -> None:
+    for level in range(TRACK_PRIORITY_LEVELS):
+        op.drop_index(f'idx_candidates_track_priority_{level}', table_name='candidates')
+    op.drop_index('idx_candidates_university_lower', table_name='candidates')
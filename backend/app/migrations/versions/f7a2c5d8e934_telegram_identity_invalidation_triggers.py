@@ -0,0 +1,118 @@
+"""telegram identity invalidation triggers
+
+Revision ID: f7a2c5d8e934
+Revises: b3f6c8e2d917
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7a2c5d8e934'
+down_revision: Union[str, None] = 'b3f6c8e2d917'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Must match app.core.local_cache.INVALIDATION_CHANNEL
+CHANNEL = 'cache_invalidation'
+
+# Must match app.modules.telegram.identity.IDENTITY_NAMESPACE
+PREFIX = 'telegram_identity'
+
+# Statements touching more profiles drop every cached resolution
+MAX_KEYED_NOTIFICATIONS = 100
+
+# Table -> TelegramEntityType value
+IDENTITY_TABLES = {'candidates': 'candidate', 'hiring_managers': 'hiring_manager'}
+
+
+def upgrade() -> None:
+    # Statement-level with transition tables, so a bulk import sends one
+    # notification instead of one per row. Transition tables need one
+    # trigger per event.
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION notify_telegram_identity_invalidation() RETURNS trigger AS $$
+        DECLARE
+            telegram_ids bigint[];
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                SELECT array_agg(DISTINCT telegram_id) INTO telegram_ids FROM new_rows;
+            ELSIF TG_OP = 'DELETE' THEN
+                SELECT array_agg(DISTINCT telegram_id) INTO telegram_ids FROM old_rows;
+            ELSE
+                SELECT array_agg(DISTINCT telegram_id) INTO telegram_ids
+                FROM (
+                    SELECT telegram_id FROM old_rows
+                    UNION
+                    SELECT telegram_id FROM new_rows
+                ) AS changed;
+            END IF;
+            IF telegram_ids IS NULL THEN
+                RETURN NULL;
+            END IF;
+            IF cardinality(telegram_ids) > {MAX_KEYED_NOTIFICATIONS} THEN
+                PERFORM pg_notify('{CHANNEL}', '{PREFIX}');
+            ELSE
+                PERFORM pg_notify('{CHANNEL}', '{PREFIX}:' || TG_ARGV[0] || ':' || telegram_id)
+                FROM unnest(telegram_ids) AS telegram_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION notify_telegram_identity_truncate() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('{CHANNEL}', '{PREFIX}');
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for table, entity_type in IDENTITY_TABLES.items():
+        op.execute(
+            f"""
+            CREATE TRIGGER trg_{table}_identity_insert
+            AFTER INSERT ON {table}
+            REFERENCING NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION notify_telegram_identity_invalidation('{entity_type}')
+            """
+        )
+        op.execute(
+            f"""
+            CREATE TRIGGER trg_{table}_identity_update
+            AFTER UPDATE ON {table}
+            REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION notify_telegram_identity_invalidation('{entity_type}')
+            """
+        )
+        op.execute(
+            f"""
+            CREATE TRIGGER trg_{table}_identity_delete
+            AFTER DELETE ON {table}
+            REFERENCING OLD TABLE AS old_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION notify_telegram_identity_invalidation('{entity_type}')
+            """
+        )
+        op.execute(
+            f"""
+            CREATE TRIGGER trg_{table}_identity_truncate
+            AFTER TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION notify_telegram_identity_truncate()
+            """
+        )
+
+
+def downgrade() -> None:
+    for table in IDENTITY_TABLES:
+        for event in ('truncate', 'delete', 'update', 'insert'):
+            op.execute(f'DROP TRIGGER IF EXISTS trg_{table}_identity_{event} ON {table}')
+    op.execute('DROP FUNCTION IF EXISTS notify_telegram_identity_truncate()')
+    op.execute('DROP FUNCTION IF EXISTS notify_telegram_identity_invalidation()')
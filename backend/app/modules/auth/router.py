@@ -5,6 +5,7 @@ from fastapi import APIRouter, Depends, status
 from app.core.dependencies import CurrentUserId, DBSession
 from app.modules.auth.schemas import (
     LoginRequest,
+    RefreshRequest,
     RegisterRequest,
     RegisterResponse,
     TokenResponse,
@@ -70,6 +71,81 @@ async def login(
     return await service.login(data)
 
 
+@router.post(
+    "/refresh",
+    response_model=TokenResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Обновление токена",
+    description=(
+        "Обменивает refresh token на новый access token и новый refresh token. "
+        "Предыдущий refresh token становится недействительным; его повторное "
+        "использование закрывает сессию"
+    ),
+)
+async def refresh(
+    data: RefreshRequest,
+    db: DBSession,
+) -> TokenResponse:
+    """Refresh access token.
+
+    Args:
+        data: Current refresh token.
+        db: Database session.
+
+    Returns:
+        TokenResponse: New access token and rotated refresh token.
+
+    Raises:
+        HTTPException 401: If refresh token is invalid, expired or reused.
+        HTTPException 403: If user account is blocked.
+        HTTPException 503: If the session store is unavailable.
+    """
+    service = AuthService(db)
+    return await service.refresh(data)
+
+
+@router.post(
+    "/logout",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Выход из системы",
+    description=(
+        "Закрывает сессию refresh token. Выданный access token действует до истечения срока"
+    ),
+)
+async def logout(
+    data: RefreshRequest,
+    db: DBSession,
+) -> None:
+    """Logout from one session.
+
+    Args:
+        data: Refresh token of the session.
+        db: Database session.
+    """
+    service = AuthService(db)
+    await service.logout(data)
+
+
+@router.post(
+    "/logout-all",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Выход на всех устройствах",
+    description="Закрывает все сессии текущего пользователя",
+)
+async def logout_all(
+    db: DBSession,
+    user_id: CurrentUserId,
+) -> None:
+    """Logout from all sessions of the current user.
+
+    Args:
+        db: Database session.
+        user_id: Current user ID from JWT token.
+    """
+    service = AuthService(db)
+    await service.logout_all(user_id)
+
+
 @router.get(
     "/me",
     response_model=UserResponse,
@@ -45,6 +45,16 @@ class LoginRequest(BaseModel):
     )
 
 
+class RefreshRequest(BaseModel):
+    """Schema for refresh token request."""
+
+    refresh_token: str = Field(
+        ...,
+        max_length=200,
+        description="Refresh token, полученный при входе или предыдущем обновлении"
+    )
+
+
 class TokenResponse(BaseModel):
     """Schema for authentication token response."""
 
@@ -56,6 +66,10 @@ class TokenResponse(BaseModel):
         default="bearer",
         description="Тип токена"
     )
+    refresh_token: str | None = Field(
+        None,
+        description="Одноразовый refresh token (null, если хранилище сессий недоступно)"
+    )
 
 
 class UserResponse(BaseModel):
@@ -111,3 +125,7 @@ class RegisterResponse(BaseModel):
         default="bearer",
         description="Тип токена"
     )
+    refresh_token: str | None = Field(
+        None,
+        description="Одноразовый refresh token (null, если хранилище сессий недоступно)"
+    )
@@ -1,16 +1,24 @@
 """Authentication service with business logic."""
 
+import logging
 import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 
 from fastapi import HTTPException, status
+from redis.exceptions import RedisError
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.core.security import create_access_token, get_password_hash, verify_password
+from app.core.database import AsyncSessionLocal
+from app.core.local_cache import KeyedCache
+from app.core.security import create_access_token, password_hasher, password_needs_rehash
+from app.modules.auth import sessions
 from app.modules.auth.schemas import (
     LoginRequest,
+    RefreshRequest,
     RegisterRequest,
     RegisterResponse,
     TokenResponse,
@@ -19,6 +27,38 @@ from app.modules.auth.schemas import (
 from app.shared.enums import UserRole
 from app.shared.models import User
 
+logger = logging.getLogger(__name__)
+
+# Must match the payload prefix of the notify_user_invalidation() trigger
+USER_CACHE_PREFIX = "auth_user"
+
+# Users by ID as returned by /me; every UPDATE or DELETE of a users row
+# (blocking, role change, password rehash) drops its entry in all workers
+user_cache: KeyedCache[UserResponse | None] = KeyedCache(
+    USER_CACHE_PREFIX,
+    max_entries=settings.auth_user_cache_max_entries,
+    ttl=settings.auth_user_cache_ttl_seconds,
+    enabled=settings.auth_user_cache_enabled,
+)
+
+
+@contextmanager
+def _session_store() -> Iterator[None]:
+    """Turn refresh session store failures into 503 responses.
+
+    Raises:
+        HTTPException: 503 if Redis is unavailable.
+    """
+    try:
+        yield
+    except RedisError as exc:
+        logger.warning("Refresh session store unavailable: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Service is overloaded, retry later",
+            headers={"Retry-After": str(settings.db_admission_retry_after_seconds)},
+        ) from exc
+
 
 class AuthService:
     """Authentication service for user registration and login."""
@@ -38,7 +78,7 @@ class AuthService:
             data: Registration data.
 
         Returns:
-            RegisterResponse: Registered user data with access token.
+            RegisterResponse: Registered user data with access and refresh tokens.
 
         Raises:
             HTTPException: If user with this email already exists.
@@ -56,7 +96,7 @@ class AuthService:
             )
 
         # Create new user
-        hashed_password = get_password_hash(data.password)
+        hashed_password = await password_hasher.hash(data.password)
         new_user = User(
             id=uuid.uuid4(),
             email=data.email,
@@ -66,8 +106,7 @@ class AuthService:
         )
 
         self.db.add(new_user)
-        await self.db.commit()
-        await self.db.refresh(new_user)
+        await self.db.flush()
 
         # Generate access token
         access_token = create_access_token(
@@ -77,17 +116,18 @@ class AuthService:
         return RegisterResponse(
             user=UserResponse.model_validate(new_user),
             access_token=access_token,
-            token_type="bearer"
+            token_type="bearer",
+            refresh_token=await self._open_session(new_user.id),
         )
 
     async def login(self, data: LoginRequest) -> TokenResponse:
-        """Authenticate user and return access token.
+        """Authenticate user and return access and refresh tokens.
 
         Args:
             data: Login credentials.
 
         Returns:
-            TokenResponse: Access token.
+            TokenResponse: Access token and refresh token.
 
         Raises:
             HTTPException: If credentials are invalid or user is inactive.
@@ -99,7 +139,7 @@ class AuthService:
         user = result.scalar_one_or_none()
 
         # Verify user exists and password is correct
-        if not user or not verify_password(data.password, user.password_hash):
+        if not user or not await password_hasher.verify(data.password, user.password_hash):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Неверный email или пароль",
@@ -113,6 +153,10 @@ class AuthService:
                 detail="Аккаунт заблокирован"
             )
 
+        # Upgrade the hash while the plain password is at hand
+        if password_needs_rehash(user.password_hash):
+            user.password_hash = await password_hasher.hash(data.password)
+
         # Generate access token
         access_token = create_access_token(
             data={"sub": str(user.id), "role": user.role.value}
@@ -120,11 +164,100 @@ class AuthService:
 
         return TokenResponse(
             access_token=access_token,
-            token_type="bearer"
+            token_type="bearer",
+            refresh_token=await self._open_session(user.id),
         )
 
+    @staticmethod
+    async def _open_session(user_id: uuid.UUID) -> str | None:
+        """Open a refresh token session; without Redis only the access token is issued."""
+        try:
+            return await sessions.create_session(user_id)
+        except RedisError as exc:
+            logger.warning("Refresh session not created for user %s: %s", user_id, exc)
+            return None
+
+    async def refresh(self, data: RefreshRequest) -> TokenResponse:
+        """Exchange a refresh token for a new access and refresh token.
+
+        Costs one Redis script call and, normally, an in-process user cache
+        hit; the password is not checked again.
+
+        Args:
+            data: Current refresh token.
+
+        Returns:
+            TokenResponse: New access token and rotated refresh token.
+
+        Raises:
+            HTTPException: If the token is invalid, expired or reused, the
+                user is blocked, or the session store is unavailable.
+        """
+        with _session_store():
+            rotated = await sessions.rotate_session(data.refresh_token)
+        if rotated is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Недействительный refresh token",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        user_id, refresh_token = rotated
+
+        try:
+            user = await self.get_current_user(str(user_id))
+        except HTTPException:
+            with _session_store():
+                await sessions.revoke_session(refresh_token)
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Недействительный refresh token",
+                headers={"WWW-Authenticate": "Bearer"},
+            ) from None
+        if not user.is_active:
+            with _session_store():
+                await sessions.revoke_user_sessions(user_id)
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Аккаунт заблокирован"
+            )
+
+        access_token = create_access_token(
+            data={"sub": str(user.id), "role": user.role.value}
+        )
+        return TokenResponse(
+            access_token=access_token,
+            token_type="bearer",
+            refresh_token=refresh_token,
+        )
+
+    async def logout(self, data: RefreshRequest) -> None:
+        """Close the session of a refresh token.
+
+        Issued access tokens stay valid until they expire.
+
+        Args:
+            data: Refresh token of the session.
+
+        Raises:
+            HTTPException: If the session store is unavailable.
+        """
+        with _session_store():
+            await sessions.revoke_session(data.refresh_token)
+
+    async def logout_all(self, user_id: str) -> None:
+        """Close all sessions of a user.
+
+        Args:
+            user_id: User UUID.
+
+        Raises:
+            HTTPException: If the session store is unavailable.
+        """
+        with _session_store():
+            await sessions.revoke_user_sessions(uuid.UUID(user_id))
+
     async def get_current_user(self, user_id: str) -> UserResponse:
-        """Get current user by ID.
+        """Get current user by ID, served from the in-process user cache when possible.
 
         Args:
             user_id: User UUID.
@@ -135,10 +268,16 @@ class AuthService:
         Raises:
             HTTPException: If user not found.
         """
-        result = await self.db.execute(
-            select(User).where(User.id == uuid.UUID(user_id))
-        )
-        user = result.scalar_one_or_none()
+        user_uuid = uuid.UUID(user_id)
+
+        async def load() -> UserResponse | None:
+            # Shared by concurrent callers, so it cannot use the request session
+            async with AsyncSessionLocal() as session:
+                result = await session.execute(select(User).where(User.id == user_uuid))
+                user = result.scalar_one_or_none()
+                return UserResponse.model_validate(user) if user is not None else None
+
+        user = await user_cache.get_or_load(str(user_uuid), load)
 
         if not user:
             raise HTTPException(
@@ -146,4 +285,4 @@ class AuthService:
                 detail="Пользователь не найден"
             )
 
-        return UserResponse.model_validate(user)
+        return user
@@ -0,0 +1,189 @@
+"""Refresh token sessions stored in Redis.
+
+A login opens a session and returns a refresh token
+``<user_id>.<session_id>.<secret>``. Redis keeps only the SHA-256 of the
+current secret, under a key that expires ``REFRESH_TOKEN_EXPIRE_DAYS``
+after the last renewal. Every renewal rotates the secret in one atomic
+script. Presenting an already rotated secret means the token was copied,
+so the whole session is revoked and both the attacker and the victim have
+to log in again. Session IDs of a user are indexed in a set, so all
+sessions can be revoked at once; the set lives as long as the latest
+renewed session. All keys of a user share the ``{<user_id>}`` hash tag,
+so scripts and pipelines stay within one Redis Cluster slot.
+"""
+
+import hashlib
+import logging
+import secrets
+import uuid
+
+from app.core.cache import get_redis
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+SESSION_PREFIX = "auth:session:"
+USER_SESSIONS_PREFIX = "auth:user_sessions:"
+
+# Compare-and-rotate of the session secret, keeping the user index in step.
+# KEYS: session, user index. ARGV: old secret hash, new secret hash, TTL,
+# session ID. Returns 0 if the session is gone, -1 on reuse (session
+# deleted), 1 once rotated.
+ROTATE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    redis.call('SREM', KEYS[2], ARGV[4])
+    return 0
+end
+if redis.call('HGET', KEYS[1], 'secret_hash') ~= ARGV[1] then
+    redis.call('DEL', KEYS[1])
+    redis.call('SREM', KEYS[2], ARGV[4])
+    return -1
+end
+redis.call('HSET', KEYS[1], 'secret_hash', ARGV[2])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+redis.call('SADD', KEYS[2], ARGV[4])
+redis.call('EXPIRE', KEYS[2], ARGV[3])
+return 1
+"""
+
+
+def _ttl_seconds() -> int:
+    """Get the lifetime of a session since its last renewal."""
+    return settings.refresh_token_expire_days * 24 * 60 * 60
+
+
+def _hash_secret(secret: str) -> str:
+    """Hash a token secret for storage."""
+    return hashlib.sha256(secret.encode("utf-8")).hexdigest()
+
+
+def _session_key(user_id: uuid.UUID, session_id: str) -> str:
+    """Get the key of a session."""
+    return f"{SESSION_PREFIX}{{{user_id}}}:{session_id}"
+
+
+def _user_key(user_id: uuid.UUID) -> str:
+    """Get the key of the session index of a user."""
+    return f"{USER_SESSIONS_PREFIX}{{{user_id}}}"
+
+
+def _parse(refresh_token: str) -> tuple[uuid.UUID, str, str] | None:
+    """Split a refresh token into user UUID, session ID and secret."""
+    user_part, _, rest = refresh_token.partition(".")
+    session_id, _, secret = rest.partition(".")
+    if not session_id or not secret:
+        return None
+    try:
+        return uuid.UUID(hex=user_part), session_id, secret
+    except ValueError:
+        return None
+
+
+async def create_session(user_id: uuid.UUID) -> str:
+    """Open a session for a user.
+
+    Args:
+        user_id: User UUID.
+
+    Returns:
+        str: Refresh token.
+
+    Raises:
+        RedisError: If Redis is unavailable.
+    """
+    session_id = uuid.uuid4().hex
+    secret = secrets.token_urlsafe(32)
+    ttl = _ttl_seconds()
+    session_key = _session_key(user_id, session_id)
+    user_key = _user_key(user_id)
+    async with get_redis().pipeline(transaction=True) as pipe:
+        pipe.hset(
+            session_key,
+            mapping={"user_id": str(user_id), "secret_hash": _hash_secret(secret)},
+        )
+        pipe.expire(session_key, ttl)
+        pipe.sadd(user_key, session_id)
+        pipe.expire(user_key, ttl)
+        await pipe.execute()
+    return f"{user_id.hex}.{session_id}.{secret}"
+
+
+async def rotate_session(refresh_token: str) -> tuple[uuid.UUID, str] | None:
+    """Exchange a refresh token for a new one.
+
+    Args:
+        refresh_token: Current refresh token.
+
+    Returns:
+        tuple[uuid.UUID, str] | None: User UUID and the new refresh token, or
+        None if the token is unknown, expired or reused.
+
+    Raises:
+        RedisError: If Redis is unavailable.
+    """
+    parsed = _parse(refresh_token)
+    if parsed is None:
+        return None
+    user_id, session_id, secret = parsed
+    new_secret = secrets.token_urlsafe(32)
+    status = await get_redis().eval(
+        ROTATE_SCRIPT,
+        2,
+        _session_key(user_id, session_id),
+        _user_key(user_id),
+        _hash_secret(secret),
+        _hash_secret(new_secret),
+        _ttl_seconds(),
+        session_id,
+    )
+    if status == -1:
+        logger.warning("Refresh token reuse detected for user %s, session revoked", user_id)
+    if status != 1:
+        return None
+    return user_id, f"{user_id.hex}.{session_id}.{new_secret}"
+
+
+async def revoke_session(refresh_token: str) -> None:
+    """Close the session of a refresh token, if it exists.
+
+    Args:
+        refresh_token: Refresh token.
+
+    Raises:
+        RedisError: If Redis is unavailable.
+    """
+    parsed = _parse(refresh_token)
+    if parsed is None:
+        return
+    user_id, session_id, _ = parsed
+    async with get_redis().pipeline(transaction=True) as pipe:
+        pipe.delete(_session_key(user_id, session_id))
+        pipe.srem(_user_key(user_id), session_id)
+        await pipe.execute()
+
+
+async def revoke_user_sessions(user_id: uuid.UUID) -> int:
+    """Close all sessions of a user.
+
+    IDs of sessions that already expired are dropped from the index too.
+
+    Args:
+        user_id: User UUID.
+
+    Returns:
+        int: Number of sessions closed.
+
+    Raises:
+        RedisError: If Redis is unavailable.
+    """
+    redis = get_redis()
+    user_key = _user_key(user_id)
+    session_ids = await redis.smembers(user_key)
+    if not session_ids:
+        return 0
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.delete(*(_session_key(user_id, session_id.decode()) for session_id in session_ids))
+        # Sessions opened meanwhile stay indexed
+        pipe.srem(user_key, *session_ids)
+        revoked, _ = await pipe.execute()
+    return revoked
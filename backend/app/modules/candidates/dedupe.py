@@ -0,0 +1,224 @@
+"""Candidate deduplication with blocking keys.
+
+Comparing every candidate with every other one is O(n²). Instead each
+candidate gets a few blocking keys, and only candidates sharing a key are
+compared:
+
+* ``phone`` - last 10 digits of the phone, so ``+7 (999) 123-45-67`` and
+  ``89991234567`` collide;
+* ``name`` - lower-cased name tokens in sorted order (``ё`` folded to
+  ``е``), so word order does not matter;
+* ``name_prefix_university`` - the first letters of every name token plus
+  the normalized university, a coarse bucket that catches misspellings.
+
+Keys are computed and grouped by Postgres in one pass over ``candidates``;
+blocks larger than ``DEDUPE_MAX_BLOCK_SIZE`` (very common names) are not
+informative and are skipped, so the number of compared pairs grows with
+the number of actual duplicates rather than with the table. Pairs are
+scored in SQL (phone match, trigram name similarity, university match),
+and pairs above ``DEDUPE_MIN_SCORE`` are joined into clusters.
+
+CLI usage::
+
+    python -m app.modules.candidates.dedupe --limit 50
+"""
+
+import argparse
+import asyncio
+import uuid
+from collections import defaultdict
+from collections.abc import Sequence
+
+from sqlalchemy import Row, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.modules.candidates.models import Candidate
+from app.modules.candidates.schemas import (
+    DuplicateCandidate,
+    DuplicateCluster,
+    DuplicatePair,
+    DuplicateReport,
+)
+
+# Letters of every name token used in the misspelling bucket
+NAME_PREFIX_LENGTH = 4
+
+# Score weights; a shared phone alone or an equal name alone is not enough
+PHONE_WEIGHT = 0.4
+NAME_WEIGHT = 0.45
+UNIVERSITY_WEIGHT = 0.15
+
+DUPLICATE_PAIRS_SQL = text(
+    r"""
+    WITH normalized AS MATERIALIZED (
+        SELECT
+            id,
+            right(regexp_replace(phone, '\D', '', 'g'), 10) AS phone_key,
+            ARRAY(
+                SELECT token
+                FROM unnest(
+                    regexp_split_to_array(lower(translate(btrim(full_name), 'Ёё', 'Ее')), '\s+')
+                ) AS token
+                ORDER BY token
+            ) AS name_tokens,
+            nullif(lower(regexp_replace(university, '[\W_]+', '', 'g')), '') AS university_key
+        FROM candidates
+    ),
+    keys AS (
+        SELECT id, 'phone' AS kind, phone_key AS key
+        FROM normalized
+        WHERE length(phone_key) = 10
+        UNION ALL
+        SELECT id, 'name', array_to_string(name_tokens, ' ')
+        FROM normalized
+        UNION ALL
+        SELECT
+            id,
+            'name_prefix_university',
+            array_to_string(
+                ARRAY(SELECT left(token, :prefix_length) FROM unnest(name_tokens) AS token ORDER BY 1),
+                ' '
+            ) || '|' || university_key
+        FROM normalized
+        WHERE university_key IS NOT NULL
+    ),
+    blocks AS (
+        SELECT array_agg(id) AS ids
+        FROM keys
+        GROUP BY kind, key
+        HAVING count(*) BETWEEN 2 AND :max_block_size
+    ),
+    pairs AS (
+        SELECT DISTINCT left_id, right_id
+        FROM blocks, unnest(ids) AS left_id, unnest(ids) AS right_id
+        WHERE left_id < right_id
+    ),
+    scored AS (
+        SELECT
+            pairs.left_id,
+            pairs.right_id,
+            coalesce(l.phone_key = r.phone_key AND length(l.phone_key) = 10, false) AS phone_match,
+            similarity(array_to_string(l.name_tokens, ' '), array_to_string(r.name_tokens, ' '))
+                AS name_similarity,
+            coalesce(l.university_key = r.university_key, false) AS university_match
+        FROM pairs
+        JOIN normalized AS l ON l.id = pairs.left_id
+        JOIN normalized AS r ON r.id = pairs.right_id
+    )
+    SELECT *
+    FROM (
+        SELECT
+            scored.*,
+            CAST(:phone_weight AS float8) * phone_match::int
+                + CAST(:name_weight AS float8) * name_similarity
+                + CAST(:university_weight AS float8) * university_match::int AS score
+        FROM scored
+    ) AS pair_scores
+    WHERE score >= CAST(:min_score AS float8)
+    """
+)
+
+
+def _cluster(pairs: Sequence[DuplicatePair]) -> list[list[DuplicatePair]]:
+    """Group pairs into connected components (union-find)."""
+    parent: dict[uuid.UUID, uuid.UUID] = {}
+
+    def find(node: uuid.UUID) -> uuid.UUID:
+        parent.setdefault(node, node)
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    for pair in pairs:
+        parent[find(pair.left_id)] = find(pair.right_id)
+
+    components: defaultdict[uuid.UUID, list[DuplicatePair]] = defaultdict(list)
+    for pair in pairs:
+        components[find(pair.left_id)].append(pair)
+    return list(components.values())
+
+
+async def find_duplicates(db: AsyncSession, limit: int = 100) -> DuplicateReport:
+    """Find clusters of likely duplicate candidates.
+
+    Args:
+        db: Database session.
+        limit: Maximum number of clusters to return, best first.
+
+    Returns:
+        DuplicateReport: Total cluster count and the best clusters.
+    """
+    result = await db.execute(
+        DUPLICATE_PAIRS_SQL,
+        {
+            "prefix_length": NAME_PREFIX_LENGTH,
+            "max_block_size": settings.dedupe_max_block_size,
+            "phone_weight": PHONE_WEIGHT,
+            "name_weight": NAME_WEIGHT,
+            "university_weight": UNIVERSITY_WEIGHT,
+            "min_score": settings.dedupe_min_score,
+        },
+    )
+    pairs = [DuplicatePair.model_validate(row, from_attributes=True) for row in result]
+    components = sorted(
+        _cluster(pairs), key=lambda component: max(pair.score for pair in component), reverse=True
+    )
+
+    selected = components[:limit]
+    member_ids = {
+        candidate_id
+        for component in selected
+        for pair in component
+        for candidate_id in (pair.left_id, pair.right_id)
+    }
+    members: dict[uuid.UUID, Row] = {}
+    if member_ids:
+        rows = await db.execute(
+            select(*(getattr(Candidate, name) for name in DuplicateCandidate.model_fields))
+            .where(Candidate.id.in_(member_ids))
+        )
+        members = {row.id: row for row in rows}
+
+    clusters = []
+    for component in selected:
+        ids = {candidate_id for pair in component for candidate_id in (pair.left_id, pair.right_id)}
+        cluster_rows = sorted(
+            (members[candidate_id] for candidate_id in ids if candidate_id in members),
+            key=lambda row: row.created_at,
+        )
+        if len(cluster_rows) < 2:
+            # Merged or deleted since the pairs were computed
+            continue
+        clusters.append(
+            DuplicateCluster(
+                score=max(pair.score for pair in component),
+                candidates=[
+                    DuplicateCandidate.model_validate(row, from_attributes=True) for row in cluster_rows
+                ],
+                pairs=sorted(component, key=lambda pair: pair.score, reverse=True),
+            )
+        )
+    return DuplicateReport(total_clusters=len(components), clusters=clusters)
+
+
+async def _run_cli(limit: int) -> DuplicateReport:
+    """Build a report in a read-only transaction."""
+    from app.core.database import AsyncSessionLocal, statement_timeouts
+
+    with statement_timeouts(statement_ms=settings.db_bulk_statement_timeout_ms):
+        async with AsyncSessionLocal() as session:
+            return await find_duplicates(session, limit=limit)
+
+
+def main() -> None:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Report likely duplicate candidates")
+    parser.add_argument("--limit", type=int, default=100, help="Clusters to report")
+    args = parser.parse_args()
+    print(asyncio.run(_run_cli(args.limit)).model_dump_json(indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+"""Bulk candidate import through PostgreSQL COPY.
+
+Rows are read, parsed and validated in batches in a worker thread, so the
+event loop only runs the database I/O: valid rows are streamed batch by
+batch into a temporary staging table with asyncpg ``copy_records_to_table``
+and finally merged into ``candidates`` with a single
+``INSERT ... SELECT ... ON CONFLICT (telegram_id)``.
+
+CLI usage::
+
+    python -m app.modules.candidates.importer candidates.csv
+    python -m app.modules.candidates.importer candidates.ndjson --skip-existing
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import sys
+import uuid
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+from pydantic import ValidationError
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.modules.candidates.schemas import (
+    CandidateCreate,
+    CandidateImportReject,
+    CandidateImportReport,
+)
+from app.modules.telegram.identity import invalidate_identities
+from app.shared.enums import ImportFormat, TelegramEntityType
+
+# Valid rows sent to the staging table per COPY call
+IMPORT_BATCH_SIZE = 5000
+
+# Rejects kept in the report; the counter is always exact
+MAX_REPORTED_REJECTS = 1000
+
+STAGING_TABLE = "candidates_import"
+
+IMPORT_COLUMNS = [
+    "id",
+    "telegram_id",
+    "full_name",
+    "phone",
+    "location",
+    "preferred_tracks",
+    "university",
+    "course",
+    "achievements",
+    "domains",
+]
+
+LIST_FIELDS = ("preferred_tracks", "achievements", "domains")
+
+# Columns refreshed from the file when a telegram_id already exists
+UPDATED_COLUMNS = [column for column in IMPORT_COLUMNS if column not in ("id", "telegram_id")]
+
+
+def _parse_list_cell(value: str) -> Any:
+    """Parse a CSV list cell: a JSON array or a ';'-separated list."""
+    value = value.strip()
+    if not value:
+        return []
+    if value.startswith("["):
+        return json.loads(value)
+    return [item.strip() for item in value.split(";") if item.strip()]
+
+
+def iter_raw_rows(
+    lines: Iterable[str], import_format: ImportFormat
+) -> Iterator[tuple[int, dict[str, Any] | None, str | None]]:
+    """Yield ``(line, row, parse_error)`` tuples from CSV or NDJSON input.
+
+    Args:
+        lines: Text lines of the input file.
+        import_format: CSV (header row required) or NDJSON.
+
+    Yields:
+        tuple: Line number, parsed row (or None) and parse error (or None).
+    """
+    if import_format == ImportFormat.CSV:
+        reader = csv.DictReader(lines)
+        for row in reader:
+            try:
+                parsed: dict[str, Any] = {
+                    key: value for key, value in row.items() if key and value not in (None, "")
+                }
+                for field in LIST_FIELDS:
+                    if field in parsed:
+                        parsed[field] = _parse_list_cell(parsed[field])
+                yield reader.line_num, parsed, None
+            except ValueError as exc:
+                yield reader.line_num, None, f"Invalid list value: {exc}"
+        return
+
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            parsed = json.loads(line)
+        except ValueError as exc:
+            yield line_number, None, f"Invalid JSON: {exc}"
+            continue
+        if not isinstance(parsed, dict):
+            yield line_number, None, "Expected a JSON object"
+            continue
+        yield line_number, parsed, None
+
+
+def _to_record(candidate: CandidateCreate) -> tuple[Any, ...]:
+    """Convert a validated candidate into a COPY record ordered as IMPORT_COLUMNS."""
+    return (
+        uuid.uuid4(),
+        candidate.telegram_id,
+        candidate.full_name,
+        candidate.phone,
+        candidate.location,
+        json.dumps(candidate.preferred_tracks),
+        candidate.university,
+        candidate.course,
+        json.dumps(candidate.achievements, ensure_ascii=False),
+        json.dumps(candidate.domains, ensure_ascii=False),
+    )
+
+
+class CandidateImporter:
+    """Validate candidate rows and load them through COPY + merge."""
+
+    def __init__(self, db: AsyncSession, update_existing: bool = True):
+        """Initialize importer.
+
+        Args:
+            db: Database session; the import runs in its transaction.
+            update_existing: Overwrite candidates whose telegram_id exists,
+                otherwise keep them untouched.
+        """
+        self.db = db
+        self.update_existing = update_existing
+        self.total_rows = 0
+        self.rejected = 0
+        self.rejects: list[CandidateImportReject] = []
+        self._seen_telegram_ids: set[int] = set()
+
+    def _reject(self, line: int, error: str, telegram_id: Any = None) -> None:
+        """Record a rejected row."""
+        self.rejected += 1
+        if len(self.rejects) >= MAX_REPORTED_REJECTS:
+            return
+        try:
+            telegram_id = int(telegram_id) if telegram_id is not None else None
+        except (TypeError, ValueError):
+            telegram_id = None
+        self.rejects.append(
+            CandidateImportReject(line=line, telegram_id=telegram_id, error=error)
+        )
+
+    def _validate(
+        self, rows: Iterable[tuple[int, dict[str, Any] | None, str | None]]
+    ) -> Iterator[tuple[Any, ...]]:
+        """Validate parsed rows, yielding COPY records for valid ones."""
+        for line, row, parse_error in rows:
+            self.total_rows += 1
+            if row is None:
+                self._reject(line, parse_error or "Unreadable row")
+                continue
+            try:
+                candidate = CandidateCreate.model_validate(row)
+            except ValidationError as exc:
+                error = "; ".join(
+                    f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}"
+                    for err in exc.errors()
+                )
+                self._reject(line, error, row.get("telegram_id"))
+                continue
+            if candidate.telegram_id in self._seen_telegram_ids:
+                self._reject(line, "Duplicate telegram_id in file", candidate.telegram_id)
+                continue
+            self._seen_telegram_ids.add(candidate.telegram_id)
+            yield _to_record(candidate)
+
+    async def _create_staging_table(self) -> None:
+        """Create a temporary staging table with the candidate column types."""
+        await self.db.execute(
+            text(
+                f"CREATE TEMP TABLE {STAGING_TABLE} ON COMMIT DROP AS "
+                f"SELECT {', '.join(IMPORT_COLUMNS)} FROM candidates WITH NO DATA"
+            )
+        )
+
+    async def _merge(self) -> tuple[int, int]:
+        """Merge the staging table into candidates.
+
+        Returns:
+            tuple[int, int]: Inserted and updated row counts.
+        """
+        columns = ", ".join(IMPORT_COLUMNS)
+        if self.update_existing:
+            assignments = ", ".join(f"{column} = EXCLUDED.{column}" for column in UPDATED_COLUMNS)
+            conflict = f"DO UPDATE SET {assignments}, updated_at = now()"
+        else:
+            conflict = "DO NOTHING"
+        result = await self.db.execute(
+            text(
+                f"WITH merged AS ("
+                f"INSERT INTO candidates ({columns}) "
+                f"SELECT {columns} FROM {STAGING_TABLE} "
+                f"ON CONFLICT (telegram_id) {conflict} "
+                f"RETURNING (xmax = 0) AS inserted"
+                f") SELECT count(*) FILTER (WHERE inserted), count(*) FILTER (WHERE NOT inserted) "
+                f"FROM merged"
+            )
+        )
+        inserted, updated = result.one()
+        return inserted, updated
+
+    async def run(
+        self, rows: Iterable[tuple[int, dict[str, Any] | None, str | None]]
+    ) -> CandidateImportReport:
+        """Validate, COPY and merge candidate rows.
+
+        Args:
+            rows: Output of :func:`iter_raw_rows`.
+
+        Returns:
+            CandidateImportReport: Import counters and per-row rejects.
+        """
+        await self._create_staging_table()
+        connection = await self.db.connection()
+        raw_connection = await connection.get_raw_connection()
+        asyncpg_connection = raw_connection.driver_connection
+
+        # Reading and validation are CPU-bound and the upload file blocks,
+        # so each batch is produced in a worker thread
+        records = self._validate(rows)
+        loaded = 0
+        while batch := await run_in_threadpool(list, islice(records, IMPORT_BATCH_SIZE)):
+            await asyncpg_connection.copy_records_to_table(
+                STAGING_TABLE, records=batch, columns=IMPORT_COLUMNS
+            )
+            loaded += len(batch)
+
+        inserted, updated = await self._merge()
+        if inserted or updated:
+            # Bulk change: drop every cached bot user resolution
+            invalidate_identities(self.db, TelegramEntityType.CANDIDATE)
+        return CandidateImportReport(
+            total_rows=self.total_rows,
+            inserted=inserted,
+            updated=updated,
+            skipped=loaded - inserted - updated,
+            rejected=self.rejected,
+            rejects=self.rejects,
+        )
+
+
+async def _run_cli(
+    path: Path, import_format: ImportFormat, update_existing: bool
+) -> CandidateImportReport:
+    """Import a file in its own transaction."""
+    from app.core.config import settings
+    from app.core.database import AsyncSessionLocal, statement_timeouts
+
+    with statement_timeouts(statement_ms=settings.db_bulk_statement_timeout_ms):
+        async with AsyncSessionLocal() as session, session.begin():
+            with path.open(encoding="utf-8", newline="") as file:
+                importer = CandidateImporter(session, update_existing=update_existing)
+                return await importer.run(iter_raw_rows(file, import_format))
+
+
+def main() -> None:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Bulk import candidates from CSV or NDJSON")
+    parser.add_argument("path", type=Path, help="Input file (.csv or .ndjson)")
+    parser.add_argument(
+        "--format",
+        dest="import_format",
+        choices=[item.value for item in ImportFormat],
+        help="Input format (defaults to the file extension)",
+    )
+    parser.add_argument(
+        "--skip-existing",
+        action="store_true",
+        help="Keep candidates whose telegram_id already exists instead of updating them",
+    )
+    args = parser.parse_args()
+
+    try:
+        import_format = ImportFormat(args.import_format or args.path.suffix.lstrip(".").lower())
+    except ValueError:
+        parser.error("cannot infer format from file extension, pass --format")
+    report = asyncio.run(_run_cli(args.path, import_format, not args.skip_existing))
+    print(report.model_dump_json(indent=2))
+    if report.rejected:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,11 @@
 """Candidates module database models."""
 
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import BigInteger, DateTime, Integer, String
-from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
+from sqlalchemy import BigInteger, Computed, DateTime, Index, Integer, String, func, text
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -13,6 +13,21 @@ from app.core.database import Base
 if TYPE_CHECKING:
     from app.modules.vacancies.models import CandidatePool
 
+# Text search configuration of the search vector and of search queries
+SEARCH_CONFIG = "russian"
+
+SEARCH_VECTOR_EXPRESSION = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', full_name), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(university, '')), 'B') || "
+    f"setweight(jsonb_to_tsvector('{SEARCH_CONFIG}', achievements, '[\"string\"]'), 'C')"
+)
+
+# Track choices indexed by position in preferred_tracks, used to prioritize candidates
+TRACK_PRIORITY_LEVELS = 3
+
+# Phone without formatting; typeahead queries must use the same expression as the index
+PHONE_DIGITS_SQL = "regexp_replace(phone, '\\D', '', 'g')"
+
 
 class Candidate(Base):
     """Candidate profile model."""
@@ -87,17 +102,24 @@ class Candidate(Base):
         comment="Области интересов/доменов (ML, Web, Mobile, etc.)"
     )
 
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+        deferred=True,
+        comment="Полнотекстовый индекс: имя (A), университет (B), достижения (C)"
+    )
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
         comment="Когда профиль был создан"
     )
 
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
         comment="Когда профиль последний раз обновлялся"
     )
@@ -109,6 +131,48 @@ class Candidate(Base):
         cascade="all, delete-orphan",
     )
 
+    # Constraints and Indexes
+    __table_args__ = (
+        Index("idx_candidates_created_at_id", "created_at", "id"),
+        Index("idx_candidates_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "idx_candidates_domains",
+            "domains",
+            postgresql_using="gin",
+            postgresql_ops={"domains": "jsonb_path_ops"},
+        ),
+        Index(
+            "idx_candidates_preferred_tracks",
+            "preferred_tracks",
+            postgresql_using="gin",
+            postgresql_ops={"preferred_tracks": "jsonb_path_ops"},
+        ),
+        # Serves case-insensitive prefix filters: lower(location) LIKE 'москва%'
+        Index("idx_candidates_location_lower", text("lower(location) text_pattern_ops")),
+        Index("idx_candidates_university_lower", text("lower(university) text_pattern_ops")),
+        # Candidates by the track they ranked N-th, served to vacancies of that track first
+        *(
+            Index(
+                f"idx_candidates_track_priority_{level}",
+                text(f"(preferred_tracks -> {level})"),
+                "course",
+            )
+            for level in range(TRACK_PRIORITY_LEVELS)
+        ),
+        # Trigram indexes serving fuzzy typeahead by name and phone fragment
+        Index(
+            "idx_candidates_full_name_trgm",
+            "full_name",
+            postgresql_using="gin",
+            postgresql_ops={"full_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_candidates_phone_digits_trgm",
+            text(f"{PHONE_DIGITS_SQL} gin_trgm_ops"),
+            postgresql_using="gin",
+        ),
+    )
+
     def __repr__(self) -> str:
         """String representation of Candidate.
 
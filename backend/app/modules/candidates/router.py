@@ -1,20 +1,50 @@
 """Candidates module API routes."""
 
+import io
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.cache import cache_key, get_or_compute, tag
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, db_timeouts, get_db, statement_timeouts
+from app.modules.candidates.dedupe import find_duplicates
+from app.modules.candidates.importer import CandidateImporter, iter_raw_rows
 from app.modules.candidates.schemas import (
     CandidateCreate,
+    CandidateImportReport,
+    CandidateMergeRequest,
     CandidateResponse,
+    CandidateTypeaheadResponse,
     CandidateUpdate,
+    DuplicateReport,
 )
 from app.modules.candidates.service import CandidateService
+from app.shared.conditional import check_not_modified, has_preconditions, set_validators
+from app.shared.enums import ExportFormat, ImportFormat
+from app.shared.export import export_response
+from app.shared.pagination import NEXT_CURSOR_HEADER
+from app.shared.responses import orm_json_response
+from app.shared.typeahead import MAX_LIMIT, typeahead_response
 
 router = APIRouter()
 
+candidate_list_adapter = TypeAdapter(list[CandidateResponse])
+candidate_typeahead_adapter = TypeAdapter(list[CandidateTypeaheadResponse])
+
 
 @router.post(
     "/",
@@ -39,20 +69,209 @@ async def create_candidate(
     Raises:
         HTTPException: If telegram_id already exists.
     """
-    # Check if candidate with this telegram_id already exists
-    existing = await CandidateService.get_candidate_by_telegram_id(
-        db, candidate_data.telegram_id
-    )
-    if existing:
+    candidate = await CandidateService.create_candidate(db, candidate_data)
+    if not candidate:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Candidate with telegram_id {candidate_data.telegram_id} already exists",
         )
-
-    candidate = await CandidateService.create_candidate(db, candidate_data)
     return CandidateResponse.model_validate(candidate)
 
 
+@router.post(
+    "/import",
+    dependencies=[Depends(db_timeouts(statement_ms=settings.db_bulk_statement_timeout_ms))],
+    response_model=CandidateImportReport,
+    summary="Bulk import candidates",
+    description=(
+        "Import candidates from a CSV (with header row) or NDJSON file.\n\n"
+        "Rows are validated one by one and loaded with PostgreSQL COPY, then merged "
+        "by `telegram_id`. List fields in CSV are JSON arrays or `;`-separated values. "
+        "Invalid rows are reported and skipped; valid rows are still imported."
+    ),
+)
+async def import_candidates(
+    file: UploadFile = File(..., description="CSV или NDJSON файл"),
+    import_format: ImportFormat = Query(ImportFormat.CSV, alias="format", description="Input format"),
+    update_existing: bool = Query(True, description="Update candidates whose telegram_id already exists"),
+    db: AsyncSession = Depends(get_db),
+) -> CandidateImportReport:
+    """Bulk import candidates.
+
+    Args:
+        file: Uploaded CSV or NDJSON file.
+        import_format: Input format.
+        update_existing: Overwrite existing candidates instead of skipping them.
+        db: Database session.
+
+    Returns:
+        CandidateImportReport: Import counters and rejected rows.
+
+    Raises:
+        HTTPException: If the file is not valid UTF-8.
+    """
+    lines = io.TextIOWrapper(file.file, encoding="utf-8", newline="")
+    importer = CandidateImporter(db, update_existing=update_existing)
+    try:
+        return await importer.run(iter_raw_rows(lines, import_format))
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Import file must be UTF-8 encoded",
+        )
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export candidates",
+    description=(
+        "Stream all candidates (or candidates who listed a track) as CSV or NDJSON.\n\n"
+        "Rows are read through a server-side cursor and written as they arrive."
+    ),
+)
+async def export_candidates(
+    export_format: ExportFormat = Query(ExportFormat.CSV, alias="format", description="Export format"),
+    track_id: int | None = Query(None, description="Only candidates with this track in preferred_tracks"),
+) -> StreamingResponse:
+    """Export candidates.
+
+    Args:
+        export_format: CSV or NDJSON.
+        track_id: Optional preferred track filter.
+
+    Returns:
+        StreamingResponse: Streamed export file.
+    """
+    query = CandidateService.build_export_query(track_id=track_id)
+    return export_response(query, export_format, "candidates")
+
+
+@router.get(
+    "/search",
+    response_model=list[CandidateResponse],
+    summary="Search candidates",
+    description=(
+        "Full-text search over full name, university and achievements with profile filters.\n\n"
+        "`q` supports web search syntax: quoted phrases, `or`, `-word`. Matches are ordered "
+        "by relevance; without `q`, candidates are ordered by creation time. List filters "
+        "require all given values. Pass the `X-Next-Cursor` response header back as "
+        "`cursor` to get the next page."
+    ),
+)
+async def search_candidates(
+    q: str | None = Query(None, max_length=200, description="Search text"),
+    domains: list[str] | None = Query(None, description="Required domains"),
+    preferred_tracks: list[int] | None = Query(None, description="Required preferred track IDs"),
+    course: int | None = Query(None, ge=1, le=6, description="Course of study"),
+    location: str | None = Query(None, max_length=255, description="Location prefix, case-insensitive"),
+    limit: int = Query(50, ge=1, le=200, description="Page size"),
+    cursor: str | None = Query(None, description="Cursor from the X-Next-Cursor header"),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """Search candidates.
+
+    Args:
+        q: Search text.
+        domains: Required domains.
+        preferred_tracks: Required preferred tracks.
+        course: Course of study.
+        location: Location prefix.
+        limit: Maximum number of records to return.
+        cursor: Cursor of the previous page.
+        db: Database session.
+
+    Returns:
+        Response: Serialized list of candidates with the next page cursor header.
+    """
+    candidates, next_cursor = await CandidateService.search_candidates(
+        db,
+        query=q.strip() if q else None,
+        domains=domains,
+        preferred_tracks=preferred_tracks,
+        course=course,
+        location=location,
+        limit=limit,
+        cursor=cursor,
+    )
+    return orm_json_response(
+        candidate_list_adapter,
+        candidates,
+        headers={NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None,
+    )
+
+
+@router.get(
+    "/typeahead",
+    response_model=list[CandidateTypeaheadResponse],
+    summary="Candidate typeahead",
+    description=(
+        "Find candidates by a partial or misspelled name or by a phone fragment, "
+        "best matches first.\n\n"
+        "Queries of digits and phone punctuation are matched against phone numbers. "
+        "Queries shorter than 3 characters return an empty list; results are cached briefly."
+    ),
+)
+async def candidate_typeahead(
+    q: str = Query(..., max_length=100, description="Name or phone fragment"),
+    limit: int = Query(10, ge=1, le=MAX_LIMIT, description="Maximum number of matches"),
+) -> Response:
+    """Find candidates as the user types.
+
+    Args:
+        q: Name or phone fragment.
+        limit: Maximum number of matches.
+
+    Returns:
+        Response: Serialized matches.
+    """
+    return await typeahead_response(
+        "candidates:typeahead",
+        q,
+        limit,
+        candidate_typeahead_adapter,
+        CandidateService.typeahead,
+    )
+
+
+@router.get(
+    "/duplicates",
+    response_model=DuplicateReport,
+    summary="Find duplicate candidates",
+    description=(
+        "Report clusters of likely duplicate candidates, best first.\n\n"
+        "Candidates are compared only within blocks sharing a normalized phone, "
+        "a normalized name or a name prefix with the same university. The report is "
+        "cached for a few minutes and rebuilt after a merge. Resolve a cluster with "
+        "`POST /api/candidates/{candidate_id}/merge`."
+    ),
+)
+async def find_duplicate_candidates(
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of clusters"),
+) -> Response:
+    """Find duplicate candidates.
+
+    Args:
+        limit: Maximum number of clusters.
+
+    Returns:
+        Response: Serialized duplicate report.
+    """
+
+    async def compute() -> tuple[bytes, None]:
+        with statement_timeouts(statement_ms=settings.db_bulk_statement_timeout_ms):
+            async with AsyncSessionLocal() as session:
+                report = await find_duplicates(session, limit=limit)
+        return report.model_dump_json().encode("utf-8"), None
+
+    return await get_or_compute(
+        cache_key("candidates:duplicates", limit=limit),
+        [tag("candidate_duplicates")],
+        compute,
+        ttl=settings.dedupe_report_ttl_seconds,
+    )
+
+
 @router.get(
     "/{candidate_id}",
     response_model=CandidateResponse,
@@ -60,27 +279,38 @@ async def create_candidate(
     description="Get candidate profile by UUID.",
 )
 async def get_candidate(
+    request: Request,
+    response: Response,
     candidate_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
-) -> CandidateResponse:
+) -> CandidateResponse | Response:
     """Get candidate by ID.
 
     Args:
+        request: HTTP request with optional If-None-Match/If-Modified-Since.
+        response: Response used to return ETag and Last-Modified.
         candidate_id: Candidate UUID.
         db: Database session.
 
     Returns:
-        CandidateResponse: Candidate profile.
+        CandidateResponse | Response: Candidate profile, or 304 if unchanged.
 
     Raises:
         HTTPException: If candidate not found.
     """
+    if has_preconditions(request):
+        version = await CandidateService.get_candidate_version(db, candidate_id)
+        not_modified = check_not_modified(request, version)
+        if not_modified:
+            return not_modified
+
     candidate = await CandidateService.get_candidate_by_id(db, candidate_id)
     if not candidate:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Candidate with id {candidate_id} not found",
         )
+    set_validators(response, candidate)
     return CandidateResponse.model_validate(candidate)
 
 
@@ -91,27 +321,38 @@ async def get_candidate(
     description="Get candidate profile by Telegram user ID.",
 )
 async def get_candidate_by_telegram(
+    request: Request,
+    response: Response,
     telegram_id: int,
     db: AsyncSession = Depends(get_db),
-) -> CandidateResponse:
+) -> CandidateResponse | Response:
     """Get candidate by Telegram ID.
 
     Args:
+        request: HTTP request with optional If-None-Match/If-Modified-Since.
+        response: Response used to return ETag and Last-Modified.
         telegram_id: Telegram user ID.
         db: Database session.
 
     Returns:
-        CandidateResponse: Candidate profile.
+        CandidateResponse | Response: Candidate profile, or 304 if unchanged.
 
     Raises:
         HTTPException: If candidate not found.
     """
+    if has_preconditions(request):
+        version = await CandidateService.get_candidate_version_by_telegram_id(db, telegram_id)
+        not_modified = check_not_modified(request, version)
+        if not_modified:
+            return not_modified
+
     candidate = await CandidateService.get_candidate_by_telegram_id(db, telegram_id)
     if not candidate:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Candidate with telegram_id {telegram_id} not found",
         )
+    set_validators(response, candidate)
     return CandidateResponse.model_validate(candidate)
 
 
@@ -119,25 +360,36 @@ async def get_candidate_by_telegram(
     "/",
     response_model=list[CandidateResponse],
     summary="Get all candidates",
-    description="Get list of all candidates with pagination.",
+    description=(
+        "Get list of all candidates ordered by creation time.\n\n"
+        "Pass the `X-Next-Cursor` response header back as `cursor` to get the next page."
+    ),
 )
 async def get_all_candidates(
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0, description="Records to skip; not with cursor"),
+    limit: int = Query(100, ge=1, le=500, description="Page size"),
+    cursor: str | None = Query(None, description="Cursor from the X-Next-Cursor header"),
     db: AsyncSession = Depends(get_db),
-) -> list[CandidateResponse]:
+) -> Response:
     """Get all candidates.
 
     Args:
         skip: Number of records to skip.
         limit: Maximum number of records to return.
+        cursor: Cursor of the previous page.
         db: Database session.
 
     Returns:
-        list[CandidateResponse]: List of candidates.
+        Response: Serialized list of candidates with the next page cursor header.
     """
-    candidates = await CandidateService.get_all_candidates(db, skip=skip, limit=limit)
-    return [CandidateResponse.model_validate(c) for c in candidates]
+    candidates, next_cursor = await CandidateService.get_all_candidates(
+        db, skip=skip, limit=limit, cursor=cursor
+    )
+    return orm_json_response(
+        candidate_list_adapter,
+        candidates,
+        headers={NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None,
+    )
 
 
 @router.patch(
@@ -164,21 +416,59 @@ async def update_candidate(
     Raises:
         HTTPException: If candidate not found.
     """
-    candidate = await CandidateService.get_candidate_by_id(db, candidate_id)
-    if not candidate:
+    updated_candidate = await CandidateService.update_candidate(
+        db, candidate_id, update_data
+    )
+    if not updated_candidate:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Candidate with id {candidate_id} not found",
         )
+    return CandidateResponse.model_validate(updated_candidate)
 
-    updated_candidate = await CandidateService.update_candidate(
-        db, candidate, update_data
+
+@router.post(
+    "/{candidate_id}/merge",
+    response_model=CandidateResponse,
+    summary="Merge duplicate candidates",
+    description=(
+        "Merge duplicate profiles into this candidate and delete them.\n\n"
+        "Empty fields are filled from the duplicates, list fields are united and pool "
+        "entries move to this candidate unless it is already in that vacancy's pool."
+    ),
+)
+async def merge_candidates(
+    candidate_id: uuid.UUID,
+    merge_data: CandidateMergeRequest,
+    db: AsyncSession = Depends(get_db),
+) -> CandidateResponse:
+    """Merge duplicate candidates.
+
+    Args:
+        candidate_id: UUID of the candidate to keep.
+        merge_data: Duplicates to merge.
+        db: Database session.
+
+    Returns:
+        CandidateResponse: Merged candidate.
+
+    Raises:
+        HTTPException: If any of the candidates is not found.
+    """
+    candidate = await CandidateService.merge_candidates(
+        db, candidate_id, merge_data.duplicate_ids
     )
-    return CandidateResponse.model_validate(updated_candidate)
+    if not candidate:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Candidate or one of the duplicates not found",
+        )
+    return CandidateResponse.model_validate(candidate)
 
 
 @router.delete(
     "/{candidate_id}",
+    dependencies=[Depends(db_timeouts(statement_ms=settings.db_bulk_statement_timeout_ms))],
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete candidate",
     description="Delete candidate profile. All associated data will be deleted (CASCADE).",
@@ -196,15 +486,13 @@ async def delete_candidate(
     Raises:
         HTTPException: If candidate not found.
     """
-    candidate = await CandidateService.get_candidate_by_id(db, candidate_id)
-    if not candidate:
+    deleted = await CandidateService.delete_candidate(db, candidate_id)
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Candidate with id {candidate_id} not found",
         )
 
-    await CandidateService.delete_candidate(db, candidate)
-
 
 # =============================================================================
 # NOT IMPLEMENTED YET - Quiz endpoints
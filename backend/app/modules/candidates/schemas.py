@@ -120,3 +120,93 @@ class CandidateResponse(CandidateBase):
         """Pydantic config."""
 
         from_attributes = True
+
+
+class CandidateTypeaheadResponse(BaseModel):
+    """Schema for a candidate typeahead match."""
+
+    id: uuid.UUID = Field(..., description="UUID кандидата")
+    full_name: str = Field(..., description="Полное имя кандидата")
+    phone: str | None = Field(None, description="Номер телефона")
+    location: str | None = Field(None, description="Местоположение (город, страна)")
+    similarity: float = Field(..., description="Сходство с запросом (0-1)")
+
+    class Config:
+        """Pydantic config."""
+
+        from_attributes = True
+
+
+class CandidateMergeRequest(BaseModel):
+    """Schema for merging duplicate candidates into one profile."""
+
+    duplicate_ids: list[uuid.UUID] = Field(
+        ...,
+        min_length=1,
+        max_length=50,
+        description="UUID дубликатов, которые будут объединены с кандидатом и удалены"
+    )
+
+
+class DuplicateCandidate(BaseModel):
+    """Schema for a candidate in a duplicate cluster."""
+
+    id: uuid.UUID = Field(..., description="UUID кандидата")
+    telegram_id: int = Field(..., description="Telegram user ID")
+    full_name: str = Field(..., description="Полное имя кандидата")
+    phone: str | None = Field(None, description="Номер телефона")
+    university: str | None = Field(None, description="Название университета")
+    created_at: datetime = Field(..., description="Дата создания")
+
+    class Config:
+        """Pydantic config."""
+
+        from_attributes = True
+
+
+class DuplicatePair(BaseModel):
+    """Schema for a compared pair of candidates."""
+
+    left_id: uuid.UUID = Field(..., description="UUID первого кандидата")
+    right_id: uuid.UUID = Field(..., description="UUID второго кандидата")
+    score: float = Field(..., description="Вероятность дубликата (0-1)")
+    phone_match: bool = Field(..., description="Совпадает нормализованный телефон")
+    name_similarity: float = Field(..., description="Триграммное сходство имён (0-1)")
+    university_match: bool = Field(..., description="Совпадает университет")
+
+
+class DuplicateCluster(BaseModel):
+    """Schema for a cluster of likely duplicate candidates."""
+
+    score: float = Field(..., description="Наибольшая оценка пары в кластере")
+    candidates: list[DuplicateCandidate] = Field(..., description="Кандидаты кластера")
+    pairs: list[DuplicatePair] = Field(..., description="Пары, связавшие кластер")
+
+
+class DuplicateReport(BaseModel):
+    """Schema for candidate deduplication report."""
+
+    total_clusters: int = Field(..., description="Всего найдено кластеров")
+    clusters: list[DuplicateCluster] = Field(..., description="Кластеры по убыванию оценки")
+
+
+class CandidateImportReject(BaseModel):
+    """Schema for a row rejected during bulk import."""
+
+    line: int = Field(..., description="Номер строки во входном файле")
+    telegram_id: int | None = Field(None, description="Telegram ID из строки, если удалось прочитать")
+    error: str = Field(..., description="Причина отклонения")
+
+
+class CandidateImportReport(BaseModel):
+    """Schema for bulk candidate import report."""
+
+    total_rows: int = Field(..., description="Всего строк во входном файле")
+    inserted: int = Field(..., description="Создано новых кандидатов")
+    updated: int = Field(..., description="Обновлено существующих кандидатов (по telegram_id)")
+    skipped: int = Field(..., description="Пропущено существующих кандидатов (без обновления)")
+    rejected: int = Field(..., description="Отклонено строк")
+    rejects: list[CandidateImportReject] = Field(
+        default_factory=list,
+        description="Детали отклоненных строк (первые 1000)"
+    )
@@ -2,14 +2,47 @@
 
 import uuid
 
-from sqlalchemy import select
+from sqlalchemy import (
+    Float,
+    Row,
+    Select,
+    String,
+    delete,
+    func,
+    literal,
+    literal_column,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.modules.candidates.models import Candidate
+from app.core.cache import invalidate_on_commit, tag
+from app.modules.candidates.models import PHONE_DIGITS_SQL, SEARCH_CONFIG, Candidate
 from app.modules.candidates.schemas import (
     CandidateCreate,
+    CandidateResponse,
     CandidateUpdate,
 )
+from app.modules.telegram.identity import invalidate_identities
+from app.modules.vacancies.models import CandidatePool
+from app.shared.enums import TelegramEntityType
+from app.shared.pagination import (
+    paginate_by,
+    paginate_by_created_at,
+    split_page,
+    split_page_by,
+)
+from app.shared.typeahead import phone_digits, set_similarity_threshold
+
+# Columns of a candidate response, selected by projected queries
+CANDIDATE_COLUMNS = tuple(getattr(Candidate, name) for name in CandidateResponse.model_fields)
+
+# Profile fields filled from duplicates when the kept candidate has no value
+MERGE_SCALAR_FIELDS = ("phone", "location", "university", "course")
+
+# List fields united across merged profiles, kept candidate's items first
+MERGE_LIST_FIELDS = ("preferred_tracks", "achievements", "domains")
 
 
 class CandidateService:
@@ -19,26 +52,29 @@ class CandidateService:
     async def create_candidate(
         db: AsyncSession,
         candidate_data: CandidateCreate,
-    ) -> Candidate:
+    ) -> Candidate | None:
         """Create a new candidate.
 
+        Uses INSERT ... ON CONFLICT (telegram_id) DO NOTHING RETURNING, so the
+        uniqueness check and the insert cost one round trip.
+
         Args:
             db: Database session.
             candidate_data: Candidate creation data.
 
         Returns:
-            Candidate: Created candidate.
+            Candidate | None: Created candidate or None if telegram_id is taken.
         """
-        candidate = Candidate(
-            telegram_id=candidate_data.telegram_id,
-            full_name=candidate_data.full_name,
-            phone=candidate_data.phone,
-            location=candidate_data.location,
-            preferred_tracks=candidate_data.preferred_tracks,
+        result = await db.execute(
+            pg_insert(Candidate)
+            .values(**candidate_data.model_dump())
+            .on_conflict_do_nothing(index_elements=[Candidate.telegram_id])
+            .returning(Candidate)
         )
-        db.add(candidate)
-        await db.commit()
-        await db.refresh(candidate)
+        candidate = result.scalar_one_or_none()
+        if candidate is not None:
+            # Drops a cached "not registered" resolution
+            invalidate_identities(db, TelegramEntityType.CANDIDATE, candidate.telegram_id)
         return candidate
 
     @staticmethod
@@ -79,61 +115,337 @@ class CandidateService:
         )
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def get_candidate_version(
+        db: AsyncSession,
+        candidate_id: uuid.UUID,
+    ) -> Row | None:
+        """Get ``(id, updated_at)`` of a candidate for conditional GET.
+
+        Args:
+            db: Database session.
+            candidate_id: Candidate UUID.
+
+        Returns:
+            Row | None: Version row or None if not found.
+        """
+        result = await db.execute(
+            select(Candidate.id, Candidate.updated_at).where(Candidate.id == candidate_id)
+        )
+        return result.one_or_none()
+
+    @staticmethod
+    async def get_candidate_version_by_telegram_id(
+        db: AsyncSession,
+        telegram_id: int,
+    ) -> Row | None:
+        """Get ``(id, updated_at)`` of a candidate by Telegram ID for conditional GET.
+
+        Args:
+            db: Database session.
+            telegram_id: Telegram user ID.
+
+        Returns:
+            Row | None: Version row or None if not found.
+        """
+        result = await db.execute(
+            select(Candidate.id, Candidate.updated_at).where(Candidate.telegram_id == telegram_id)
+        )
+        return result.one_or_none()
+
     @staticmethod
     async def get_all_candidates(
         db: AsyncSession,
         skip: int = 0,
         limit: int = 100,
-    ) -> list[Candidate]:
-        """Get all candidates with pagination.
+        cursor: str | None = None,
+    ) -> tuple[list[Candidate], str | None]:
+        """Get all candidates with keyset pagination over (created_at, id).
+
+        Args:
+            db: Database session.
+            skip: Number of records to skip (legacy, prefer cursor).
+            limit: Maximum number of records to return.
+            cursor: Cursor of the previous page.
+
+        Returns:
+            tuple[list[Candidate], str | None]: Candidates and next page cursor.
+        """
+        query = paginate_by_created_at(select(Candidate), Candidate, cursor, limit, skip=skip)
+        result = await db.execute(query)
+        return split_page(result.scalars().all(), limit)
+
+    @staticmethod
+    async def search_candidates(
+        db: AsyncSession,
+        query: str | None = None,
+        domains: list[str] | None = None,
+        preferred_tracks: list[int] | None = None,
+        course: int | None = None,
+        location: str | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> tuple[list[Row], str | None]:
+        """Search candidates by text and profile filters.
+
+        Text is matched against the generated ``search_vector`` column (GIN
+        index) with ``websearch_to_tsquery`` syntax, and matches are ordered
+        by ``ts_rank_cd`` with keyset pagination over ``(rank, id)``. Without
+        text, candidates are ordered by ``(created_at, id)``. List filters use
+        JSONB containment served by GIN indexes; location is a
+        case-insensitive prefix.
+
+        Args:
+            db: Database session.
+            query: Search text over full name, university and achievements.
+            domains: Candidate must have all of these domains.
+            preferred_tracks: Candidate must have listed all of these tracks.
+            course: Course of study.
+            location: Location prefix, e.g. a city.
+            limit: Maximum number of records to return.
+            cursor: Cursor of the previous page.
+
+        Returns:
+            tuple[list[Row], str | None]: Candidate rows and next page cursor.
+        """
+        statement = select(*CANDIDATE_COLUMNS)
+        if domains:
+            statement = statement.where(Candidate.domains.contains(domains))
+        if preferred_tracks:
+            statement = statement.where(Candidate.preferred_tracks.contains(preferred_tracks))
+        if course is not None:
+            statement = statement.where(Candidate.course == course)
+        if location:
+            statement = statement.where(
+                func.lower(Candidate.location).startswith(location.lower(), autoescape=True)
+            )
+
+        if not query:
+            statement = paginate_by(statement, Candidate.created_at, Candidate.id, cursor, limit)
+            result = await db.execute(statement)
+            return split_page_by(result.all(), limit, "created_at")
+
+        ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+        rank = func.ts_rank_cd(Candidate.search_vector, ts_query, type_=Float)
+        statement = statement.add_columns(rank.label("rank")).where(
+            Candidate.search_vector.bool_op("@@")(ts_query)
+        )
+        statement = paginate_by(statement, rank, Candidate.id, cursor, limit, descending=True)
+        result = await db.execute(statement)
+        return split_page_by(result.all(), limit, "rank")
+
+    @staticmethod
+    async def typeahead(
+        db: AsyncSession,
+        query: str,
+        limit: int,
+    ) -> list[Row]:
+        """Find candidates by a partial or misspelled name or a phone fragment.
+
+        Phone fragments are matched as substrings of the phone digits, names
+        by trigram word similarity; both use trigram GIN indexes.
 
         Args:
             db: Database session.
-            skip: Number of records to skip.
+            query: Normalized query text.
             limit: Maximum number of records to return.
 
         Returns:
-            list[Candidate]: List of candidates.
+            list[Row]: Matches with their similarity, best first.
         """
+        digits = phone_digits(query)
+        if digits:
+            phone = literal_column(PHONE_DIGITS_SQL, String)
+            similarity = func.word_similarity(digits, phone, type_=Float)
+            condition = phone.contains(digits)
+        else:
+            await set_similarity_threshold(db)
+            similarity = func.word_similarity(query, Candidate.full_name, type_=Float)
+            condition = literal(query).bool_op("<%")(Candidate.full_name)
+
         result = await db.execute(
-            select(Candidate).offset(skip).limit(limit)
+            select(
+                Candidate.id,
+                Candidate.full_name,
+                Candidate.phone,
+                Candidate.location,
+                similarity.label("similarity"),
+            )
+            .where(condition)
+            .order_by(similarity.desc(), Candidate.id)
+            .limit(limit)
         )
-        return list(result.scalars().all())
+        return result.all()
+
+    @staticmethod
+    def build_export_query(track_id: int | None = None) -> Select:
+        """Build a column-projected query for streaming candidate exports.
+
+        Args:
+            track_id: Only export candidates who listed this track.
+
+        Returns:
+            Select: Query over plain candidate columns.
+        """
+        query = select(
+            Candidate.id,
+            Candidate.telegram_id,
+            Candidate.full_name,
+            Candidate.phone,
+            Candidate.location,
+            Candidate.preferred_tracks,
+            Candidate.university,
+            Candidate.course,
+            Candidate.achievements,
+            Candidate.domains,
+            Candidate.created_at,
+            Candidate.updated_at,
+        )
+        if track_id is not None:
+            query = query.where(Candidate.preferred_tracks.contains([track_id]))
+        return query.order_by(Candidate.created_at, Candidate.id)
 
     @staticmethod
     async def update_candidate(
         db: AsyncSession,
-        candidate: Candidate,
+        candidate_id: uuid.UUID,
         update_data: CandidateUpdate,
-    ) -> Candidate:
-        """Update candidate.
+    ) -> Candidate | None:
+        """Update candidate with a single UPDATE ... RETURNING.
 
         Args:
             db: Database session.
-            candidate: Candidate to update.
+            candidate_id: Candidate UUID.
             update_data: Update data.
 
         Returns:
-            Candidate: Updated candidate.
+            Candidate | None: Updated candidate or None if not found.
         """
         update_dict = update_data.model_dump(exclude_unset=True)
-        for field, value in update_dict.items():
-            setattr(candidate, field, value)
+        if not update_dict:
+            return await CandidateService.get_candidate_by_id(db, candidate_id)
 
-        await db.commit()
-        await db.refresh(candidate)
+        result = await db.execute(
+            update(Candidate)
+            .where(Candidate.id == candidate_id)
+            .values(**update_dict)
+            .returning(Candidate)
+        )
+        candidate = result.scalar_one_or_none()
+        if candidate is not None:
+            invalidate_identities(db, TelegramEntityType.CANDIDATE, candidate.telegram_id)
         return candidate
 
+    @staticmethod
+    async def merge_candidates(
+        db: AsyncSession,
+        candidate_id: uuid.UUID,
+        duplicate_ids: list[uuid.UUID],
+    ) -> Candidate | None:
+        """Merge duplicate profiles into a candidate and delete them.
+
+        Empty profile fields of the kept candidate are filled from the
+        oldest duplicate that has them, list fields are united. Pool entries
+        of the duplicates move to the kept candidate, one per vacancy (the
+        most recently updated); where the kept candidate is already in a
+        vacancy's pool, its own entry wins and the others are deleted with
+        the duplicates.
+
+        Args:
+            db: Database session.
+            candidate_id: UUID of the candidate to keep.
+            duplicate_ids: UUIDs of the duplicates to merge.
+
+        Returns:
+            Candidate | None: Merged candidate or None if any candidate is not found.
+        """
+        duplicate_ids = [item for item in dict.fromkeys(duplicate_ids) if item != candidate_id]
+        result = await db.execute(
+            select(Candidate)
+            .where(Candidate.id.in_([candidate_id, *duplicate_ids]))
+            .order_by(Candidate.created_at)
+            .with_for_update()
+        )
+        found = {candidate.id: candidate for candidate in result.scalars()}
+        if len(found) != len(duplicate_ids) + 1:
+            return None
+        target = found.pop(candidate_id)
+        duplicates = list(found.values())
+
+        values = {}
+        for field in MERGE_SCALAR_FIELDS:
+            if getattr(target, field) is None:
+                value = next(
+                    (getattr(item, field) for item in duplicates if getattr(item, field) is not None),
+                    None,
+                )
+                if value is not None:
+                    values[field] = value
+        for field in MERGE_LIST_FIELDS:
+            current = getattr(target, field)
+            merged = list(
+                dict.fromkeys([*current, *(entry for item in duplicates for entry in getattr(item, field))])
+            )
+            if merged != current:
+                values[field] = merged
+
+        if duplicate_ids:
+            target_vacancies = select(CandidatePool.vacancy_id).where(
+                CandidatePool.candidate_id == candidate_id
+            )
+            moved_entries = (
+                select(CandidatePool.id)
+                .where(
+                    CandidatePool.candidate_id.in_(duplicate_ids),
+                    CandidatePool.vacancy_id.not_in(target_vacancies),
+                )
+                .distinct(CandidatePool.vacancy_id)
+                .order_by(CandidatePool.vacancy_id, CandidatePool.updated_at.desc())
+            )
+            await db.execute(
+                update(CandidatePool)
+                .where(CandidatePool.id.in_(moved_entries))
+                .values(candidate_id=candidate_id)
+                .execution_options(synchronize_session=False)
+            )
+            # Remaining pool entries of the duplicates go by ON DELETE CASCADE
+            await db.execute(delete(Candidate).where(Candidate.id.in_(duplicate_ids)))
+            invalidate_on_commit(db, tag("vacancy_pool"), tag("candidate_duplicates"))
+            invalidate_identities(
+                db, TelegramEntityType.CANDIDATE, *(item.telegram_id for item in duplicates)
+            )
+
+        if values:
+            result = await db.execute(
+                update(Candidate)
+                .where(Candidate.id == candidate_id)
+                .values(**values)
+                .returning(Candidate)
+            )
+            target = result.scalar_one()
+        return target
+
     @staticmethod
     async def delete_candidate(
         db: AsyncSession,
-        candidate: Candidate,
-    ) -> None:
-        """Delete candidate.
+        candidate_id: uuid.UUID,
+    ) -> bool:
+        """Delete candidate, relying on ON DELETE CASCADE for pool entries.
 
         Args:
             db: Database session.
-            candidate: Candidate to delete.
+            candidate_id: Candidate UUID.
+
+        Returns:
+            bool: True if the candidate existed and was deleted.
         """
-        await db.delete(candidate)
-        await db.commit()
+        result = await db.execute(
+            delete(Candidate).where(Candidate.id == candidate_id).returning(Candidate.telegram_id)
+        )
+        telegram_id = result.scalar_one_or_none()
+        if telegram_id is None:
+            return False
+        # Pool entries are removed by ON DELETE CASCADE
+        invalidate_on_commit(db, tag("vacancy_pool"))
+        invalidate_identities(db, TelegramEntityType.CANDIDATE, telegram_id)
+        return True
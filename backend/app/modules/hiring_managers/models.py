@@ -1,10 +1,10 @@
 """Hiring Managers module database models."""
 
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import BigInteger, DateTime, String
+from sqlalchemy import BigInteger, DateTime, Index, String, func, text
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -13,6 +13,9 @@ from app.core.database import Base
 if TYPE_CHECKING:
     from app.modules.vacancies.models import Vacancy
 
+# Full name; typeahead queries must use the same expression as the index
+FULL_NAME_SQL = "(first_name || ' ' || last_name)"
+
 
 class HiringManager(Base):
     """Hiring Manager model representing managers who create vacancies."""
@@ -56,15 +59,15 @@ class HiringManager(Base):
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
         comment="Когда профиль был создан"
     )
 
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
         comment="Когда профиль последний раз обновлялся"
     )
@@ -76,6 +79,16 @@ class HiringManager(Base):
         cascade="all, delete-orphan",
     )
 
+    # Constraints and Indexes
+    __table_args__ = (
+        Index("idx_hiring_managers_created_at_id", "created_at", "id"),
+        Index(
+            "idx_hiring_managers_full_name_trgm",
+            text(f"{FULL_NAME_SQL} gin_trgm_ops"),
+            postgresql_using="gin",
+        ),
+    )
+
     def __repr__(self) -> str:
         """String representation of HiringManager.
 
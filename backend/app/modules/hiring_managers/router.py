@@ -2,19 +2,35 @@
 
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.cache import cache_key, cache_response, get_cached_response, tag
+from app.core.config import settings
+from app.core.database import db_timeouts, get_db, release_connection
 from app.modules.hiring_managers.schemas import (
     HiringManagerCreate,
     HiringManagerResponse,
+    HiringManagerTypeaheadResponse,
     HiringManagerUpdate,
 )
 from app.modules.hiring_managers.service import HiringManagerService
+from app.shared.conditional import (
+    check_not_modified,
+    has_preconditions,
+    set_validators,
+    validator_headers,
+)
+from app.shared.pagination import NEXT_CURSOR_HEADER
+from app.shared.responses import orm_json_response
+from app.shared.typeahead import MAX_LIMIT, typeahead_response
 
 router = APIRouter()
 
+hiring_manager_list_adapter = TypeAdapter(list[HiringManagerResponse])
+hiring_manager_typeahead_adapter = TypeAdapter(list[HiringManagerTypeaheadResponse])
+
 
 @router.post(
     "/",
@@ -39,20 +55,46 @@ async def create_hiring_manager(
     Raises:
         HTTPException: If telegram_id already exists.
     """
-    # Check if hiring manager with this telegram_id already exists
-    existing = await HiringManagerService.get_hiring_manager_by_telegram_id(
-        db, hiring_manager_data.telegram_id
+    hiring_manager = await HiringManagerService.create_hiring_manager(
+        db, hiring_manager_data
     )
-    if existing:
+    if not hiring_manager:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Hiring manager with telegram_id {hiring_manager_data.telegram_id} already exists",
         )
+    return HiringManagerResponse.model_validate(hiring_manager)
 
-    hiring_manager = await HiringManagerService.create_hiring_manager(
-        db, hiring_manager_data
+
+@router.get(
+    "/typeahead",
+    response_model=list[HiringManagerTypeaheadResponse],
+    summary="Hiring manager typeahead",
+    description=(
+        "Find hiring managers by a partial or misspelled full name, best matches first.\n\n"
+        "Queries shorter than 3 characters return an empty list; results are cached briefly."
+    ),
+)
+async def hiring_manager_typeahead(
+    q: str = Query(..., max_length=100, description="Name fragment"),
+    limit: int = Query(10, ge=1, le=MAX_LIMIT, description="Maximum number of matches"),
+) -> Response:
+    """Find hiring managers as the user types.
+
+    Args:
+        q: Name fragment.
+        limit: Maximum number of matches.
+
+    Returns:
+        Response: Serialized matches.
+    """
+    return await typeahead_response(
+        "hiring_managers:typeahead",
+        q,
+        limit,
+        hiring_manager_typeahead_adapter,
+        HiringManagerService.typeahead,
     )
-    return HiringManagerResponse.model_validate(hiring_manager)
 
 
 @router.get(
@@ -62,21 +104,31 @@ async def create_hiring_manager(
     description="Get hiring manager profile by UUID.",
 )
 async def get_hiring_manager(
+    request: Request,
+    response: Response,
     hiring_manager_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
-) -> HiringManagerResponse:
+) -> HiringManagerResponse | Response:
     """Get hiring manager by ID.
 
     Args:
+        request: HTTP request with optional If-None-Match/If-Modified-Since.
+        response: Response used to return ETag and Last-Modified.
         hiring_manager_id: Hiring manager UUID.
         db: Database session.
 
     Returns:
-        HiringManagerResponse: Hiring manager profile.
+        HiringManagerResponse | Response: Hiring manager profile, or 304 if unchanged.
 
     Raises:
         HTTPException: If hiring manager not found.
     """
+    if has_preconditions(request):
+        version = await HiringManagerService.get_hiring_manager_version(db, hiring_manager_id)
+        not_modified = check_not_modified(request, version)
+        if not_modified:
+            return not_modified
+
     hiring_manager = await HiringManagerService.get_hiring_manager_by_id(
         db, hiring_manager_id
     )
@@ -85,6 +137,7 @@ async def get_hiring_manager(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Hiring manager with id {hiring_manager_id} not found",
         )
+    set_validators(response, hiring_manager)
     return HiringManagerResponse.model_validate(hiring_manager)
 
 
@@ -92,24 +145,41 @@ async def get_hiring_manager(
     "/telegram/{telegram_id}",
     response_model=HiringManagerResponse,
     summary="Get hiring manager by Telegram ID",
-    description="Get hiring manager profile by Telegram user ID.",
+    description=(
+        "Get hiring manager profile by Telegram user ID. Responses are cached in Redis."
+    ),
 )
 async def get_hiring_manager_by_telegram(
+    request: Request,
     telegram_id: int,
     db: AsyncSession = Depends(get_db),
-) -> HiringManagerResponse:
+) -> Response:
     """Get hiring manager by Telegram ID.
 
     Args:
+        request: HTTP request with optional If-None-Match/If-Modified-Since.
         telegram_id: Telegram user ID.
         db: Database session.
 
     Returns:
-        HiringManagerResponse: Hiring manager profile.
+        Response: Serialized hiring manager profile, or 304 if unchanged.
 
     Raises:
         HTTPException: If hiring manager not found.
     """
+    if has_preconditions(request):
+        version = await HiringManagerService.get_hiring_manager_version_by_telegram_id(
+            db, telegram_id
+        )
+        not_modified = check_not_modified(request, version)
+        if not_modified:
+            return not_modified
+
+    key = cache_key("hiring_managers:by_telegram", telegram_id=telegram_id)
+    cached = await get_cached_response(key)
+    if cached:
+        return cached
+
     hiring_manager = await HiringManagerService.get_hiring_manager_by_telegram_id(
         db, telegram_id
     )
@@ -118,36 +188,50 @@ async def get_hiring_manager_by_telegram(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Hiring manager with telegram_id {telegram_id} not found",
         )
-    return HiringManagerResponse.model_validate(hiring_manager)
+    await release_connection(db)
+    body = HiringManagerResponse.model_validate(hiring_manager).model_dump_json().encode("utf-8")
+    return await cache_response(
+        key,
+        body,
+        tags=[tag("hiring_manager", hiring_manager.id)],
+        headers=validator_headers(hiring_manager),
+    )
 
 
 @router.get(
     "/",
     response_model=list[HiringManagerResponse],
     summary="Get all hiring managers",
-    description="Get list of all hiring managers with pagination.",
+    description=(
+        "Get list of all hiring managers ordered by creation time.\n\n"
+        "Pass the `X-Next-Cursor` response header back as `cursor` to get the next page."
+    ),
 )
 async def get_all_hiring_managers(
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0, description="Records to skip; not with cursor"),
+    limit: int = Query(100, ge=1, le=500, description="Page size"),
+    cursor: str | None = Query(None, description="Cursor from the X-Next-Cursor header"),
     db: AsyncSession = Depends(get_db),
-) -> list[HiringManagerResponse]:
+) -> Response:
     """Get all hiring managers.
 
     Args:
         skip: Number of records to skip.
         limit: Maximum number of records to return.
+        cursor: Cursor of the previous page.
         db: Database session.
 
     Returns:
-        list[HiringManagerResponse]: List of hiring managers.
+        Response: Serialized list of hiring managers with the next page cursor header.
     """
-    hiring_managers = await HiringManagerService.get_all_hiring_managers(
-        db, skip=skip, limit=limit
+    hiring_managers, next_cursor = await HiringManagerService.get_all_hiring_managers(
+        db, skip=skip, limit=limit, cursor=cursor
+    )
+    return orm_json_response(
+        hiring_manager_list_adapter,
+        hiring_managers,
+        headers={NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None,
     )
-    return [
-        HiringManagerResponse.model_validate(hm) for hm in hiring_managers
-    ]
 
 
 @router.patch(
@@ -174,23 +258,20 @@ async def update_hiring_manager(
     Raises:
         HTTPException: If hiring manager not found.
     """
-    hiring_manager = await HiringManagerService.get_hiring_manager_by_id(
-        db, hiring_manager_id
+    updated_manager = await HiringManagerService.update_hiring_manager(
+        db, hiring_manager_id, update_data
     )
-    if not hiring_manager:
+    if not updated_manager:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Hiring manager with id {hiring_manager_id} not found",
         )
-
-    updated_manager = await HiringManagerService.update_hiring_manager(
-        db, hiring_manager, update_data
-    )
     return HiringManagerResponse.model_validate(updated_manager)
 
 
 @router.delete(
     "/{hiring_manager_id}",
+    dependencies=[Depends(db_timeouts(statement_ms=settings.db_bulk_statement_timeout_ms))],
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete hiring manager",
     description="Delete hiring manager profile. All associated vacancies will be deleted (CASCADE).",
@@ -208,17 +289,13 @@ async def delete_hiring_manager(
     Raises:
         HTTPException: If hiring manager not found.
     """
-    hiring_manager = await HiringManagerService.get_hiring_manager_by_id(
-        db, hiring_manager_id
-    )
-    if not hiring_manager:
+    deleted = await HiringManagerService.delete_hiring_manager(db, hiring_manager_id)
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Hiring manager with id {hiring_manager_id} not found",
         )
 
-    await HiringManagerService.delete_hiring_manager(db, hiring_manager)
-
 
 # =============================================================================
 # NOT IMPLEMENTED YET - Endpoints for future features
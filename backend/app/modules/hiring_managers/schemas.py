@@ -40,3 +40,18 @@ class HiringManagerResponse(HiringManagerBase):
         """Pydantic config."""
 
         from_attributes = True
+
+
+class HiringManagerTypeaheadResponse(BaseModel):
+    """Schema for a hiring manager typeahead match."""
+
+    id: uuid.UUID = Field(..., description="Уникальный UUID менеджера")
+    first_name: str = Field(..., description="Имя")
+    last_name: str = Field(..., description="Фамилия")
+    telegram_id: int = Field(..., description="Telegram user ID")
+    similarity: float = Field(..., description="Сходство с запросом (0-1)")
+
+    class Config:
+        """Pydantic config."""
+
+        from_attributes = True
@@ -2,11 +2,17 @@
 
 import uuid
 
-from sqlalchemy import select
+from sqlalchemy import Float, Row, String, delete, func, literal, literal_column, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.modules.hiring_managers.models import HiringManager
+from app.core.cache import invalidate_on_commit, tag
+from app.modules.hiring_managers.models import FULL_NAME_SQL, HiringManager
 from app.modules.hiring_managers.schemas import HiringManagerCreate, HiringManagerUpdate
+from app.modules.telegram.identity import invalidate_identities
+from app.shared.enums import TelegramEntityType
+from app.shared.pagination import paginate_by_created_at, split_page
+from app.shared.typeahead import set_similarity_threshold
 
 
 class HiringManagerService:
@@ -16,25 +22,31 @@ class HiringManagerService:
     async def create_hiring_manager(
         db: AsyncSession,
         hiring_manager_data: HiringManagerCreate,
-    ) -> HiringManager:
+    ) -> HiringManager | None:
         """Create a new hiring manager.
 
+        Uses INSERT ... ON CONFLICT (telegram_id) DO NOTHING RETURNING, so the
+        uniqueness check and the insert cost one round trip.
+
         Args:
             db: Database session.
             hiring_manager_data: Hiring manager creation data.
 
         Returns:
-            HiringManager: Created hiring manager.
+            HiringManager | None: Created hiring manager or None if telegram_id is taken.
         """
-        hiring_manager = HiringManager(
-            telegram_id=hiring_manager_data.telegram_id,
-            first_name=hiring_manager_data.first_name,
-            last_name=hiring_manager_data.last_name,
-            calendly_id=hiring_manager_data.calendly_id,
+        result = await db.execute(
+            pg_insert(HiringManager)
+            .values(**hiring_manager_data.model_dump())
+            .on_conflict_do_nothing(index_elements=[HiringManager.telegram_id])
+            .returning(HiringManager)
         )
-        db.add(hiring_manager)
-        await db.commit()
-        await db.refresh(hiring_manager)
+        hiring_manager = result.scalar_one_or_none()
+        if hiring_manager is not None:
+            # Drops a cached "not registered" resolution
+            invalidate_identities(
+                db, TelegramEntityType.HIRING_MANAGER, hiring_manager.telegram_id
+            )
         return hiring_manager
 
     @staticmethod
@@ -75,61 +87,158 @@ class HiringManagerService:
         )
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def get_hiring_manager_version(
+        db: AsyncSession,
+        hiring_manager_id: uuid.UUID,
+    ) -> Row | None:
+        """Get ``(id, updated_at)`` of a hiring manager for conditional GET.
+
+        Args:
+            db: Database session.
+            hiring_manager_id: Hiring manager UUID.
+
+        Returns:
+            Row | None: Version row or None if not found.
+        """
+        result = await db.execute(
+            select(HiringManager.id, HiringManager.updated_at).where(HiringManager.id == hiring_manager_id)
+        )
+        return result.one_or_none()
+
+    @staticmethod
+    async def get_hiring_manager_version_by_telegram_id(
+        db: AsyncSession,
+        telegram_id: int,
+    ) -> Row | None:
+        """Get ``(id, updated_at)`` of a hiring manager by Telegram ID for conditional GET.
+
+        Args:
+            db: Database session.
+            telegram_id: Telegram user ID.
+
+        Returns:
+            Row | None: Version row or None if not found.
+        """
+        result = await db.execute(
+            select(HiringManager.id, HiringManager.updated_at).where(HiringManager.telegram_id == telegram_id)
+        )
+        return result.one_or_none()
+
     @staticmethod
     async def get_all_hiring_managers(
         db: AsyncSession,
         skip: int = 0,
         limit: int = 100,
-    ) -> list[HiringManager]:
-        """Get all hiring managers with pagination.
+        cursor: str | None = None,
+    ) -> tuple[list[HiringManager], str | None]:
+        """Get all hiring managers with keyset pagination over (created_at, id).
 
         Args:
             db: Database session.
-            skip: Number of records to skip.
+            skip: Number of records to skip (legacy, prefer cursor).
             limit: Maximum number of records to return.
+            cursor: Cursor of the previous page.
 
         Returns:
-            list[HiringManager]: List of hiring managers.
+            tuple[list[HiringManager], str | None]: Hiring managers and next page cursor.
         """
+        query = paginate_by_created_at(
+            select(HiringManager), HiringManager, cursor, limit, skip=skip
+        )
+        result = await db.execute(query)
+        return split_page(result.scalars().all(), limit)
+
+    @staticmethod
+    async def typeahead(
+        db: AsyncSession,
+        query: str,
+        limit: int,
+    ) -> list[Row]:
+        """Find hiring managers by a partial or misspelled full name.
+
+        Args:
+            db: Database session.
+            query: Normalized query text.
+            limit: Maximum number of records to return.
+
+        Returns:
+            list[Row]: Matches with their similarity, best first.
+        """
+        await set_similarity_threshold(db)
+        full_name = literal_column(FULL_NAME_SQL, String)
+        similarity = func.word_similarity(query, full_name, type_=Float)
         result = await db.execute(
-            select(HiringManager).offset(skip).limit(limit)
+            select(
+                HiringManager.id,
+                HiringManager.first_name,
+                HiringManager.last_name,
+                HiringManager.telegram_id,
+                similarity.label("similarity"),
+            )
+            .where(literal(query).bool_op("<%")(full_name))
+            .order_by(similarity.desc(), HiringManager.id)
+            .limit(limit)
         )
-        return list(result.scalars().all())
+        return result.all()
 
     @staticmethod
     async def update_hiring_manager(
         db: AsyncSession,
-        hiring_manager: HiringManager,
+        hiring_manager_id: uuid.UUID,
         update_data: HiringManagerUpdate,
-    ) -> HiringManager:
-        """Update hiring manager.
+    ) -> HiringManager | None:
+        """Update hiring manager with a single UPDATE ... RETURNING.
 
         Args:
             db: Database session.
-            hiring_manager: Hiring manager to update.
+            hiring_manager_id: Hiring manager UUID.
             update_data: Update data.
 
         Returns:
-            HiringManager: Updated hiring manager.
+            HiringManager | None: Updated hiring manager or None if not found.
         """
         update_dict = update_data.model_dump(exclude_unset=True)
-        for field, value in update_dict.items():
-            setattr(hiring_manager, field, value)
+        if not update_dict:
+            return await HiringManagerService.get_hiring_manager_by_id(db, hiring_manager_id)
 
-        await db.commit()
-        await db.refresh(hiring_manager)
+        result = await db.execute(
+            update(HiringManager)
+            .where(HiringManager.id == hiring_manager_id)
+            .values(**update_dict)
+            .returning(HiringManager)
+        )
+        invalidate_on_commit(db, tag("hiring_manager", hiring_manager_id))
+        hiring_manager = result.scalar_one_or_none()
+        if hiring_manager is not None:
+            invalidate_identities(
+                db, TelegramEntityType.HIRING_MANAGER, hiring_manager.telegram_id
+            )
         return hiring_manager
 
     @staticmethod
     async def delete_hiring_manager(
         db: AsyncSession,
-        hiring_manager: HiringManager,
-    ) -> None:
-        """Delete hiring manager.
+        hiring_manager_id: uuid.UUID,
+    ) -> bool:
+        """Delete hiring manager, relying on ON DELETE CASCADE for vacancies.
 
         Args:
             db: Database session.
-            hiring_manager: Hiring manager to delete.
+            hiring_manager_id: Hiring manager UUID.
+
+        Returns:
+            bool: True if the hiring manager existed and was deleted.
         """
-        await db.delete(hiring_manager)
-        await db.commit()
+        result = await db.execute(
+            delete(HiringManager)
+            .where(HiringManager.id == hiring_manager_id)
+            .returning(HiringManager.telegram_id)
+        )
+        # Vacancies of the hiring manager are removed by ON DELETE CASCADE
+        invalidate_on_commit(db, tag("hiring_manager", hiring_manager_id), tag("vacancy"))
+        telegram_id = result.scalar_one_or_none()
+        if telegram_id is None:
+            return False
+        invalidate_identities(db, TelegramEntityType.HIRING_MANAGER, telegram_id)
+        return True
@@ -0,0 +1 @@
+"""Telegram bots integration module."""
@@ -0,0 +1,148 @@
+"""Resolution of bot users by Telegram ID.
+
+Both bots resolve the sender of every update to a candidate or hiring
+manager. Resolutions, including "not registered", are kept in a bounded
+in-process LRU with a TTL (:class:`app.core.local_cache.KeyedCache`), so
+the hot path is a dictionary lookup. Optionally a Redis layer shares
+resolutions between workers.
+
+Statement-level triggers on ``candidates`` and ``hiring_managers`` send a
+keyed notification on the LISTEN/NOTIFY channel of
+:mod:`app.core.local_cache` for every changed Telegram ID, which reaches
+every worker after commit, so writes need no extra statement. Services call
+:func:`invalidate_identities` to drop the Redis entries through cache tags.
+As with the local response cache, the in-process layer is bypassed while
+the listener is disconnected, and a load that overlapped an invalidation
+is not stored.
+"""
+
+from pydantic import TypeAdapter
+from sqlalchemy import String, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import (
+    cache_key,
+    cache_response,
+    get_cached_response,
+    invalidate_on_commit,
+    tag,
+)
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.local_cache import KeyedCache
+from app.modules.candidates.models import Candidate
+from app.modules.hiring_managers.models import FULL_NAME_SQL, HiringManager
+from app.modules.telegram.schemas import TelegramIdentity
+from app.shared.enums import TelegramEntityType
+
+# Notification prefix and cache namespace/tag
+IDENTITY_NAMESPACE = "telegram_identity"
+
+identity_adapter = TypeAdapter(TelegramIdentity | None)
+
+identity_cache: KeyedCache[TelegramIdentity | None] = KeyedCache(
+    IDENTITY_NAMESPACE,
+    max_entries=settings.telegram_identity_cache_max_entries,
+    ttl=settings.telegram_identity_cache_ttl_seconds,
+    enabled=settings.telegram_identity_cache_enabled,
+)
+
+
+def _key_string(entity_type: TelegramEntityType, telegram_id: int) -> str:
+    """Format a resolution key as used in notifications and cache tags."""
+    return f"{entity_type.value}:{telegram_id}"
+
+
+async def _query_identity(
+    db: AsyncSession, entity_type: TelegramEntityType, telegram_id: int
+) -> TelegramIdentity | None:
+    """Load the minimal profile of a bot user from the database."""
+    if entity_type == TelegramEntityType.CANDIDATE:
+        result = await db.execute(
+            select(Candidate.id, Candidate.full_name.label("display_name"))
+            .where(Candidate.telegram_id == telegram_id)
+        )
+    else:
+        result = await db.execute(
+            select(
+                HiringManager.id,
+                literal_column(FULL_NAME_SQL, String).label("display_name"),
+            )
+            .where(HiringManager.telegram_id == telegram_id)
+        )
+    row = result.one_or_none()
+    if row is None:
+        return None
+    return TelegramIdentity(
+        entity_type=entity_type, id=row.id, telegram_id=telegram_id, display_name=row.display_name
+    )
+
+
+async def _load_identity(
+    entity_type: TelegramEntityType, telegram_id: int
+) -> TelegramIdentity | None:
+    """Load a resolution from Redis or, on miss, from the database."""
+    if not settings.telegram_identity_redis_enabled:
+        async with AsyncSessionLocal() as session:
+            return await _query_identity(session, entity_type, telegram_id)
+
+    key = cache_key(IDENTITY_NAMESPACE, entity_type=entity_type.value, telegram_id=telegram_id)
+    cached = await get_cached_response(key)
+    if cached is not None:
+        return identity_adapter.validate_json(cached.body)
+    async with AsyncSessionLocal() as session:
+        identity = await _query_identity(session, entity_type, telegram_id)
+    await cache_response(
+        key,
+        identity_adapter.dump_json(identity),
+        [
+            tag(IDENTITY_NAMESPACE),
+            tag(IDENTITY_NAMESPACE, _key_string(entity_type, telegram_id)),
+        ],
+        ttl=settings.telegram_identity_cache_ttl_seconds,
+    )
+    return identity
+
+
+async def resolve_telegram_identity(
+    entity_type: TelegramEntityType,
+    telegram_id: int,
+) -> TelegramIdentity | None:
+    """Resolve a bot user to a candidate or hiring manager.
+
+    Misses are coalesced per key and run in their own session, so the
+    caller needs no database session.
+
+    Args:
+        entity_type: Profile type the bot serves.
+        telegram_id: Telegram user ID.
+
+    Returns:
+        TelegramIdentity | None: Identity or None if the user is not registered.
+    """
+    return await identity_cache.get_or_load(
+        _key_string(entity_type, telegram_id),
+        lambda: _load_identity(entity_type, telegram_id),
+    )
+
+
+def invalidate_identities(
+    db: AsyncSession,
+    entity_type: TelegramEntityType,
+    *telegram_ids: int,
+) -> None:
+    """Drop cached Redis resolutions once the transaction commits.
+
+    In-process entries are dropped by the database triggers.
+
+    Args:
+        db: Database session of the mutation.
+        entity_type: Profile type of the changed rows.
+        *telegram_ids: Telegram IDs of created, updated or deleted profiles;
+            none to drop every cached resolution (bulk changes).
+    """
+    keys = [_key_string(entity_type, telegram_id) for telegram_id in telegram_ids]
+    if keys:
+        invalidate_on_commit(db, *(tag(IDENTITY_NAMESPACE, key) for key in keys))
+    else:
+        invalidate_on_commit(db, tag(IDENTITY_NAMESPACE))
@@ -0,0 +1,43 @@
+"""Telegram module API routes."""
+
+from fastapi import APIRouter, HTTPException, Query, status
+
+from app.modules.telegram.identity import resolve_telegram_identity
+from app.modules.telegram.schemas import TelegramIdentity
+from app.shared.enums import TelegramEntityType
+
+router = APIRouter()
+
+
+@router.get(
+    "/identity/{telegram_id}",
+    response_model=TelegramIdentity,
+    summary="Resolve bot user",
+    description=(
+        "Resolve a Telegram user to a candidate or hiring manager UUID and display name. "
+        "Served from an in-process cache invalidated on profile changes."
+    ),
+)
+async def resolve_identity(
+    telegram_id: int,
+    entity_type: TelegramEntityType = Query(..., description="Тип профиля, который обслуживает бот"),
+) -> TelegramIdentity:
+    """Resolve a bot user.
+
+    Args:
+        telegram_id: Telegram user ID.
+        entity_type: Profile type the bot serves.
+
+    Returns:
+        TelegramIdentity: Resolved identity.
+
+    Raises:
+        HTTPException: If the user is not registered.
+    """
+    identity = await resolve_telegram_identity(entity_type, telegram_id)
+    if identity is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Telegram user {telegram_id} is not a registered {entity_type.value}",
+        )
+    return identity
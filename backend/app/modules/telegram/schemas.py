@@ -0,0 +1,21 @@
+"""Telegram module Pydantic schemas."""
+
+import uuid
+
+from pydantic import BaseModel, Field
+
+from app.shared.enums import TelegramEntityType
+
+
+class TelegramIdentity(BaseModel):
+    """Schema for a resolved bot user."""
+
+    entity_type: TelegramEntityType = Field(..., description="Тип профиля пользователя")
+    id: uuid.UUID = Field(..., description="UUID кандидата или менеджера")
+    telegram_id: int = Field(..., description="Telegram user ID")
+    display_name: str = Field(..., description="Отображаемое имя")
+
+    class Config:
+        """Pydantic config."""
+
+        frozen = True
@@ -0,0 +1,203 @@
+"""Fast-lane data access for the Tinder-mode swipe loop.
+
+``next-candidate`` followed by ``select``/``skip``/``reject`` is the hottest
+path of the API. These queries skip the ORM entirely: they are SQLAlchemy
+Core statements over the mapped tables, built once at import time so that
+every call hits the compiled-statement cache, and asyncpg runs them as
+cached prepared statements. Rows go straight into the response models
+without identity-map bookkeeping, attribute instrumentation or refresh.
+
+Next-candidate statements depend on which filters are set, so one is built
+per filter combination and memoized; filter values are always bound.
+
+The statements match :class:`CandidatePoolService` semantics; keep them in
+sync when the swipe rules change.
+"""
+
+import uuid
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import Select, bindparam, exists, func, literal_column, select
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import invalidate_on_commit, tag
+from app.modules.candidates.models import TRACK_PRIORITY_LEVELS, Candidate
+from app.modules.candidates.schemas import CandidateResponse
+from app.modules.vacancies.models import CandidatePool, Vacancy
+from app.modules.vacancies.schemas import CandidatePoolResponse, NextCandidateFilters
+from app.shared.enums import CandidatePoolStatus
+
+candidates = Candidate.__table__
+pools = CandidatePool.__table__
+vacancies = Vacancy.__table__
+
+# Only the columns the response models need, in model field order
+CANDIDATE_COLUMNS = [candidates.c[name] for name in CandidateResponse.model_fields]
+POOL_COLUMNS = [pools.c[name] for name in CandidatePoolResponse.model_fields]
+
+VACANCY_EXISTS = select(vacancies.c.id).where(vacancies.c.id == bindparam("vacancy_id"))
+
+# Track of the vacancy as a JSONB scalar, evaluated once per statement
+VACANCY_TRACK = func.to_jsonb(
+    select(vacancies.c.track_id).where(vacancies.c.id == bindparam("vacancy_id")).scalar_subquery()
+)
+
+
+def _like_prefix(value: str) -> str:
+    """Build a case-insensitive LIKE prefix pattern escaped with ``/``."""
+    escaped = value.lower().replace("/", "//").replace("%", "/%").replace("_", "/_")
+    return escaped + "%"
+
+
+@lru_cache(maxsize=64)
+def _next_candidate_statement(
+    max_track_rank: int | None,
+    university: bool,
+    course: bool,
+    domains: bool,
+    location: bool,
+) -> Select:
+    """Build the next-candidate statement for a combination of set filters.
+
+    One branch per track priority level, each served by the
+    ``(preferred_tracks -> N, course)`` index, comes first, then candidates
+    who ranked the track lower (GIN containment), then everyone else.
+    Every branch picks its first candidate by ``(course, id)``; the last
+    one by ``id``, so it walks the primary key. The branches are scalar
+    subqueries under ``COALESCE``, which evaluates them in order and stops
+    at the first hit, so lower-priority branches run only once the higher
+    ones are exhausted and the result is deterministic.
+    """
+    base = select(candidates.c.id).where(
+        ~exists().where(
+            pools.c.vacancy_id == bindparam("vacancy_id"),
+            pools.c.candidate_id == candidates.c.id,
+        )
+    )
+    if university:
+        base = base.where(
+            func.lower(candidates.c.university).like(bindparam("university"), escape="/")
+        )
+    if course:
+        base = base.where(candidates.c.course == bindparam("course"))
+    if domains:
+        base = base.where(candidates.c.domains.contains(bindparam("domains", type_=JSONB)))
+    if location:
+        base = base.where(
+            func.lower(candidates.c.location).like(bindparam("location"), escape="/")
+        )
+
+    # Must match the idx_candidates_track_priority_N index expressions
+    branches = [
+        base.where(
+            literal_column(f"(preferred_tracks -> {level})", JSONB) == VACANCY_TRACK
+        ).order_by(candidates.c.course, candidates.c.id)
+        for level in range(max_track_rank or TRACK_PRIORITY_LEVELS)
+    ]
+    if max_track_rank is None:
+        branches.append(
+            base.where(
+                candidates.c.preferred_tracks.contains(func.jsonb_build_array(VACANCY_TRACK))
+            ).order_by(candidates.c.course, candidates.c.id)
+        )
+        branches.append(base.order_by(candidates.c.id))
+    next_id = func.coalesce(*(branch.limit(1).scalar_subquery() for branch in branches))
+    return select(*CANDIDATE_COLUMNS).where(candidates.c.id == next_id)
+
+
+def next_candidate_query(
+    vacancy_id: int, filters: NextCandidateFilters
+) -> tuple[Select, dict[str, Any]]:
+    """Get the next-candidate statement and its parameters.
+
+    Args:
+        vacancy_id: Vacancy ID.
+        filters: Candidate filters.
+
+    Returns:
+        tuple: Statement selecting at most one candidate row and its bound values.
+    """
+    statement = _next_candidate_statement(
+        filters.max_track_rank,
+        filters.university is not None,
+        filters.course is not None,
+        bool(filters.domains),
+        filters.location is not None,
+    )
+    params: dict[str, Any] = {"vacancy_id": vacancy_id}
+    if filters.university is not None:
+        params["university"] = _like_prefix(filters.university)
+    if filters.course is not None:
+        params["course"] = filters.course
+    if filters.domains:
+        params["domains"] = list(filters.domains)
+    if filters.location is not None:
+        params["location"] = _like_prefix(filters.location)
+    return statement, params
+
+
+ADD_TO_POOL = (
+    pg_insert(pools)
+    .values(
+        vacancy_id=bindparam("vacancy_id"),
+        candidate_id=bindparam("candidate_id"),
+        status=bindparam("status"),
+        notes=bindparam("notes"),
+    )
+    .on_conflict_do_nothing(constraint="uq_vacancy_candidate")
+    .returning(*POOL_COLUMNS)
+)
+
+
+class SwipeFastLane:
+    """Core-only queries for the swipe loop."""
+
+    @staticmethod
+    async def vacancy_exists(db: AsyncSession, vacancy_id: int) -> bool:
+        """Check that a vacancy exists."""
+        conn = await db.connection()
+        result = await conn.execute(VACANCY_EXISTS, {"vacancy_id": vacancy_id})
+        return result.first() is not None
+
+    @staticmethod
+    async def next_candidate(
+        db: AsyncSession,
+        vacancy_id: int,
+        filters: NextCandidateFilters = NextCandidateFilters(),
+    ) -> CandidateResponse | None:
+        """Get the next matching candidate not yet in the vacancy's pool."""
+        statement, params = next_candidate_query(vacancy_id, filters)
+        conn = await db.connection()
+        result = await conn.execute(statement, params)
+        row = result.first()
+        return CandidateResponse.model_validate(row._mapping) if row else None
+
+    @staticmethod
+    async def add_to_pool(
+        db: AsyncSession,
+        vacancy_id: int,
+        candidate_id: uuid.UUID,
+        status: CandidatePoolStatus,
+        notes: str | None = None,
+    ) -> CandidatePoolResponse | None:
+        """Add a candidate to the pool with a status.
+
+        Returns None if the candidate is already in the pool for this vacancy.
+        """
+        conn = await db.connection()
+        result = await conn.execute(
+            ADD_TO_POOL,
+            {
+                "vacancy_id": vacancy_id,
+                "candidate_id": candidate_id,
+                "status": status,
+                "notes": notes,
+            },
+        )
+        row = result.first()
+        if row is None:
+            return None
+        invalidate_on_commit(db, tag("vacancy_pool", vacancy_id))
+        return CandidatePoolResponse.model_validate(row._mapping)
@@ -1,10 +1,10 @@
 """Vacancies module database models."""
 
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import BigInteger, Boolean, DateTime, Enum, ForeignKey, Index, Integer, String, Text, UniqueConstraint
+from sqlalchemy import BigInteger, Boolean, DateTime, Enum, ForeignKey, Index, Integer, String, Text, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -50,15 +50,15 @@ class Track(Base):
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
         comment="Когда трек был создан"
     )
 
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
         comment="Когда трек последний раз обновлялся"
     )
@@ -70,6 +70,11 @@ class Track(Base):
         cascade="all, delete-orphan",
     )
 
+    # Constraints and Indexes
+    __table_args__ = (
+        Index("idx_tracks_created_at_id", "created_at", "id"),
+    )
+
     def __repr__(self) -> str:
         """String representation of Track.
 
@@ -135,15 +140,15 @@ class Vacancy(Base):
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
         comment="Когда вакансия была создана"
     )
 
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
         comment="Когда вакансия последний раз обновлялась"
     )
@@ -165,6 +170,11 @@ class Vacancy(Base):
         cascade="all, delete-orphan",
     )
 
+    # Constraints and Indexes
+    __table_args__ = (
+        Index("idx_vacancies_created_at_id", "created_at", "id"),
+    )
+
     def __repr__(self) -> str:
         """String representation of Vacancy.
 
@@ -231,15 +241,15 @@ class CandidatePool(Base):
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
         comment="Когда кандидат попал в этот статус"
     )
 
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
         comment="Когда запись последний раз обновлялась"
     )
@@ -259,6 +269,7 @@ class CandidatePool(Base):
     __table_args__ = (
         UniqueConstraint("vacancy_id", "candidate_id", name="uq_vacancy_candidate"),
         Index("idx_vacancy_status", "vacancy_id", "status"),
+        Index("idx_candidate_pools_vacancy_created_at_id", "vacancy_id", "created_at", "id"),
     )
 
     def __repr__(self) -> str:
@@ -307,7 +318,7 @@ class InterviewFeedback(Base):
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
         comment="Когда фидбек был создан"
     )
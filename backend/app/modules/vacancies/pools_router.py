@@ -2,7 +2,9 @@
 
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -13,10 +15,15 @@ from app.modules.vacancies.schemas import (
     CandidatePoolWithDetailsResponse,
 )
 from app.modules.vacancies.service import CandidatePoolService
-from app.shared.enums import CandidatePoolStatus
+from app.shared.enums import CandidatePoolStatus, ExportFormat, PoolSortField, SortOrder
+from app.shared.export import export_response
+from app.shared.pagination import NEXT_CURSOR_HEADER
+from app.shared.responses import orm_json_response
 
 router = APIRouter()
 
+pool_details_list_adapter = TypeAdapter(list[CandidatePoolWithDetailsResponse])
+
 
 @router.post(
     "/",
@@ -54,17 +61,12 @@ async def add_candidate_to_pool(
     Raises:
         HTTPException: If candidate already in pool.
     """
-    # Check if candidate is already in this vacancy pool
-    existing = await CandidatePoolService.get_pool_entry_by_vacancy_and_candidate(
-        db, vacancy_id, pool_data.candidate_id
-    )
-    if existing:
+    pool_entry = await CandidatePoolService.add_to_pool(db, vacancy_id, pool_data)
+    if not pool_entry:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Candidate {pool_data.candidate_id} is already in pool for vacancy {vacancy_id}",
         )
-
-    pool_entry = await CandidatePoolService.add_to_pool(db, vacancy_id, pool_data)
     return CandidatePoolResponse.model_validate(pool_entry)
 
 
@@ -72,44 +74,77 @@ async def add_candidate_to_pool(
     "/",
     response_model=list[CandidatePoolWithDetailsResponse],
     summary="Get candidates in pool",
-    description="Get candidates in vacancy pool with optional filters.",
+    description=(
+        "Get candidates in vacancy pool with optional filters and sorting.\n\n"
+        "Pass the `X-Next-Cursor` response header back as `cursor` (with the same "
+        "`sort` and `order`) to get the next page."
+    ),
 )
 async def get_candidates_in_pool(
     vacancy_id: int = Query(..., description="Vacancy ID to filter by"),
     status_filter: CandidatePoolStatus | None = Query(None, alias="status", description="Filter by status"),
+    sort: PoolSortField = Query(PoolSortField.CREATED_AT, description="Sort field"),
+    order: SortOrder = Query(SortOrder.ASC, description="Sort direction"),
+    skip: int = Query(0, ge=0, description="Records to skip; not with cursor"),
+    limit: int = Query(100, ge=1, le=500, description="Page size"),
+    cursor: str | None = Query(None, description="Cursor from the X-Next-Cursor header"),
     db: AsyncSession = Depends(get_db),
-) -> list[CandidatePoolWithDetailsResponse]:
+) -> Response:
     """Get candidates in vacancy pool with details.
 
     Args:
         vacancy_id: Vacancy ID.
         status_filter: Optional status filter.
+        sort: Sort field.
+        order: Sort direction.
+        skip: Number of records to skip.
+        limit: Maximum number of records to return.
+        cursor: Cursor of the previous page.
         db: Database session.
 
     Returns:
-        list[CandidatePoolWithDetailsResponse]: List of candidates with details.
+        Response: Serialized list of candidates with details and the next page cursor header.
     """
-    results = await CandidatePoolService.get_candidates_by_vacancy_with_details(
-        db, vacancy_id, status=status_filter
+    rows, next_cursor = await CandidatePoolService.get_candidates_by_vacancy_with_details(
+        db,
+        vacancy_id,
+        status=status_filter,
+        sort=sort,
+        order=order,
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
+    )
+    return orm_json_response(
+        pool_details_list_adapter,
+        rows,
+        headers={NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None,
     )
 
-    return [
-        CandidatePoolWithDetailsResponse(
-            id=pool.id,
-            vacancy_id=pool.vacancy_id,
-            candidate_id=pool.candidate_id,
-            status=pool.status,
-            interview_scheduled_at=pool.interview_scheduled_at,
-            interview_link=pool.interview_link,
-            notes=pool.notes,
-            created_at=pool.created_at,
-            updated_at=pool.updated_at,
-            candidate_full_name=candidate.full_name,
-            candidate_phone=candidate.phone,
-            candidate_location=candidate.location,
-        )
-        for pool, candidate in results
-    ]
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export vacancy pool",
+    description="Stream all pool entries of a vacancy with candidate details as CSV or NDJSON.",
+)
+async def export_pool(
+    vacancy_id: int = Query(..., description="Vacancy ID to export"),
+    status_filter: CandidatePoolStatus | None = Query(None, alias="status", description="Filter by status"),
+    export_format: ExportFormat = Query(ExportFormat.CSV, alias="format", description="Export format"),
+) -> StreamingResponse:
+    """Export vacancy pool with candidate details.
+
+    Args:
+        vacancy_id: Vacancy ID.
+        status_filter: Optional status filter.
+        export_format: CSV or NDJSON.
+
+    Returns:
+        StreamingResponse: Streamed export file.
+    """
+    query = CandidatePoolService.build_export_query(vacancy_id, status=status_filter)
+    return export_response(query, export_format, f"vacancy_{vacancy_id}_pool")
 
 
 @router.get(
@@ -134,7 +169,7 @@ async def get_pool_entry_by_id(
     Raises:
         HTTPException: If pool entry not found.
     """
-    pool_entry = await CandidatePoolService.get_by_id(db, pool_id)
+    pool_entry = await CandidatePoolService.get_pool_entry_by_id(db, pool_id)
     if not pool_entry:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -178,14 +213,12 @@ async def update_pool_entry(
     Raises:
         HTTPException: If pool entry not found.
     """
-    pool_entry = await CandidatePoolService.get_by_id(db, pool_id)
-    if not pool_entry:
+    updated_entry = await CandidatePoolService.update_pool_entry(db, pool_id, update_data)
+    if not updated_entry:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Pool entry with id {pool_id} not found",
         )
-
-    updated_entry = await CandidatePoolService.update(db, pool_entry, update_data)
     return CandidatePoolResponse.model_validate(updated_entry)
 
 
@@ -208,11 +241,8 @@ async def remove_from_pool(
     Raises:
         HTTPException: If pool entry not found.
     """
-    pool_entry = await CandidatePoolService.get_by_id(db, pool_id)
-    if not pool_entry:
+    if not await CandidatePoolService.remove_candidate_from_pool(db, pool_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Pool entry with id {pool_id} not found",
         )
-
-    await CandidatePoolService.remove(db, pool_entry)
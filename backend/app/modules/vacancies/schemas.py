@@ -5,6 +5,8 @@ from datetime import datetime
 
 from pydantic import BaseModel, Field
 
+from app.modules.candidates.models import TRACK_PRIORITY_LEVELS
+from app.modules.candidates.schemas import CandidateResponse
 from app.shared.enums import CandidatePoolStatus, VacancyStatus
 
 
@@ -164,13 +166,6 @@ class CandidatePoolResponse(BaseModel):
 
 
 # Combined responses with related data
-class VacancyWithCandidatesResponse(BaseModel):
-    """Schema for vacancy with candidates list."""
-
-    vacancy: VacancyResponse
-    candidates: list[CandidatePoolResponse]
-
-
 class CandidatePoolWithDetailsResponse(CandidatePoolResponse):
     """Schema for candidate pool with candidate details."""
 
@@ -184,6 +179,27 @@ class CandidatePoolWithDetailsResponse(CandidatePoolResponse):
         from_attributes = True
 
 
+# Tinder mode
+class NextCandidateFilters(BaseModel):
+    """Filters of the next candidate to review for a vacancy."""
+
+    max_track_rank: int | None = Field(
+        None,
+        ge=1,
+        le=TRACK_PRIORITY_LEVELS,
+        description="Только кандидаты, поставившие трек вакансии не ниже этого места"
+    )
+    university: str | None = Field(None, max_length=255, description="Префикс названия университета")
+    course: int | None = Field(None, ge=1, le=6, description="Курс обучения (1-6)")
+    domains: tuple[str, ...] = Field((), description="Обязательные области интересов")
+    location: str | None = Field(None, max_length=255, description="Префикс местоположения")
+
+    class Config:
+        """Pydantic config."""
+
+        frozen = True
+
+
 # Vacancy Statistics
 class VacancyStatsResponse(BaseModel):
     """Schema for vacancy statistics by candidate statuses."""
@@ -235,3 +251,25 @@ class InterviewFeedbackResponse(BaseModel):
         """Pydantic config."""
 
         from_attributes = True
+
+
+# Vacancy with candidates
+class CandidatePoolEmbeddedResponse(CandidatePoolResponse):
+    """Schema for candidate pool entry with optionally embedded records."""
+
+    candidate: CandidateResponse | None = Field(None, description="Карточка кандидата (embed=candidate)")
+    feedback: InterviewFeedbackResponse | None = Field(
+        None, description="Фидбек после интервью (embed=feedback)"
+    )
+
+    class Config:
+        """Pydantic config."""
+
+        from_attributes = True
+
+
+class VacancyWithCandidatesResponse(BaseModel):
+    """Schema for vacancy with candidates list."""
+
+    vacancy: VacancyResponse
+    candidates: list[CandidatePoolEmbeddedResponse]
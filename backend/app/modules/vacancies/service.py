@@ -2,21 +2,59 @@
 
 import uuid
 
-from sqlalchemy import func, select
+from sqlalchemy import Row, Select, delete, func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
+from app.core.cache import invalidate_on_commit, tag
 from app.modules.candidates.models import Candidate
+from app.modules.vacancies.fast_lane import next_candidate_query
 from app.modules.vacancies.models import CandidatePool, InterviewFeedback, Track, Vacancy
 from app.modules.vacancies.schemas import (
     CandidatePoolCreate,
+    CandidatePoolResponse,
     CandidatePoolUpdate,
     InterviewFeedbackCreate,
+    NextCandidateFilters,
     TrackCreate,
     TrackUpdate,
     VacancyCreate,
     VacancyUpdate,
 )
-from app.shared.enums import CandidatePoolStatus, VacancyStatus
+from app.shared.enums import (
+    CandidatePoolStatus,
+    PoolEmbed,
+    PoolSortField,
+    SortOrder,
+    VacancyStatus,
+)
+from app.shared.pagination import (
+    paginate_by,
+    paginate_by_created_at,
+    split_page,
+    split_page_by,
+)
+
+# Columns of CandidatePoolResponse, in response field order
+POOL_ENTRY_COLUMNS = tuple(
+    getattr(CandidatePool, name) for name in CandidatePoolResponse.model_fields
+)
+
+# Columns of CandidatePoolWithDetailsResponse, in response field order
+POOL_DETAILS_COLUMNS = (
+    *POOL_ENTRY_COLUMNS,
+    Candidate.full_name.label("candidate_full_name"),
+    Candidate.phone.label("candidate_phone"),
+    Candidate.location.label("candidate_location"),
+)
+
+POOL_SORT_COLUMNS = {
+    PoolSortField.CREATED_AT: CandidatePool.created_at,
+    PoolSortField.UPDATED_AT: CandidatePool.updated_at,
+    PoolSortField.STATUS: CandidatePool.status,
+    PoolSortField.CANDIDATE_FULL_NAME: Candidate.full_name,
+}
 
 
 class TrackService:
@@ -24,16 +62,11 @@ class TrackService:
 
     @staticmethod
     async def create_track(db: AsyncSession, track_data: TrackCreate) -> Track:
-        """Create a new track."""
-        track = Track(
-            name=track_data.name,
-            description=track_data.description,
-            is_active=track_data.is_active,
+        """Create a new track with a single INSERT ... RETURNING."""
+        result = await db.execute(
+            insert(Track).values(**track_data.model_dump()).returning(Track)
         )
-        db.add(track)
-        await db.commit()
-        await db.refresh(track)
-        return track
+        return result.scalar_one()
 
     @staticmethod
     async def get_track_by_id(db: AsyncSession, track_id: int) -> Track | None:
@@ -41,35 +74,58 @@ class TrackService:
         result = await db.execute(select(Track).where(Track.id == track_id))
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def get_track_version(db: AsyncSession, track_id: int) -> Row | None:
+        """Get ``(id, updated_at)`` of a track for conditional GET."""
+        result = await db.execute(
+            select(Track.id, Track.updated_at).where(Track.id == track_id)
+        )
+        return result.one_or_none()
+
     @staticmethod
     async def get_all_tracks(
-        db: AsyncSession, skip: int = 0, limit: int = 100, active_only: bool = False
-    ) -> list[Track]:
-        """Get all tracks with optional filtering."""
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        active_only: bool = False,
+        cursor: str | None = None,
+    ) -> tuple[list[Track], str | None]:
+        """Get all tracks with optional filtering and keyset pagination."""
         query = select(Track)
         if active_only:
             query = query.where(Track.is_active == True)
-        query = query.offset(skip).limit(limit)
+        query = paginate_by_created_at(query, Track, cursor, limit, skip=skip)
         result = await db.execute(query)
-        return list(result.scalars().all())
+        return split_page(result.scalars().all(), limit)
 
     @staticmethod
     async def update_track(
-        db: AsyncSession, track: Track, update_data: TrackUpdate
-    ) -> Track:
-        """Update track."""
+        db: AsyncSession, track_id: int, update_data: TrackUpdate
+    ) -> Track | None:
+        """Update track with a single UPDATE ... RETURNING.
+
+        Returns None if the track does not exist.
+        """
         update_dict = update_data.model_dump(exclude_unset=True)
-        for field, value in update_dict.items():
-            setattr(track, field, value)
-        await db.commit()
-        await db.refresh(track)
-        return track
+        if not update_dict:
+            return await TrackService.get_track_by_id(db, track_id)
+        result = await db.execute(
+            update(Track).where(Track.id == track_id).values(**update_dict).returning(Track)
+        )
+        return result.scalar_one_or_none()
 
     @staticmethod
-    async def delete_track(db: AsyncSession, track: Track) -> None:
-        """Delete track."""
-        await db.delete(track)
-        await db.commit()
+    async def delete_track(db: AsyncSession, track_id: int) -> bool:
+        """Delete track, relying on ON DELETE CASCADE for its vacancies.
+
+        Returns False if the track does not exist.
+        """
+        result = await db.execute(
+            delete(Track).where(Track.id == track_id).returning(Track.id)
+        )
+        # Vacancies of the track are removed by ON DELETE CASCADE
+        invalidate_on_commit(db, tag("vacancy"))
+        return result.scalar_one_or_none() is not None
 
 
 class VacancyService:
@@ -78,16 +134,12 @@ class VacancyService:
     @staticmethod
     async def create_vacancy(db: AsyncSession, vacancy_data: VacancyCreate) -> Vacancy:
         """Create a new vacancy (always starts as DRAFT)."""
-        vacancy = Vacancy(
-            track_id=vacancy_data.track_id,
-            hiring_manager_id=vacancy_data.hiring_manager_id,
-            description=vacancy_data.description,
-            status=VacancyStatus.DRAFT,
+        result = await db.execute(
+            insert(Vacancy)
+            .values(**vacancy_data.model_dump(), status=VacancyStatus.DRAFT)
+            .returning(Vacancy)
         )
-        db.add(vacancy)
-        await db.commit()
-        await db.refresh(vacancy)
-        return vacancy
+        return result.scalar_one()
 
     @staticmethod
     async def get_vacancy_by_id(db: AsyncSession, vacancy_id: int) -> Vacancy | None:
@@ -95,6 +147,14 @@ class VacancyService:
         result = await db.execute(select(Vacancy).where(Vacancy.id == vacancy_id))
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def get_vacancy_version(db: AsyncSession, vacancy_id: int) -> Row | None:
+        """Get ``(id, updated_at)`` of a vacancy for conditional GET."""
+        result = await db.execute(
+            select(Vacancy.id, Vacancy.updated_at).where(Vacancy.id == vacancy_id)
+        )
+        return result.one_or_none()
+
     @staticmethod
     async def get_all_vacancies(
         db: AsyncSession,
@@ -103,8 +163,9 @@ class VacancyService:
         status: VacancyStatus | None = None,
         track_id: int | None = None,
         hiring_manager_id: uuid.UUID | None = None,
-    ) -> list[Vacancy]:
-        """Get all vacancies with optional filtering."""
+        cursor: str | None = None,
+    ) -> tuple[list[Vacancy], str | None]:
+        """Get all vacancies with optional filtering and keyset pagination."""
         query = select(Vacancy)
         if status:
             query = query.where(Vacancy.status == status)
@@ -112,43 +173,88 @@ class VacancyService:
             query = query.where(Vacancy.track_id == track_id)
         if hiring_manager_id:
             query = query.where(Vacancy.hiring_manager_id == hiring_manager_id)
-        query = query.offset(skip).limit(limit)
+        query = paginate_by_created_at(query, Vacancy, cursor, limit, skip=skip)
         result = await db.execute(query)
-        return list(result.scalars().all())
+        return split_page(result.scalars().all(), limit)
+
+    @staticmethod
+    def build_export_query(
+        status: VacancyStatus | None = None,
+        track_id: int | None = None,
+        hiring_manager_id: uuid.UUID | None = None,
+    ) -> Select:
+        """Build a column-projected query for streaming vacancy exports."""
+        query = select(
+            Vacancy.id,
+            Vacancy.track_id,
+            Vacancy.hiring_manager_id,
+            Vacancy.description,
+            Vacancy.status,
+            Vacancy.next_interview_at,
+            Vacancy.next_interview_link,
+            Vacancy.created_at,
+            Vacancy.updated_at,
+        )
+        if status:
+            query = query.where(Vacancy.status == status)
+        if track_id:
+            query = query.where(Vacancy.track_id == track_id)
+        if hiring_manager_id:
+            query = query.where(Vacancy.hiring_manager_id == hiring_manager_id)
+        return query.order_by(Vacancy.created_at, Vacancy.id)
 
     @staticmethod
     async def update_vacancy(
-        db: AsyncSession, vacancy: Vacancy, update_data: VacancyUpdate
-    ) -> Vacancy:
-        """Update vacancy."""
+        db: AsyncSession, vacancy_id: int, update_data: VacancyUpdate
+    ) -> Vacancy | None:
+        """Update vacancy with a single UPDATE ... RETURNING.
+
+        Returns None if the vacancy does not exist.
+        """
         update_dict = update_data.model_dump(exclude_unset=True)
-        for field, value in update_dict.items():
-            setattr(vacancy, field, value)
-        await db.commit()
-        await db.refresh(vacancy)
-        return vacancy
+        if not update_dict:
+            return await VacancyService.get_vacancy_by_id(db, vacancy_id)
+        result = await db.execute(
+            update(Vacancy).where(Vacancy.id == vacancy_id).values(**update_dict).returning(Vacancy)
+        )
+        invalidate_on_commit(db, tag("vacancy", vacancy_id))
+        return result.scalar_one_or_none()
 
     @staticmethod
-    async def activate_vacancy(db: AsyncSession, vacancy: Vacancy) -> Vacancy:
+    async def set_vacancy_status(
+        db: AsyncSession, vacancy_id: int, status: VacancyStatus
+    ) -> Vacancy | None:
+        """Change vacancy status with a single UPDATE ... RETURNING.
+
+        Returns None if the vacancy does not exist.
+        """
+        result = await db.execute(
+            update(Vacancy).where(Vacancy.id == vacancy_id).values(status=status).returning(Vacancy)
+        )
+        invalidate_on_commit(db, tag("vacancy", vacancy_id))
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def activate_vacancy(db: AsyncSession, vacancy_id: int) -> Vacancy | None:
         """Activate vacancy (change status from DRAFT to ACTIVE)."""
-        vacancy.status = VacancyStatus.ACTIVE
-        await db.commit()
-        await db.refresh(vacancy)
-        return vacancy
+        return await VacancyService.set_vacancy_status(db, vacancy_id, VacancyStatus.ACTIVE)
 
     @staticmethod
-    async def abort_vacancy(db: AsyncSession, vacancy: Vacancy) -> Vacancy:
+    async def abort_vacancy(db: AsyncSession, vacancy_id: int) -> Vacancy | None:
         """Abort vacancy (change status to ABORTED)."""
-        vacancy.status = VacancyStatus.ABORTED
-        await db.commit()
-        await db.refresh(vacancy)
-        return vacancy
+        return await VacancyService.set_vacancy_status(db, vacancy_id, VacancyStatus.ABORTED)
 
     @staticmethod
-    async def delete_vacancy(db: AsyncSession, vacancy: Vacancy) -> None:
-        """Delete vacancy."""
-        await db.delete(vacancy)
-        await db.commit()
+    async def delete_vacancy(db: AsyncSession, vacancy_id: int) -> bool:
+        """Delete vacancy, relying on ON DELETE CASCADE for its pool entries.
+
+        Returns False if the vacancy does not exist.
+        """
+        result = await db.execute(
+            delete(Vacancy).where(Vacancy.id == vacancy_id).returning(Vacancy.id)
+        )
+        invalidate_on_commit(db, tag("vacancy", vacancy_id))
+        return result.scalar_one_or_none() is not None
 
 
 class CandidatePoolService:
@@ -157,18 +263,18 @@ class CandidatePoolService:
     @staticmethod
     async def add_to_pool(
         db: AsyncSession, vacancy_id: int, pool_data: CandidatePoolCreate
-    ) -> CandidatePool:
-        """Add candidate to vacancy pool."""
-        pool_entry = CandidatePool(
-            vacancy_id=vacancy_id,
-            candidate_id=pool_data.candidate_id,
-            status=pool_data.status,
+    ) -> CandidatePool | None:
+        """Add candidate to vacancy pool.
+
+        Returns None if the candidate is already in the pool for this vacancy.
+        """
+        return await CandidatePoolService.add_candidate_with_status(
+            db,
+            vacancy_id,
+            pool_data.candidate_id,
+            pool_data.status,
             notes=pool_data.notes,
         )
-        db.add(pool_entry)
-        await db.commit()
-        await db.refresh(pool_entry)
-        return pool_entry
 
     @staticmethod
     async def get_pool_entry_by_id(
@@ -211,61 +317,144 @@ class CandidatePoolService:
         db: AsyncSession,
         vacancy_id: int,
         status: CandidatePoolStatus | None = None,
-    ) -> list[tuple[CandidatePool, Candidate]]:
-        """Get candidates for vacancy with full candidate details."""
+        sort: PoolSortField = PoolSortField.CREATED_AT,
+        order: SortOrder = SortOrder.ASC,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> tuple[list[Row], str | None]:
+        """Get a page of pool entries with candidate details.
+
+        Selects only the response columns, so rows map straight into
+        CandidatePoolWithDetailsResponse without loading ORM entities.
+        """
         query = (
-            select(CandidatePool, Candidate)
+            select(*POOL_DETAILS_COLUMNS)
             .join(Candidate, CandidatePool.candidate_id == Candidate.id)
             .where(CandidatePool.vacancy_id == vacancy_id)
         )
         if status:
             query = query.where(CandidatePool.status == status)
+        query = paginate_by(
+            query,
+            POOL_SORT_COLUMNS[sort],
+            CandidatePool.id,
+            cursor,
+            limit,
+            descending=order == SortOrder.DESC,
+            skip=skip,
+        )
+        result = await db.execute(query)
+        return split_page_by(result.all(), limit, sort.value)
+
+    @staticmethod
+    async def get_vacancy_pool_page(
+        db: AsyncSession,
+        vacancy_id: int,
+        embed: frozenset[PoolEmbed] = frozenset(),
+        status: CandidatePoolStatus | None = None,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> tuple[list[Row], str | None]:
+        """Get a page of pool entries, most recently updated first.
+
+        Embedded records are joined into the same query under the
+        ``candidate``/``feedback`` row keys, so a page costs one round trip
+        whatever its size.
+        """
+        query = select(*POOL_ENTRY_COLUMNS).where(CandidatePool.vacancy_id == vacancy_id)
+        if PoolEmbed.CANDIDATE in embed:
+            candidate = aliased(Candidate, name="candidate")
+            query = query.add_columns(candidate).join(
+                candidate, CandidatePool.candidate_id == candidate.id
+            )
+        if PoolEmbed.FEEDBACK in embed:
+            feedback = aliased(InterviewFeedback, name="feedback")
+            query = query.add_columns(feedback).outerjoin(
+                feedback, feedback.pool_id == CandidatePool.id
+            )
+        if status:
+            query = query.where(CandidatePool.status == status)
+        query = paginate_by(
+            query, CandidatePool.updated_at, CandidatePool.id, cursor, limit, descending=True
+        )
         result = await db.execute(query)
-        return list(result.all())
+        return split_page_by(result.all(), limit, "updated_at")
+
+    @staticmethod
+    def build_export_query(
+        vacancy_id: int,
+        status: CandidatePoolStatus | None = None,
+    ) -> Select:
+        """Build a column-projected query exporting pool entries with candidate details."""
+        query = (
+            select(
+                *POOL_DETAILS_COLUMNS,
+                Candidate.university.label("candidate_university"),
+                Candidate.course.label("candidate_course"),
+            )
+            .join(Candidate, CandidatePool.candidate_id == Candidate.id)
+            .where(CandidatePool.vacancy_id == vacancy_id)
+        )
+        if status:
+            query = query.where(CandidatePool.status == status)
+        return query.order_by(CandidatePool.created_at, CandidatePool.id)
 
     @staticmethod
     async def update_pool_entry(
-        db: AsyncSession, pool_entry: CandidatePool, update_data: CandidatePoolUpdate
-    ) -> CandidatePool:
-        """Update candidate pool entry."""
+        db: AsyncSession, pool_id: uuid.UUID, update_data: CandidatePoolUpdate
+    ) -> CandidatePool | None:
+        """Update candidate pool entry with a single UPDATE ... RETURNING.
+
+        Returns None if the pool entry does not exist.
+        """
         update_dict = update_data.model_dump(exclude_unset=True)
-        for field, value in update_dict.items():
-            setattr(pool_entry, field, value)
-        await db.commit()
-        await db.refresh(pool_entry)
+        if not update_dict:
+            return await CandidatePoolService.get_pool_entry_by_id(db, pool_id)
+        result = await db.execute(
+            update(CandidatePool)
+            .where(CandidatePool.id == pool_id)
+            .values(**update_dict)
+            .returning(CandidatePool)
+        )
+        pool_entry = result.scalar_one_or_none()
+        if pool_entry:
+            invalidate_on_commit(db, tag("vacancy_pool", pool_entry.vacancy_id))
         return pool_entry
 
     @staticmethod
     async def remove_candidate_from_pool(
-        db: AsyncSession, pool_entry: CandidatePool
-    ) -> None:
-        """Remove candidate from vacancy pool."""
-        await db.delete(pool_entry)
-        await db.commit()
+        db: AsyncSession, pool_id: uuid.UUID
+    ) -> bool:
+        """Remove candidate from vacancy pool.
+
+        Returns False if the pool entry does not exist.
+        """
+        result = await db.execute(
+            delete(CandidatePool)
+            .where(CandidatePool.id == pool_id)
+            .returning(CandidatePool.vacancy_id)
+        )
+        vacancy_id = result.scalar_one_or_none()
+        if vacancy_id is None:
+            return False
+        invalidate_on_commit(db, tag("vacancy_pool", vacancy_id))
+        return True
 
     @staticmethod
     async def get_next_unviewed_candidate(
-        db: AsyncSession, vacancy_id: int
+        db: AsyncSession,
+        vacancy_id: int,
+        filters: NextCandidateFilters = NextCandidateFilters(),
     ) -> Candidate | None:
-        """Get next candidate who hasn't been viewed for this vacancy yet.
+        """Get next matching candidate who hasn't been viewed for this vacancy yet.
 
-        Uses efficient NOT IN subquery to find candidates not in the pool.
+        Candidates who ranked the vacancy's track higher in
+        ``preferred_tracks`` come first; the statement is shared with
+        :class:`SwipeFastLane`.
         """
-        # Subquery: all candidate IDs already in this vacancy's pool
-        subquery = (
-            select(CandidatePool.candidate_id)
-            .where(CandidatePool.vacancy_id == vacancy_id)
-            .scalar_subquery()
-        )
-
-        # Main query: find first candidate NOT in the pool
-        query = (
-            select(Candidate)
-            .where(Candidate.id.not_in(subquery))
-            .limit(1)
-        )
-
-        result = await db.execute(query)
+        statement, params = next_candidate_query(vacancy_id, filters)
+        result = await db.execute(select(Candidate).from_statement(statement), params)
         return result.scalar_one_or_none()
 
     @staticmethod
@@ -275,20 +464,28 @@ class CandidatePoolService:
         candidate_id: uuid.UUID,
         status: CandidatePoolStatus,
         notes: str | None = None,
-    ) -> CandidatePool:
+    ) -> CandidatePool | None:
         """Add candidate to pool with specific status.
 
-        Helper method for action endpoints (select, skip, reject).
+        Helper method for action endpoints (select, skip, reject). Uses
+        INSERT ... ON CONFLICT DO NOTHING RETURNING, so the duplicate check
+        and the insert cost one round trip. Returns None if the candidate
+        is already in the pool for this vacancy.
         """
-        pool_entry = CandidatePool(
-            vacancy_id=vacancy_id,
-            candidate_id=candidate_id,
-            status=status,
-            notes=notes,
+        result = await db.execute(
+            pg_insert(CandidatePool)
+            .values(
+                vacancy_id=vacancy_id,
+                candidate_id=candidate_id,
+                status=status,
+                notes=notes,
+            )
+            .on_conflict_do_nothing(constraint="uq_vacancy_candidate")
+            .returning(CandidatePool)
         )
-        db.add(pool_entry)
-        await db.commit()
-        await db.refresh(pool_entry)
+        pool_entry = result.scalar_one_or_none()
+        if pool_entry:
+            invalidate_on_commit(db, tag("vacancy_pool", vacancy_id))
         return pool_entry
 
     @staticmethod
@@ -335,27 +532,41 @@ class InterviewFeedbackService:
         pool_id: uuid.UUID,
         feedback_data: InterviewFeedbackCreate
     ) -> InterviewFeedback:
-        """Create interview feedback and update candidate status based on decision."""
+        """Create interview feedback and update candidate status based on decision.
+
+        Both statements run in the caller's unit of work, so the feedback and
+        the status change are committed together.
+        """
         # Create feedback
-        feedback = InterviewFeedback(
-            pool_id=pool_id,
-            feedback_text=feedback_data.feedback_text,
-            decision=feedback_data.decision,
+        result = await db.execute(
+            insert(InterviewFeedback)
+            .values(
+                pool_id=pool_id,
+                feedback_text=feedback_data.feedback_text,
+                decision=feedback_data.decision,
+            )
+            .returning(InterviewFeedback)
         )
-        db.add(feedback)
-
-        # Get pool entry to update status
-        pool_entry = await CandidatePoolService.get_pool_entry_by_id(db, pool_id)
-        if pool_entry:
-            # Update status based on decision
-            if feedback_data.decision == "to_finalist":
-                pool_entry.status = CandidatePoolStatus.FINALIST
-            elif feedback_data.decision in ["reject_globally", "reject_team"]:
-                pool_entry.status = CandidatePoolStatus.REJECTED
-            # "freeze" keeps status as INTERVIEWED
-
-        await db.commit()
-        await db.refresh(feedback)
+        feedback = result.scalar_one()
+
+        # Update status based on decision
+        new_status: CandidatePoolStatus | None = None
+        if feedback_data.decision == "to_finalist":
+            new_status = CandidatePoolStatus.FINALIST
+        elif feedback_data.decision in ["reject_globally", "reject_team"]:
+            new_status = CandidatePoolStatus.REJECTED
+        # "freeze" keeps status as INTERVIEWED
+
+        if new_status:
+            result = await db.execute(
+                update(CandidatePool)
+                .where(CandidatePool.id == pool_id)
+                .values(status=new_status)
+                .returning(CandidatePool.vacancy_id)
+            )
+            vacancy_id = result.scalar_one_or_none()
+            if vacancy_id is not None:
+                invalidate_on_commit(db, tag("vacancy_pool", vacancy_id))
         return feedback
 
     @staticmethod
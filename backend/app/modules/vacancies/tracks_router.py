@@ -1,14 +1,59 @@
 """Tracks API router."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.cache import cache_key
+from app.core.config import settings
+from app.core.database import db_timeouts, get_db
+from app.core.local_cache import local_cache
 from app.modules.vacancies.schemas import TrackCreate, TrackResponse, TrackUpdate
 from app.modules.vacancies.service import TrackService
+from app.shared.conditional import check_not_modified, has_preconditions, set_validators
+from app.shared.pagination import NEXT_CURSOR_HEADER
 
 router = APIRouter()
 
+track_list_adapter = TypeAdapter(list[TrackResponse])
+
+
+async def list_tracks_response(
+    db: AsyncSession,
+    active_only: bool = False,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
+) -> Response:
+    """Serialize a page of tracks through the in-process cache.
+
+    Also used on startup to prime the cache with the first page.
+
+    Args:
+        db: Database session.
+        active_only: If True, return only active tracks.
+        skip: Number of records to skip.
+        limit: Page size.
+        cursor: Cursor of the previous page.
+
+    Returns:
+        Response: Serialized list of tracks with the next page cursor header.
+    """
+    key = cache_key(
+        "tracks:list", active_only=active_only, skip=skip, limit=limit, cursor=cursor
+    )
+
+    async def load() -> tuple[bytes, dict[str, str] | None]:
+        tracks, next_cursor = await TrackService.get_all_tracks(
+            db, skip=skip, limit=limit, active_only=active_only, cursor=cursor
+        )
+        body = track_list_adapter.dump_json(
+            [TrackResponse.model_validate(t) for t in tracks]
+        )
+        return body, {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+
+    return await local_cache.get_or_load(key, ["tracks"], load)
+
 
 @router.post(
     "/",
@@ -38,23 +83,35 @@ async def create_track(
     "/",
     response_model=list[TrackResponse],
     summary="Get all tracks",
-    description="Get list of all tracks with optional active filter.",
+    description=(
+        "Get list of all tracks with optional active filter, ordered by creation time.\n\n"
+        "Pass the `X-Next-Cursor` response header back as `cursor` to get the next page. "
+        "Responses are cached in the memory of each worker and invalidated "
+        "through Postgres LISTEN/NOTIFY on track changes."
+    ),
 )
 async def get_all_tracks(
     active_only: bool = Query(False, description="Return only active tracks"),
+    skip: int = Query(0, ge=0, description="Records to skip; not with cursor"),
+    limit: int = Query(100, ge=1, le=500, description="Page size"),
+    cursor: str | None = Query(None, description="Cursor from the X-Next-Cursor header"),
     db: AsyncSession = Depends(get_db),
-) -> list[TrackResponse]:
+) -> Response:
     """Get all tracks.
 
     Args:
         active_only: If True, return only active tracks.
+        skip: Number of records to skip.
+        limit: Maximum number of records to return.
+        cursor: Cursor of the previous page.
         db: Database session.
 
     Returns:
-        list[TrackResponse]: List of tracks.
+        Response: Serialized list of tracks with the next page cursor header.
     """
-    tracks = await TrackService.get_all_tracks(db, active_only=active_only)
-    return [TrackResponse.model_validate(t) for t in tracks]
+    return await list_tracks_response(
+        db, active_only=active_only, skip=skip, limit=limit, cursor=cursor
+    )
 
 
 @router.get(
@@ -64,27 +121,38 @@ async def get_all_tracks(
     description="Get track details by ID.",
 )
 async def get_track(
+    request: Request,
+    response: Response,
     track_id: int,
     db: AsyncSession = Depends(get_db),
-) -> TrackResponse:
+) -> TrackResponse | Response:
     """Get track by ID.
 
     Args:
+        request: HTTP request with optional If-None-Match/If-Modified-Since.
+        response: Response used to return ETag and Last-Modified.
         track_id: Track ID.
         db: Database session.
 
     Returns:
-        TrackResponse: Track details.
+        TrackResponse | Response: Track details, or 304 if unchanged.
 
     Raises:
         HTTPException: If track not found.
     """
+    if has_preconditions(request):
+        version = await TrackService.get_track_version(db, track_id)
+        not_modified = check_not_modified(request, version)
+        if not_modified:
+            return not_modified
+
     track = await TrackService.get_track_by_id(db, track_id)
     if not track:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Track with id {track_id} not found",
         )
+    set_validators(response, track)
     return TrackResponse.model_validate(track)
 
 
@@ -112,19 +180,18 @@ async def update_track(
     Raises:
         HTTPException: If track not found.
     """
-    track = await TrackService.get_track_by_id(db, track_id)
-    if not track:
+    updated_track = await TrackService.update_track(db, track_id, update_data)
+    if not updated_track:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Track with id {track_id} not found",
         )
-
-    updated_track = await TrackService.update_track(db, track, update_data)
     return TrackResponse.model_validate(updated_track)
 
 
 @router.delete(
     "/{track_id}",
+    dependencies=[Depends(db_timeouts(statement_ms=settings.db_bulk_statement_timeout_ms))],
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete track",
     description="Delete track. All associated vacancies will be deleted (CASCADE).",
@@ -142,11 +209,9 @@ async def delete_track(
     Raises:
         HTTPException: If track not found.
     """
-    track = await TrackService.get_track_by_id(db, track_id)
-    if not track:
+    deleted = await TrackService.delete_track(db, track_id)
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Track with id {track_id} not found",
         )
-
-    await TrackService.delete_track(db, track)
@@ -2,15 +2,29 @@
 
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.cache import cache_key, cache_response, get_cached_response, get_or_compute, tag
+from app.core.config import settings
+from app.core.database import (
+    AsyncSessionLocal,
+    db_timeouts,
+    get_db,
+    release_connection,
+    statement_timeouts,
+)
+from app.core.local_cache import local_cache
+from app.modules.candidates.models import TRACK_PRIORITY_LEVELS
 from app.modules.candidates.schemas import CandidateResponse
+from app.modules.vacancies.fast_lane import SwipeFastLane
 from app.modules.vacancies.schemas import (
     CandidatePoolResponse,
     InterviewFeedbackCreate,
     InterviewFeedbackResponse,
+    NextCandidateFilters,
     VacancyCreate,
     VacancyResponse,
     VacancyStatsResponse,
@@ -22,10 +36,73 @@ from app.modules.vacancies.service import (
     InterviewFeedbackService,
     VacancyService,
 )
-from app.shared.enums import CandidatePoolStatus, VacancyStatus
+from app.shared.conditional import check_not_modified, has_preconditions, validator_headers
+from app.shared.enums import CandidatePoolStatus, ExportFormat, PoolEmbed, VacancyStatus
+from app.shared.export import export_response
+from app.shared.pagination import NEXT_CURSOR_HEADER
+from app.shared.responses import PydanticJSONResponse
 
 router = APIRouter()
 
+vacancy_list_adapter = TypeAdapter(list[VacancyResponse])
+
+
+async def list_vacancies_response(
+    db: AsyncSession,
+    status: VacancyStatus | None = None,
+    track_id: int | None = None,
+    hiring_manager_id: uuid.UUID | None = None,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
+) -> Response:
+    """Serialize a page of vacancies.
+
+    Lists of active vacancies are served from the in-process cache, which
+    is also primed with the first page on startup.
+
+    Args:
+        db: Database session.
+        status: Filter by vacancy status.
+        track_id: Filter by track ID.
+        hiring_manager_id: Filter by hiring manager UUID.
+        skip: Number of records to skip.
+        limit: Page size.
+        cursor: Cursor of the previous page.
+
+    Returns:
+        Response: Serialized list of vacancies with the next page cursor header.
+    """
+
+    async def load() -> tuple[bytes, dict[str, str] | None]:
+        vacancies, next_cursor = await VacancyService.get_all_vacancies(
+            db,
+            skip=skip,
+            limit=limit,
+            status=status,
+            track_id=track_id,
+            hiring_manager_id=hiring_manager_id,
+            cursor=cursor,
+        )
+        body = vacancy_list_adapter.dump_json(
+            [VacancyResponse.model_validate(v) for v in vacancies]
+        )
+        return body, {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+
+    if status != VacancyStatus.ACTIVE:
+        body, headers = await load()
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    key = cache_key(
+        "vacancies:active",
+        track_id=track_id,
+        hiring_manager_id=hiring_manager_id,
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
+    )
+    return await local_cache.get_or_load(key, ["vacancies"], load)
+
 
 @router.post(
     "/",
@@ -55,87 +132,175 @@ async def create_vacancy(
     "/",
     response_model=list[VacancyResponse],
     summary="Get all vacancies",
-    description="Get list of all vacancies with optional filters.",
+    description=(
+        "Get list of all vacancies with optional filters, ordered by creation time.\n\n"
+        "Pass the `X-Next-Cursor` response header back as `cursor` to get the next page. "
+        "Lists of active vacancies are cached in the memory of each worker and "
+        "invalidated through Postgres LISTEN/NOTIFY."
+    ),
 )
 async def get_all_vacancies(
     status_filter: VacancyStatus | None = Query(None, alias="status", description="Filter by status"),
     track_id: int | None = Query(None, description="Filter by track ID"),
     hiring_manager_id: uuid.UUID | None = Query(None, description="Filter by hiring manager UUID"),
+    skip: int = Query(0, ge=0, description="Records to skip; not with cursor"),
+    limit: int = Query(100, ge=1, le=500, description="Page size"),
+    cursor: str | None = Query(None, description="Cursor from the X-Next-Cursor header"),
     db: AsyncSession = Depends(get_db),
-) -> list[VacancyResponse]:
+) -> Response:
     """Get all vacancies with optional filters.
 
     Args:
         status_filter: Filter by vacancy status.
         track_id: Filter by track ID.
         hiring_manager_id: Filter by hiring manager UUID.
+        skip: Number of records to skip.
+        limit: Maximum number of records to return.
+        cursor: Cursor of the previous page.
         db: Database session.
 
     Returns:
-        list[VacancyResponse]: List of vacancies.
+        Response: Serialized list of vacancies with the next page cursor header.
     """
-    vacancies = await VacancyService.get_all_vacancies(
+    return await list_vacancies_response(
         db,
         status=status_filter,
         track_id=track_id,
         hiring_manager_id=hiring_manager_id,
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
     )
-    return [VacancyResponse.model_validate(v) for v in vacancies]
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export vacancies",
+    description="Stream vacancies matching the filters as CSV or NDJSON.",
+)
+async def export_vacancies(
+    export_format: ExportFormat = Query(ExportFormat.CSV, alias="format", description="Export format"),
+    status_filter: VacancyStatus | None = Query(None, alias="status", description="Filter by status"),
+    track_id: int | None = Query(None, description="Filter by track ID"),
+    hiring_manager_id: uuid.UUID | None = Query(None, description="Filter by hiring manager UUID"),
+) -> StreamingResponse:
+    """Export vacancies.
+
+    Args:
+        export_format: CSV or NDJSON.
+        status_filter: Filter by vacancy status.
+        track_id: Filter by track ID.
+        hiring_manager_id: Filter by hiring manager UUID.
+
+    Returns:
+        StreamingResponse: Streamed export file.
+    """
+    query = VacancyService.build_export_query(
+        status=status_filter,
+        track_id=track_id,
+        hiring_manager_id=hiring_manager_id,
+    )
+    return export_response(query, export_format, "vacancies")
 
 
 @router.get(
     "/{vacancy_id}",
     response_model=VacancyResponse,
     summary="Get vacancy by ID",
-    description="Get vacancy details by ID.",
+    description="Get vacancy details by ID. Responses are cached in Redis.",
 )
 async def get_vacancy(
+    request: Request,
     vacancy_id: int,
     db: AsyncSession = Depends(get_db),
-) -> VacancyResponse:
+) -> Response:
     """Get vacancy by ID.
 
     Args:
+        request: HTTP request with optional If-None-Match/If-Modified-Since.
         vacancy_id: Vacancy ID.
         db: Database session.
 
     Returns:
-        VacancyResponse: Vacancy details.
+        Response: Serialized vacancy details, or 304 if unchanged.
 
     Raises:
         HTTPException: If vacancy not found.
     """
+    if has_preconditions(request):
+        version = await VacancyService.get_vacancy_version(db, vacancy_id)
+        not_modified = check_not_modified(request, version)
+        if not_modified:
+            return not_modified
+
+    key = cache_key("vacancies:detail", vacancy_id=vacancy_id)
+    cached = await get_cached_response(key)
+    if cached:
+        return cached
+
     vacancy = await VacancyService.get_vacancy_by_id(db, vacancy_id)
     if not vacancy:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Vacancy with id {vacancy_id} not found",
         )
-    return VacancyResponse.model_validate(vacancy)
+    await release_connection(db)
+    body = VacancyResponse.model_validate(vacancy).model_dump_json().encode("utf-8")
+    return await cache_response(
+        key,
+        body,
+        tags=[tag("vacancy", vacancy_id), tag("vacancy")],
+        headers=validator_headers(vacancy),
+    )
 
 
 @router.get(
     "/{vacancy_id}/with-candidates",
     response_model=VacancyWithCandidatesResponse,
     summary="Get vacancy with candidates",
-    description="Get vacancy details with all candidates from pool.",
+    description=(
+        "Get vacancy details with a page of candidates from pool, most recently updated first.\n\n"
+        "`embed` is a comma-separated list of related records to include in every entry: "
+        "`candidate` (candidate card) and `feedback` (interview feedback). They are loaded "
+        "in the same query as the page. Pass the `X-Next-Cursor` response header back as "
+        "`cursor` to get the next page."
+    ),
 )
 async def get_vacancy_with_candidates(
     vacancy_id: int,
+    embed: str | None = Query(None, description="Comma-separated: candidate,feedback"),
+    status_filter: CandidatePoolStatus | None = Query(None, alias="status", description="Filter by status"),
+    limit: int = Query(100, ge=1, le=500, description="Page size"),
+    cursor: str | None = Query(None, description="Cursor from the X-Next-Cursor header"),
     db: AsyncSession = Depends(get_db),
-) -> VacancyWithCandidatesResponse:
-    """Get vacancy with all candidates from pool.
+) -> Response:
+    """Get vacancy with a page of candidates from pool.
 
     Args:
         vacancy_id: Vacancy ID.
+        embed: Comma-separated related records to embed.
+        status_filter: Optional status filter.
+        limit: Maximum number of pool entries to return.
+        cursor: Cursor of the previous page.
         db: Database session.
 
     Returns:
-        VacancyWithCandidatesResponse: Vacancy with candidates list.
+        Response: Serialized vacancy with candidates and the next page cursor header.
 
     Raises:
-        HTTPException: If vacancy not found.
+        HTTPException: If embed is invalid or vacancy not found.
     """
+    try:
+        embeds = frozenset(
+            PoolEmbed(item.strip()) for item in (embed or "").split(",") if item.strip()
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid embed, allowed values: {', '.join(e.value for e in PoolEmbed)}",
+        )
+
     vacancy = await VacancyService.get_vacancy_by_id(db, vacancy_id)
     if not vacancy:
         raise HTTPException(
@@ -143,11 +308,17 @@ async def get_vacancy_with_candidates(
             detail=f"Vacancy with id {vacancy_id} not found",
         )
 
-    candidates = await CandidatePoolService.get_candidates_by_vacancy(db, vacancy_id)
-
-    return VacancyWithCandidatesResponse(
-        vacancy=VacancyResponse.model_validate(vacancy),
-        candidates=[CandidatePoolResponse.model_validate(c) for c in candidates],
+    rows, next_cursor = await CandidatePoolService.get_vacancy_pool_page(
+        db, vacancy_id, embed=embeds, status=status_filter, limit=limit, cursor=cursor
+    )
+    result = VacancyWithCandidatesResponse.model_validate(
+        {"vacancy": vacancy, "candidates": rows}, from_attributes=True
+    )
+    # Entries without embeds omit the candidate/feedback keys instead of sending nulls
+    return Response(
+        content=result.model_dump_json(exclude_unset=True),
+        media_type="application/json",
+        headers={NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None,
     )
 
 
@@ -175,14 +346,12 @@ async def update_vacancy(
     Raises:
         HTTPException: If vacancy not found.
     """
-    vacancy = await VacancyService.get_vacancy_by_id(db, vacancy_id)
-    if not vacancy:
+    updated_vacancy = await VacancyService.update_vacancy(db, vacancy_id, update_data)
+    if not updated_vacancy:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Vacancy with id {vacancy_id} not found",
         )
-
-    updated_vacancy = await VacancyService.update_vacancy(db, vacancy, update_data)
     return VacancyResponse.model_validate(updated_vacancy)
 
 
@@ -208,14 +377,12 @@ async def activate_vacancy(
     Raises:
         HTTPException: If vacancy not found.
     """
-    vacancy = await VacancyService.get_vacancy_by_id(db, vacancy_id)
-    if not vacancy:
+    activated_vacancy = await VacancyService.activate_vacancy(db, vacancy_id)
+    if not activated_vacancy:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Vacancy with id {vacancy_id} not found",
         )
-
-    activated_vacancy = await VacancyService.activate_vacancy(db, vacancy)
     return VacancyResponse.model_validate(activated_vacancy)
 
 
@@ -241,19 +408,18 @@ async def abort_vacancy(
     Raises:
         HTTPException: If vacancy not found.
     """
-    vacancy = await VacancyService.get_vacancy_by_id(db, vacancy_id)
-    if not vacancy:
+    aborted_vacancy = await VacancyService.abort_vacancy(db, vacancy_id)
+    if not aborted_vacancy:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Vacancy with id {vacancy_id} not found",
         )
-
-    aborted_vacancy = await VacancyService.abort_vacancy(db, vacancy)
     return VacancyResponse.model_validate(aborted_vacancy)
 
 
 @router.delete(
     "/{vacancy_id}",
+    dependencies=[Depends(db_timeouts(statement_ms=settings.db_bulk_statement_timeout_ms))],
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete vacancy",
     description="Delete vacancy. All associated candidate pool entries will be deleted (CASCADE).",
@@ -271,15 +437,13 @@ async def delete_vacancy(
     Raises:
         HTTPException: If vacancy not found.
     """
-    vacancy = await VacancyService.get_vacancy_by_id(db, vacancy_id)
-    if not vacancy:
+    deleted = await VacancyService.delete_vacancy(db, vacancy_id)
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Vacancy with id {vacancy_id} not found",
         )
 
-    await VacancyService.delete_vacancy(db, vacancy)
-
 
 @router.get(
     "/{vacancy_id}/next-candidate",
@@ -287,43 +451,68 @@ async def delete_vacancy(
     summary="Get next candidate for review",
     description=(
         "Get next candidate who hasn't been viewed for this vacancy yet (Tinder mode).\n\n"
-        "Returns the first candidate who is NOT in the vacancy's pool. "
-        "If all candidates have been reviewed, returns 404."
+        "Returns a matching candidate who is NOT in the vacancy's pool. Candidates who put "
+        "the vacancy's track first in `preferred_tracks` come first, then second, third "
+        "and lower choices, then everyone else; `max_track_rank` keeps only top choices. "
+        "`university` and `location` are case-insensitive prefixes, `domains` must all be "
+        "present. If all matching candidates have been reviewed, returns 404."
     ),
 )
 async def get_next_candidate(
     vacancy_id: int,
+    max_track_rank: int | None = Query(
+        None,
+        ge=1,
+        le=TRACK_PRIORITY_LEVELS,
+        description="Only candidates who ranked the vacancy's track this high or higher",
+    ),
+    university: str | None = Query(None, max_length=255, description="University prefix"),
+    course: int | None = Query(None, ge=1, le=6, description="Course of study"),
+    domains: list[str] | None = Query(None, description="Required domains"),
+    location: str | None = Query(None, max_length=255, description="Location prefix"),
     db: AsyncSession = Depends(get_db),
-) -> CandidateResponse:
+) -> Response:
     """Get next unviewed candidate for vacancy in Tinder mode.
 
     Args:
         vacancy_id: Vacancy ID.
+        max_track_rank: Highest accepted position of the vacancy's track.
+        university: University prefix.
+        course: Course of study.
+        domains: Required domains.
+        location: Location prefix.
         db: Database session.
 
     Returns:
-        CandidateResponse: Next candidate to review.
+        Response: Serialized next candidate to review.
 
     Raises:
         HTTPException: If vacancy not found or no more candidates.
     """
     # Verify vacancy exists
-    vacancy = await VacancyService.get_vacancy_by_id(db, vacancy_id)
-    if not vacancy:
+    if not await SwipeFastLane.vacancy_exists(db, vacancy_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Vacancy with id {vacancy_id} not found",
         )
 
-    # Get next unviewed candidate
-    candidate = await CandidatePoolService.get_next_unviewed_candidate(db, vacancy_id)
+    filters = NextCandidateFilters(
+        max_track_rank=max_track_rank,
+        university=university,
+        course=course,
+        domains=tuple(domains or ()),
+        location=location,
+    )
+
+    # Not coalesced: callers sharing one result would review the same candidate
+    candidate = await SwipeFastLane.next_candidate(db, vacancy_id, filters)
     if not candidate:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No more candidates to review for this vacancy",
         )
 
-    return CandidateResponse.model_validate(candidate)
+    return PydanticJSONResponse(candidate)
 
 
 @router.post(
@@ -340,7 +529,7 @@ async def select_candidate(
     vacancy_id: int,
     candidate_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
-) -> CandidatePoolResponse:
+) -> Response:
     """Select candidate for interview.
 
     Args:
@@ -349,25 +538,20 @@ async def select_candidate(
         db: Database session.
 
     Returns:
-        CandidatePoolResponse: Created pool entry with SELECTED status.
+        Response: Serialized pool entry with SELECTED status.
 
     Raises:
         HTTPException: If candidate already in pool.
     """
-    # Check if already in pool
-    existing = await CandidatePoolService.get_pool_entry_by_vacancy_and_candidate(
-        db, vacancy_id, candidate_id
+    pool_entry = await SwipeFastLane.add_to_pool(
+        db, vacancy_id, candidate_id, CandidatePoolStatus.SELECTED
     )
-    if existing:
+    if not pool_entry:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Candidate {candidate_id} is already in pool for vacancy {vacancy_id}",
         )
-
-    pool_entry = await CandidatePoolService.add_candidate_with_status(
-        db, vacancy_id, candidate_id, CandidatePoolStatus.SELECTED
-    )
-    return CandidatePoolResponse.model_validate(pool_entry)
+    return PydanticJSONResponse(pool_entry, status_code=status.HTTP_201_CREATED)
 
 
 @router.post(
@@ -385,7 +569,7 @@ async def skip_candidate(
     vacancy_id: int,
     candidate_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
-) -> CandidatePoolResponse:
+) -> Response:
     """Skip candidate (soft reject).
 
     Args:
@@ -394,25 +578,20 @@ async def skip_candidate(
         db: Database session.
 
     Returns:
-        CandidatePoolResponse: Created pool entry with VIEWED status.
+        Response: Serialized pool entry with VIEWED status.
 
     Raises:
         HTTPException: If candidate already in pool.
     """
-    # Check if already in pool
-    existing = await CandidatePoolService.get_pool_entry_by_vacancy_and_candidate(
-        db, vacancy_id, candidate_id
+    pool_entry = await SwipeFastLane.add_to_pool(
+        db, vacancy_id, candidate_id, CandidatePoolStatus.VIEWED
     )
-    if existing:
+    if not pool_entry:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Candidate {candidate_id} is already in pool for vacancy {vacancy_id}",
         )
-
-    pool_entry = await CandidatePoolService.add_candidate_with_status(
-        db, vacancy_id, candidate_id, CandidatePoolStatus.VIEWED
-    )
-    return CandidatePoolResponse.model_validate(pool_entry)
+    return PydanticJSONResponse(pool_entry, status_code=status.HTTP_201_CREATED)
 
 
 @router.post(
@@ -431,7 +610,7 @@ async def reject_candidate(
     candidate_id: uuid.UUID,
     notes: str | None = Query(None, description="Rejection reason or notes"),
     db: AsyncSession = Depends(get_db),
-) -> CandidatePoolResponse:
+) -> Response:
     """Reject candidate.
 
     Args:
@@ -441,25 +620,20 @@ async def reject_candidate(
         db: Database session.
 
     Returns:
-        CandidatePoolResponse: Created pool entry with REJECTED status.
+        Response: Serialized pool entry with REJECTED status.
 
     Raises:
         HTTPException: If candidate already in pool.
     """
-    # Check if already in pool
-    existing = await CandidatePoolService.get_pool_entry_by_vacancy_and_candidate(
-        db, vacancy_id, candidate_id
+    pool_entry = await SwipeFastLane.add_to_pool(
+        db, vacancy_id, candidate_id, CandidatePoolStatus.REJECTED, notes=notes
     )
-    if existing:
+    if not pool_entry:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Candidate {candidate_id} is already in pool for vacancy {vacancy_id}",
         )
-
-    pool_entry = await CandidatePoolService.add_candidate_with_status(
-        db, vacancy_id, candidate_id, CandidatePoolStatus.REJECTED, notes=notes
-    )
-    return CandidatePoolResponse.model_validate(pool_entry)
+    return PydanticJSONResponse(pool_entry, status_code=status.HTTP_201_CREATED)
 
 
 @router.get(
@@ -469,35 +643,50 @@ async def reject_candidate(
     description=(
         "Get statistics for vacancy - count of candidates in each status.\n\n"
         "Returns counts for: viewed, selected, interview_scheduled, "
-        "interviewed, finalist, offer_sent, rejected."
+        "interviewed, finalist, offer_sent, rejected. "
+        "Responses are cached in Redis for a short time; concurrent misses are coalesced."
     ),
 )
-async def get_vacancy_stats(
-    vacancy_id: int,
-    db: AsyncSession = Depends(get_db),
-) -> VacancyStatsResponse:
+async def get_vacancy_stats(vacancy_id: int) -> Response:
     """Get vacancy statistics.
 
+    Concurrent cache misses share one aggregation query, which runs in its
+    own session so that it can outlive the request that started it.
+
     Args:
         vacancy_id: Vacancy ID.
-        db: Database session.
 
     Returns:
-        VacancyStatsResponse: Statistics by candidate statuses.
+        Response: Serialized statistics by candidate statuses.
 
     Raises:
         HTTPException: If vacancy not found.
     """
-    # Verify vacancy exists
-    vacancy = await VacancyService.get_vacancy_by_id(db, vacancy_id)
-    if not vacancy:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Vacancy with id {vacancy_id} not found",
-        )
 
-    stats = await CandidatePoolService.get_vacancy_stats(db, vacancy_id)
-    return VacancyStatsResponse(**stats)
+    async def compute() -> tuple[bytes, None]:
+        # Aggregates the whole pool of the vacancy
+        with statement_timeouts(statement_ms=settings.db_bulk_statement_timeout_ms):
+            async with AsyncSessionLocal() as db:
+                # Verify vacancy exists
+                if await VacancyService.get_vacancy_version(db, vacancy_id) is None:
+                    raise HTTPException(
+                        status_code=status.HTTP_404_NOT_FOUND,
+                        detail=f"Vacancy with id {vacancy_id} not found",
+                    )
+                stats = await CandidatePoolService.get_vacancy_stats(db, vacancy_id)
+        return VacancyStatsResponse(**stats).model_dump_json().encode("utf-8"), None
+
+    return await get_or_compute(
+        cache_key("vacancies:stats", vacancy_id=vacancy_id),
+        tags=[
+            tag("vacancy", vacancy_id),
+            tag("vacancy"),
+            tag("vacancy_pool", vacancy_id),
+            tag("vacancy_pool"),
+        ],
+        compute=compute,
+        ttl=settings.cache_stats_ttl_seconds,
+    )
 
 
 @router.post(
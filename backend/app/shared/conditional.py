@@ -0,0 +1,138 @@
+"""HTTP conditional GET helpers (ETag / Last-Modified).
+
+Single-resource endpoints expose a weak ETag built from the row id and
+``updated_at`` together with ``Last-Modified``. Clients that send
+``If-None-Match`` or ``If-Modified-Since`` are first checked against a
+single-column ``(id, updated_at)`` query, and receive ``304 Not Modified``
+without the full row being loaded or serialized.
+"""
+
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Protocol
+
+from fastapi import Request, Response, status
+
+# Clients must revalidate, but may reuse the cached body on 304
+CACHE_CONTROL = "private, no-cache"
+
+ETAG_HEADER = "ETag"
+LAST_MODIFIED_HEADER = "Last-Modified"
+
+
+class RowVersion(Protocol):
+    """Row exposing the fields used to build validators."""
+
+    id: Any
+    updated_at: datetime
+
+
+def make_etag(row_id: Any, updated_at: datetime) -> str:
+    """Build a weak ETag from a row id and its modification time.
+
+    Args:
+        row_id: Row primary key.
+        updated_at: Row modification time.
+
+    Returns:
+        str: Weak entity tag, e.g. ``W/"42-5f1d3c8a9b2e0"``.
+    """
+    micros = int(updated_at.timestamp() * 1_000_000)
+    return f'W/"{row_id}-{micros:x}"'
+
+
+def has_preconditions(request: Request) -> bool:
+    """Check whether the request carries conditional GET headers.
+
+    Args:
+        request: HTTP request.
+
+    Returns:
+        bool: True if If-None-Match or If-Modified-Since is present.
+    """
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def is_not_modified(request: Request, etag: str, last_modified: datetime) -> bool:
+    """Evaluate If-None-Match / If-Modified-Since against current validators.
+
+    If-None-Match takes precedence; If-Modified-Since is compared at the
+    one-second resolution of HTTP dates.
+
+    Args:
+        request: HTTP request.
+        etag: Current entity tag.
+        last_modified: Current modification time.
+
+    Returns:
+        bool: True if the client copy is still fresh.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    return last_modified.replace(microsecond=0) <= since
+
+
+def validator_headers(row: RowVersion) -> dict[str, str]:
+    """Build ETag, Last-Modified and Cache-Control headers for a row.
+
+    Args:
+        row: Loaded ORM object or version row.
+
+    Returns:
+        dict[str, str]: Validator headers.
+    """
+    return {
+        ETAG_HEADER: make_etag(row.id, row.updated_at),
+        LAST_MODIFIED_HEADER: format_datetime(row.updated_at.astimezone(timezone.utc), usegmt=True),
+        "Cache-Control": CACHE_CONTROL,
+    }
+
+
+def set_validators(response: Response, row: RowVersion) -> None:
+    """Attach ETag and Last-Modified headers for a loaded row.
+
+    Args:
+        response: Response of the endpoint.
+        row: Loaded ORM object.
+    """
+    response.headers.update(validator_headers(row))
+
+
+def check_not_modified(request: Request, version: RowVersion | None) -> Response | None:
+    """Build a 304 response if the client copy matches the row version.
+
+    Args:
+        request: HTTP request.
+        version: ``(id, updated_at)`` row or None if the row does not exist.
+
+    Returns:
+        Response | None: 304 response or None if the full row must be sent.
+    """
+    if version is None:
+        return None
+    headers = validator_headers(version)
+    if not is_not_modified(request, headers[ETAG_HEADER], version.updated_at):
+        return None
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
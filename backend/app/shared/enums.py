@@ -10,6 +10,13 @@ class UserRole(str, Enum):
     RECRUITER = "recruiter"
 
 
+class TelegramEntityType(str, Enum):
+    """Kind of profile a Telegram user is registered as."""
+
+    CANDIDATE = "candidate"
+    HIRING_MANAGER = "hiring_manager"
+
+
 class VacancyStatus(str, Enum):
     """Vacancy status enumeration."""
 
@@ -28,3 +35,40 @@ class CandidatePoolStatus(str, Enum):
     FINALIST = "FINALIST"
     OFFER_SENT = "OFFER_SENT"
     REJECTED = "REJECTED"
+
+
+class PoolSortField(str, Enum):
+    """Sort fields of the vacancy pool listing."""
+
+    CREATED_AT = "created_at"
+    UPDATED_AT = "updated_at"
+    STATUS = "status"
+    CANDIDATE_FULL_NAME = "candidate_full_name"
+
+
+class PoolEmbed(str, Enum):
+    """Related records embeddable into vacancy pool entries."""
+
+    CANDIDATE = "candidate"
+    FEEDBACK = "feedback"
+
+
+class SortOrder(str, Enum):
+    """Sort direction enumeration."""
+
+    ASC = "asc"
+    DESC = "desc"
+
+
+class ExportFormat(str, Enum):
+    """Export file format enumeration."""
+
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+class ImportFormat(str, Enum):
+    """Import file format enumeration."""
+
+    CSV = "csv"
+    NDJSON = "ndjson"
@@ -0,0 +1,105 @@
+"""Streaming CSV/NDJSON exports backed by server-side cursors."""
+
+import csv
+import io
+import json
+import uuid
+from collections.abc import AsyncIterator
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, statement_timeouts
+from app.shared.enums import ExportFormat
+
+# Rows fetched from the server-side cursor per round trip
+EXPORT_BATCH_SIZE = 1000
+
+MEDIA_TYPES = {
+    # Starlette appends the charset to text/* types
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.NDJSON: "application/x-ndjson",
+}
+
+
+def _to_plain(value: Any) -> Any:
+    """Convert a column value to a JSON-compatible value."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _to_csv_cell(value: Any) -> Any:
+    """Convert a column value to a CSV cell (JSONB arrays are JSON-encoded)."""
+    value = _to_plain(value)
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+async def _iter_rows(query: Select, export_format: ExportFormat) -> AsyncIterator[str]:
+    """Stream query rows as encoded chunks, one chunk per cursor batch.
+
+    A dedicated session is opened here: the request-scoped session is
+    already closed by the time the response body is streamed. The cursor
+    runs under the bulk statement timeout.
+    """
+    async with AsyncSessionLocal() as session:
+        with statement_timeouts(statement_ms=settings.db_bulk_statement_timeout_ms):
+            result = await session.stream(
+                query, execution_options={"yield_per": EXPORT_BATCH_SIZE}
+            )
+        columns = list(result.keys())
+
+        if export_format == ExportFormat.CSV:
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(columns)
+            yield buffer.getvalue()
+            async for partition in result.partitions():
+                buffer.seek(0)
+                buffer.truncate()
+                writer.writerows(
+                    [_to_csv_cell(value) for value in row] for row in partition
+                )
+                yield buffer.getvalue()
+        else:
+            async for partition in result.partitions():
+                yield "".join(
+                    json.dumps(
+                        {column: _to_plain(value) for column, value in zip(columns, row)},
+                        ensure_ascii=False,
+                    )
+                    + "\n"
+                    for row in partition
+                )
+
+
+def export_response(
+    query: Select, export_format: ExportFormat, filename: str
+) -> StreamingResponse:
+    """Build a streaming export response for a column-projected query.
+
+    Args:
+        query: Select statement over plain columns (not ORM entities).
+        export_format: Output format.
+        filename: Download file name without extension.
+
+    Returns:
+        StreamingResponse: Response streaming the rows as they are fetched.
+    """
+    return StreamingResponse(
+        _iter_rows(query, export_format),
+        media_type=MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}.{export_format.value}"'
+        },
+    )
@@ -0,0 +1,178 @@
+"""Keyset (cursor) pagination helpers.
+
+List endpoints are ordered by ``(created_at, id)`` and paginated with an
+opaque cursor that encodes the sort key of the last returned row. Unlike
+OFFSET, the cost of fetching a page does not grow with its depth, and rows
+inserted between requests never shift pages.
+
+Endpoints with a selectable sort order use :func:`paginate_by` and
+:func:`split_page_by` with any non-nullable sort column, ``id`` breaking ties.
+"""
+
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from datetime import datetime
+from enum import Enum
+from typing import Any, TypeVar
+
+from sqlalchemy import ColumnElement, Select, tuple_
+
+from app.core.exceptions import BadRequestException
+
+T = TypeVar("T")
+
+# Response header carrying the cursor of the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(sort_value: Any, row_id: Any) -> str:
+    """Encode the sort key of a row into an opaque cursor.
+
+    Args:
+        sort_value: Sort column value of the row, e.g. its creation time.
+        row_id: Row primary key (int or UUID).
+
+    Returns:
+        str: URL-safe cursor string.
+    """
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    elif isinstance(sort_value, Enum):
+        sort_value = sort_value.value
+    raw = json.dumps([sort_value, str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[Any, str]:
+    """Decode an opaque cursor produced by :func:`encode_cursor`.
+
+    Args:
+        cursor: Cursor string from the client.
+
+    Returns:
+        tuple[Any, str]: JSON sort value and raw primary key.
+
+    Raises:
+        BadRequestException: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return sort_value, row_id
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise BadRequestException("Invalid pagination cursor")
+
+
+def _coerce(column: ColumnElement, raw: Any) -> Any:
+    """Convert a decoded cursor value to the Python type of a column."""
+    python_type = column.type.python_type
+    try:
+        if python_type is datetime:
+            return datetime.fromisoformat(raw)
+        return python_type(raw)
+    except (TypeError, ValueError):
+        raise BadRequestException("Invalid pagination cursor")
+
+
+def paginate_by(
+    query: Select,
+    sort_column: ColumnElement,
+    id_column: ColumnElement,
+    cursor: str | None,
+    limit: int,
+    descending: bool = False,
+    skip: int = 0,
+) -> Select:
+    """Apply stable ``(sort_column, id)`` ordering and keyset filtering.
+
+    Fetches ``limit + 1`` rows so that :func:`split_page_by` can tell whether
+    another page exists without a COUNT query. The legacy ``skip`` offset is
+    only accepted for pages without a cursor: after a cursor it would skip
+    rows past the previous page.
+
+    Args:
+        query: Base select statement.
+        sort_column: Non-nullable column to sort by.
+        id_column: Primary key column breaking ties.
+        cursor: Cursor of the previous page or None for the first page.
+        limit: Page size.
+        descending: Sort in descending order.
+        skip: Number of rows to skip (legacy offset pagination).
+
+    Returns:
+        Select: Paginated select statement.
+
+    Raises:
+        BadRequestException: If the cursor is malformed or combined with skip.
+    """
+    if cursor and skip:
+        raise BadRequestException("skip cannot be combined with cursor")
+    if cursor:
+        raw_value, raw_id = decode_cursor(cursor)
+        key = tuple_(_coerce(sort_column, raw_value), _coerce(id_column, raw_id))
+        row_key = tuple_(sort_column, id_column)
+        query = query.where(row_key < key if descending else row_key > key)
+    if descending:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_column, id_column)
+    if skip:
+        query = query.offset(skip)
+    return query.limit(limit + 1)
+
+
+def split_page_by(
+    rows: Sequence[T], limit: int, sort_key: str, id_key: str = "id"
+) -> tuple[list[T], str | None]:
+    """Trim the look-ahead row and build the next cursor.
+
+    Args:
+        rows: Rows fetched by a :func:`paginate_by` query.
+        limit: Page size.
+        sort_key: Attribute of a row holding the sort value.
+        id_key: Attribute of a row holding the primary key.
+
+    Returns:
+        tuple[list, str | None]: Page items and cursor of the next page.
+    """
+    items = list(rows[:limit])
+    if len(rows) <= limit or not items:
+        return items, None
+    last = items[-1]
+    return items, encode_cursor(getattr(last, sort_key), getattr(last, id_key))
+
+
+def paginate_by_created_at(
+    query: Select, model: Any, cursor: str | None, limit: int, skip: int = 0
+) -> Select:
+    """Apply stable ``(created_at, id)`` ordering and keyset filtering.
+
+    Args:
+        query: Base select statement.
+        model: ORM model with ``created_at`` and ``id`` columns.
+        cursor: Cursor of the previous page or None for the first page.
+        limit: Page size.
+        skip: Number of rows to skip (legacy offset pagination).
+
+    Returns:
+        Select: Paginated select statement.
+
+    Raises:
+        BadRequestException: If the cursor is malformed or combined with skip.
+    """
+    return paginate_by(query, model.created_at, model.id, cursor, limit, skip=skip)
+
+
+def split_page(rows: Sequence[T], limit: int) -> tuple[list[T], str | None]:
+    """Trim the look-ahead row and build the next cursor.
+
+    Args:
+        rows: Rows fetched by a :func:`paginate_by_created_at` query.
+        limit: Page size.
+
+    Returns:
+        tuple[list, str | None]: Page items and cursor of the next page.
+    """
+    return split_page_by(rows, limit, "created_at")
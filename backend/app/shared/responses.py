@@ -0,0 +1,56 @@
+"""JSON responses serialized by pydantic-core.
+
+When a handler returns data, FastAPI dumps returned models to dicts,
+validates them again against ``response_model``, converts the result to
+JSON-compatible Python objects and only then encodes it with the
+standard-library ``json``. Hot endpoints return a ready :class:`Response`
+instead, which FastAPI sends as is: ORM objects are validated exactly once
+through a module-level ``TypeAdapter`` and encoded in Rust by pydantic-core,
+and models that are already validated are encoded directly. Routes keep
+``response_model`` for the OpenAPI schema.
+"""
+
+from typing import Any
+
+import pydantic_core
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+
+class PydanticJSONResponse(JSONResponse):
+    """JSON response encoded by pydantic-core.
+
+    Accepts models, containers of models and plain JSON-compatible data
+    (UUIDs, datetimes and enums included). It is the application's default
+    response class.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Encode content as UTF-8 JSON."""
+        return pydantic_core.to_json(content)
+
+
+def orm_json_response(
+    adapter: TypeAdapter[Any],
+    data: Any,
+    status_code: int = 200,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """Validate ORM objects once and return them as a ready JSON response.
+
+    Args:
+        adapter: Module-level adapter of the response type, e.g. ``list[TrackResponse]``.
+        data: ORM object(s) matching the adapter type.
+        status_code: HTTP status code.
+        headers: Response headers.
+
+    Returns:
+        Response: JSON response.
+    """
+    return Response(
+        content=adapter.dump_json(adapter.validate_python(data, from_attributes=True)),
+        status_code=status_code,
+        media_type="application/json",
+        headers=headers,
+    )
@@ -0,0 +1,112 @@
+"""Typeahead lookups over ``pg_trgm`` indexes.
+
+Search-as-you-type fires a request per keystroke, so lookups are damped on
+the server: queries shorter than a trigram are answered with an empty list
+without touching the database, identical concurrent lookups share one
+query, and results are cached for a few seconds, so recruiters typing the
+same prefix reuse each other's results. Matching uses trigram word
+similarity, which tolerates typos and partial words and is served by GIN
+``gin_trgm_ops`` indexes instead of a sequential ``ILIKE '%..%'`` scan.
+"""
+
+import re
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+from fastapi import Response
+from pydantic import TypeAdapter
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import cache_key, get_or_compute, tag
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, statement_timeouts
+
+# Shorter queries have no complete trigram and cannot use the indexes
+MIN_QUERY_LENGTH = 3
+
+MAX_LIMIT = 20
+
+_PHONE_QUERY = re.compile(r"[\d\s()+\-]+")
+
+
+def normalize_query(query: str) -> str:
+    """Collapse whitespace and case so equivalent queries share cache entries.
+
+    Args:
+        query: Raw query text.
+
+    Returns:
+        str: Normalized query.
+    """
+    return " ".join(query.split()).lower()
+
+
+def phone_digits(query: str) -> str | None:
+    """Extract digits from a query that looks like a phone fragment.
+
+    Args:
+        query: Normalized query text.
+
+    Returns:
+        str | None: Digits, or None if the query is not a phone fragment.
+    """
+    if not _PHONE_QUERY.fullmatch(query):
+        return None
+    digits = re.sub(r"\D", "", query)
+    return digits if len(digits) >= MIN_QUERY_LENGTH else None
+
+
+async def set_similarity_threshold(db: AsyncSession) -> None:
+    """Set the word similarity threshold of the ``<%`` operator for the transaction.
+
+    Args:
+        db: Database session.
+    """
+    await db.execute(
+        select(
+            func.set_config(
+                "pg_trgm.word_similarity_threshold",
+                str(settings.typeahead_similarity_threshold),
+                True,
+            )
+        )
+    )
+
+
+async def typeahead_response(
+    namespace: str,
+    query: str,
+    limit: int,
+    adapter: TypeAdapter[Any],
+    search: Callable[[AsyncSession, str, int], Awaitable[Sequence[Any]]],
+) -> Response:
+    """Run a debounced typeahead lookup.
+
+    Args:
+        namespace: Cache namespace and tag, e.g. ``candidates:typeahead``.
+        query: Raw query text.
+        limit: Maximum number of results.
+        adapter: Adapter of the response list type.
+        search: Service lookup called with a session, normalized query and limit.
+
+    Returns:
+        Response: Serialized matches, best first.
+    """
+    query = normalize_query(query)
+    limit = min(limit, MAX_LIMIT)
+    if len(query) < MIN_QUERY_LENGTH:
+        return Response(content=b"[]", media_type="application/json")
+
+    async def compute() -> tuple[bytes, None]:
+        with statement_timeouts(statement_ms=settings.typeahead_statement_timeout_ms):
+            async with AsyncSessionLocal() as session:
+                rows = await search(session, query, limit)
+        return adapter.dump_json(adapter.validate_python(rows, from_attributes=True)), None
+
+    return await get_or_compute(
+        cache_key(namespace, q=query, limit=limit),
+        [tag(namespace)],
+        compute,
+        ttl=settings.typeahead_cache_ttl_seconds,
+    )
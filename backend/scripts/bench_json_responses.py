@@ -0,0 +1,174 @@
+"""Micro-benchmark of list response serialization.
+
+Compares, for the bodies of ``GET /api/candidates/`` and
+``GET /api/candidate-pools/``, the FastAPI default path (``model_validate``
+in the handler, revalidation against ``response_model``, stdlib ``json``)
+with the fast path used by the handlers (:func:`orm_json_response` over
+ORM entities and over column-projected rows). Rows are transient objects,
+so no database is needed; only serialization is measured.
+
+Usage (from backend/)::
+
+    poetry run python -m scripts.bench_json_responses --rows 100 --repeat 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from types import SimpleNamespace
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.modules.candidates.models import Candidate
+from app.modules.candidates.router import candidate_list_adapter
+from app.modules.candidates.schemas import CandidateResponse
+from app.modules.hiring_managers.models import HiringManager  # noqa: F401
+from app.modules.vacancies.models import CandidatePool
+from app.modules.vacancies.pools_router import pool_details_list_adapter
+from app.modules.vacancies.schemas import CandidatePoolResponse, CandidatePoolWithDetailsResponse
+from app.shared.enums import CandidatePoolStatus
+from app.shared.responses import orm_json_response
+
+
+def make_candidates(rows: int) -> list[Candidate]:
+    """Build transient candidates with realistic field sizes."""
+    now = datetime.now(timezone.utc)
+    return [
+        Candidate(
+            id=uuid.uuid4(),
+            telegram_id=1_000_000 + index,
+            full_name=f"Кандидат Тестовый {index}",
+            phone="+79990000000",
+            location="Москва",
+            preferred_tracks=[1, 2],
+            university="НИУ ВШЭ",
+            course=3,
+            achievements=["Хакатон X5", "Олимпиада по программированию"],
+            domains=["backend", "data"],
+            created_at=now,
+            updated_at=now,
+        )
+        for index in range(rows)
+    ]
+
+
+def make_pool_rows(candidates: list[Candidate]) -> list[tuple[CandidatePool, Candidate]]:
+    """Build transient pool entries joined with their candidates."""
+    now = datetime.now(timezone.utc)
+    return [
+        (
+            CandidatePool(
+                id=uuid.uuid4(),
+                vacancy_id=1,
+                candidate_id=candidate.id,
+                status=CandidatePoolStatus.SELECTED,
+                notes="Сильный кандидат",
+                created_at=now,
+                updated_at=now,
+            ),
+            candidate,
+        )
+        for candidate in candidates
+    ]
+
+
+def pool_models(rows: list[tuple[CandidatePool, Candidate]]) -> list[CandidatePoolWithDetailsResponse]:
+    """Build pool response models field by field from entities (previous handler)."""
+    return [
+        CandidatePoolWithDetailsResponse(
+            id=pool.id,
+            vacancy_id=pool.vacancy_id,
+            candidate_id=pool.candidate_id,
+            status=pool.status,
+            interview_scheduled_at=pool.interview_scheduled_at,
+            interview_link=pool.interview_link,
+            notes=pool.notes,
+            created_at=pool.created_at,
+            updated_at=pool.updated_at,
+            candidate_full_name=candidate.full_name,
+            candidate_phone=candidate.phone,
+            candidate_location=candidate.location,
+        )
+        for pool, candidate in rows
+    ]
+
+
+def pool_projection(rows: list[tuple[CandidatePool, Candidate]]) -> list[SimpleNamespace]:
+    """Build rows shaped like the column-projected pool query."""
+    return [
+        SimpleNamespace(
+            **{name: getattr(pool, name) for name in CandidatePoolResponse.model_fields},
+            candidate_full_name=candidate.full_name,
+            candidate_phone=candidate.phone,
+            candidate_location=candidate.location,
+        )
+        for pool, candidate in rows
+    ]
+
+
+async def measure(fn: Callable[[], Awaitable[bytes]], repeat: int) -> tuple[float, int]:
+    """Run a serializer repeatedly.
+
+    Returns:
+        tuple: Median time in milliseconds and body size in bytes.
+    """
+    timings = []
+    body = b""
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = await fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), len(body)
+
+
+async def main(rows: int, repeat: int) -> None:
+    """Benchmark both endpoints and print the medians."""
+    candidates = make_candidates(rows)
+    pool_rows = make_pool_rows(candidates)
+    projected_rows = pool_projection(pool_rows)
+    candidate_field = create_response_field("candidates", list[CandidateResponse])
+    pool_field = create_response_field("pools", list[CandidatePoolWithDetailsResponse])
+
+    async def candidates_default() -> bytes:
+        content = [CandidateResponse.model_validate(c) for c in candidates]
+        return JSONResponse(
+            await serialize_response(field=candidate_field, response_content=content)
+        ).body
+
+    async def candidates_fast() -> bytes:
+        return orm_json_response(candidate_list_adapter, candidates).body
+
+    async def pools_default() -> bytes:
+        return JSONResponse(
+            await serialize_response(field=pool_field, response_content=pool_models(pool_rows))
+        ).body
+
+    async def pools_fast() -> bytes:
+        return orm_json_response(pool_details_list_adapter, projected_rows).body
+
+    benchmarks = [
+        ("GET /api/candidates/", candidates_default, candidates_fast),
+        ("GET /api/candidate-pools/", pools_default, pools_fast),
+    ]
+    print(f"rows={rows} repeat={repeat}")
+    for name, default, fast in benchmarks:
+        default_ms, default_size = await measure(default, repeat)
+        fast_ms, fast_size = await measure(fast, repeat)
+        print(
+            f"{name:<28} default={default_ms:.3f}ms ({default_size} B)  "
+            f"fast={fast_ms:.3f}ms ({fast_size} B)  speedup={default_ms / fast_ms:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark list response serialization")
+    parser.add_argument("--rows", type=int, default=100, help="Rows per response")
+    parser.add_argument("--repeat", type=int, default=200, help="Runs per path")
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.repeat))
@@ -0,0 +1,144 @@
+"""Benchmark of the swipe loop: ORM service path versus the Core fast lane.
+
+Seeds a track, a hiring manager, two vacancies and ``--candidates``
+candidates inside one transaction, then swipes through every candidate of
+each vacancy: ``next-candidate`` followed by a ``skip``. The ORM path uses
+:class:`CandidatePoolService` and validates the ORM objects into response
+models, the fast lane uses :class:`SwipeFastLane`. The transaction is
+rolled back at the end, so the database is left untouched.
+
+CPU time (``time.process_time``) per swipe is the number to compare; wall
+time also includes Postgres execution, which is the same for both paths.
+
+Usage (from backend/, against a migrated database)::
+
+    poetry run python -m scripts.bench_swipe_fast_lane --candidates 500
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+
+from app.core.database import AsyncSessionLocal
+from app.modules.candidates.models import Candidate
+from app.modules.candidates.schemas import CandidateResponse
+from app.modules.hiring_managers.models import HiringManager
+from app.modules.vacancies.fast_lane import SwipeFastLane
+from app.modules.vacancies.models import Track, Vacancy
+from app.modules.vacancies.schemas import CandidatePoolResponse
+from app.modules.vacancies.service import CandidatePoolService
+from app.shared.enums import CandidatePoolStatus, VacancyStatus
+
+# Telegram IDs far outside the real range, so seeding never collides
+SEED_TELEGRAM_ID = 9_000_000_000_000
+
+
+async def orm_swipe(db, vacancy_id: int) -> bool:
+    """One swipe through the ORM service layer."""
+    candidate = await CandidatePoolService.get_next_unviewed_candidate(db, vacancy_id)
+    if candidate is None:
+        return False
+    CandidateResponse.model_validate(candidate)
+    entry = await CandidatePoolService.add_candidate_with_status(
+        db, vacancy_id, candidate.id, CandidatePoolStatus.VIEWED
+    )
+    CandidatePoolResponse.model_validate(entry)
+    return True
+
+
+async def fast_lane_swipe(db, vacancy_id: int) -> bool:
+    """One swipe through the Core fast lane."""
+    candidate = await SwipeFastLane.next_candidate(db, vacancy_id)
+    if candidate is None:
+        return False
+    await SwipeFastLane.add_to_pool(db, vacancy_id, candidate.id, CandidatePoolStatus.VIEWED)
+    return True
+
+
+async def run_path(
+    db, vacancy_id: int, swipe: Callable[..., Awaitable[bool]]
+) -> tuple[list[float], list[float]]:
+    """Swipe until the vacancy runs out of candidates.
+
+    Returns:
+        tuple: CPU and wall times of every swipe in milliseconds.
+    """
+    cpu_ms: list[float] = []
+    wall_ms: list[float] = []
+    while True:
+        cpu_started, wall_started = time.process_time(), time.perf_counter()
+        if not await swipe(db, vacancy_id):
+            return cpu_ms, wall_ms
+        cpu_ms.append((time.process_time() - cpu_started) * 1000)
+        wall_ms.append((time.perf_counter() - wall_started) * 1000)
+
+
+async def seed(db, candidates: int) -> tuple[int, int]:
+    """Create benchmark rows in the open transaction.
+
+    Returns:
+        tuple: IDs of the ORM-path and fast-lane vacancies.
+    """
+    track = Track(name=f"bench-{uuid.uuid4().hex[:8]}", is_active=True)
+    manager = HiringManager(
+        telegram_id=SEED_TELEGRAM_ID, first_name="Bench", last_name="Manager"
+    )
+    db.add_all([track, manager])
+    await db.flush()
+    vacancies = [
+        Vacancy(
+            track_id=track.id,
+            hiring_manager_id=manager.id,
+            description="Benchmark vacancy",
+            status=VacancyStatus.ACTIVE,
+        )
+        for _ in range(2)
+    ]
+    db.add_all(vacancies)
+    db.add_all(
+        Candidate(
+            telegram_id=SEED_TELEGRAM_ID + index + 1,
+            full_name=f"Bench Candidate {index}",
+            preferred_tracks=[track.id],
+            achievements=[],
+            domains=[],
+        )
+        for index in range(candidates)
+    )
+    await db.flush()
+    db.expunge_all()
+    return vacancies[0].id, vacancies[1].id
+
+
+def report(name: str, cpu_ms: list[float], wall_ms: list[float]) -> None:
+    """Print median and p95 of a path."""
+    def p95(values: list[float]) -> float:
+        return statistics.quantiles(values, n=20)[-1]
+
+    print(
+        f"{name:<10} swipes={len(cpu_ms):<6} "
+        f"cpu median={statistics.median(cpu_ms):.3f}ms p95={p95(cpu_ms):.3f}ms  "
+        f"wall median={statistics.median(wall_ms):.3f}ms p95={p95(wall_ms):.3f}ms"
+    )
+
+
+async def main(candidates: int) -> None:
+    """Seed, benchmark both paths and roll back."""
+    async with AsyncSessionLocal() as db:
+        try:
+            orm_vacancy_id, fast_vacancy_id = await seed(db, candidates)
+            # Existing candidates are swiped too; both vacancies see the same set
+            report("orm", *await run_path(db, orm_vacancy_id, orm_swipe))
+            report("fast-lane", *await run_path(db, fast_vacancy_id, fast_lane_swipe))
+        finally:
+            await db.rollback()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the swipe loop")
+    parser.add_argument("--candidates", type=int, default=500, help="Candidates to seed")
+    args = parser.parse_args()
+    asyncio.run(main(args.candidates))
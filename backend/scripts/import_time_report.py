@@ -0,0 +1,110 @@
+"""Report where API worker import time goes.
+
+Runs ``python -X importtime -c "import app.main"`` in a fresh interpreter and
+aggregates the self time of every imported module by top-level package,
+plus the slowest modules by cumulative time.
+
+Usage (from backend/)::
+
+    poetry run python scripts/import_time_report.py
+    poetry run python scripts/import_time_report.py --module app.modules.candidates.router --top 30
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+LINE_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+@dataclass
+class ImportRecord:
+    """One line of ``-X importtime`` output."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def run_importtime(module: str) -> list[ImportRecord]:
+    """Import a module in a fresh interpreter and parse ``-X importtime``.
+
+    Args:
+        module: Module to import.
+
+    Returns:
+        list[ImportRecord]: Imported modules in import order.
+    """
+    env = os.environ.copy()
+    env.setdefault("SECRET_KEY", "import-time-report")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    records = []
+    for line in result.stderr.splitlines():
+        match = LINE_RE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            records.append(
+                ImportRecord(name, int(self_us), int(cumulative_us), (len(indent) - 1) // 2)
+            )
+    return records
+
+
+def by_package(records: list[ImportRecord]) -> dict[str, int]:
+    """Sum self time per top-level package.
+
+    Args:
+        records: Parsed import records.
+
+    Returns:
+        dict[str, int]: Microseconds per package, slowest first.
+    """
+    totals: defaultdict[str, int] = defaultdict(int)
+    for record in records:
+        totals[record.module.split(".")[0]] += record.self_us
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def main() -> None:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Import-time report for the API worker")
+    parser.add_argument("--module", default="app.main", help="Module to import")
+    parser.add_argument("--top", type=int, default=20, help="Rows per table")
+    args = parser.parse_args()
+
+    records = run_importtime(args.module)
+    total_us = sum(record.self_us for record in records)
+    print(f"Total import time of {args.module}: {total_us / 1000:.1f} ms "
+          f"({len(records)} modules)\n")
+
+    print(f"{'package':<32}{'self ms':>10}{'share':>8}")
+    for package, self_us in list(by_package(records).items())[: args.top]:
+        print(f"{package:<32}{self_us / 1000:>10.1f}{self_us / total_us:>8.1%}")
+
+    print(f"\n{'module (cumulative)':<56}{'ms':>10}")
+    slowest = sorted(records, key=lambda record: record.cumulative_us, reverse=True)
+    for record in slowest[: args.top]:
+        print(f"{record.module:<56}{record.cumulative_us / 1000:>10.1f}")
+
+    print(f"\n{'app module (cumulative)':<56}{'ms':>10}")
+    own = [record for record in slowest if record.module.split(".")[0] == "app"]
+    for record in own[: args.top]:
+        print(f"{record.module:<56}{record.cumulative_us / 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Startup-time budget check for the API worker.
+
+Imports ``app.main`` and builds the application in fresh interpreters,
+takes the median wall time over several runs and fails if it exceeds the
+budget. It also fails if any heavy integration that only bots and task
+workers need (Celery, python-telegram-bot, HTTP/ML clients) was imported.
+
+Usage (from backend/)::
+
+    poetry run python scripts/startup_budget.py --budget-ms 1500 --runs 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Top-level packages the API worker must not import at startup
+FORBIDDEN_PACKAGES = ("celery", "kombu", "telegram", "httpx", "httpcore")
+
+PROBE = f"""
+import json, sys, time
+started = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - started
+forbidden = sorted(
+    name for name in sys.modules if name.split(".")[0] in {FORBIDDEN_PACKAGES!r}
+)
+print(json.dumps({{"elapsed_ms": elapsed * 1000, "forbidden": forbidden}}))
+"""
+
+
+def measure_once() -> dict:
+    """Import the app in a fresh interpreter.
+
+    Returns:
+        dict: Import time in milliseconds and forbidden modules imported.
+    """
+    env = os.environ.copy()
+    env.setdefault("SECRET_KEY", "startup-budget")
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    """CLI entry point; exits with status 1 if the budget is exceeded."""
+    parser = argparse.ArgumentParser(description="Assert the API worker startup budget")
+    parser.add_argument("--budget-ms", type=float, default=1500.0, help="Median import budget")
+    parser.add_argument("--runs", type=int, default=5, help="Number of fresh interpreters")
+    args = parser.parse_args()
+
+    samples = [measure_once() for _ in range(args.runs)]
+    timings = [sample["elapsed_ms"] for sample in samples]
+    median = statistics.median(timings)
+    forbidden = sorted({name for sample in samples for name in sample["forbidden"]})
+
+    print(f"import app.main: median {median:.0f} ms, "
+          f"min {min(timings):.0f} ms, max {max(timings):.0f} ms, budget {args.budget_ms:.0f} ms")
+    failed = False
+    if median > args.budget_ms:
+        print("FAIL: startup budget exceeded; see scripts/import_time_report.py")
+        failed = True
+    if forbidden:
+        print(f"FAIL: heavy integrations imported at startup: {', '.join(forbidden)}")
+        failed = True
+    if failed:
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
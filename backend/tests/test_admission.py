@@ -0,0 +1,81 @@
+"""Load shedding and database timeout responses."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import DBAPIError, IntegrityError, TimeoutError as PoolTimeoutError
+
+from app.core.admission import AdmissionControlMiddleware
+
+
+class FakePool:
+    waiting = 0
+
+
+class DriverError(Exception):
+    def __init__(self, sqlstate: str) -> None:
+        super().__init__(sqlstate)
+        self.sqlstate = sqlstate
+
+
+ERRORS = {
+    "statement-timeout": DBAPIError("SELECT", {}, DriverError("57014")),
+    "lock-timeout": DBAPIError("UPDATE", {}, DriverError("55P03")),
+    "pool-timeout": PoolTimeoutError("QueuePool limit reached"),
+    "unique-violation": IntegrityError("INSERT", {}, DriverError("23505")),
+    "data-error": DBAPIError("SELECT", {}, DriverError("22P02")),
+}
+
+
+@pytest.fixture
+def pool() -> FakePool:
+    return FakePool()
+
+
+@pytest.fixture
+def client(pool) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(AdmissionControlMiddleware, pool=pool, max_waiters=2, exempt_paths=["/"])
+
+    @app.get("/")
+    async def health() -> dict[str, str]:
+        return {"status": "ok"}
+
+    @app.get("/fail/{error}")
+    async def fail(error: str) -> None:
+        raise ERRORS[error]
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def rows():
+            yield b"first\n"
+            raise ERRORS["statement-timeout"]
+
+        return StreamingResponse(rows())
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+@pytest.mark.parametrize("error", ["statement-timeout", "lock-timeout", "pool-timeout"])
+def test_timeouts_are_503(client, error):
+    response = client.get(f"/fail/{error}")
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"]
+
+
+@pytest.mark.parametrize("error", ["unique-violation", "data-error"])
+def test_other_database_errors_are_500(client, error):
+    assert client.get(f"/fail/{error}").status_code == 500
+
+
+def test_timeout_after_response_started_is_not_rewritten(client):
+    assert client.get("/stream").status_code == 200
+
+
+def test_full_wait_queue_rejects_all_but_exempt_paths(client, pool):
+    pool.waiting = 2
+
+    assert client.get("/fail/data-error").status_code == 503
+    assert client.get("/").status_code == 200
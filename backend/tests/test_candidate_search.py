@@ -0,0 +1,84 @@
+"""Full-text and JSONB-filtered candidate search."""
+
+import uuid
+
+import pytest
+
+from app.core.exceptions import BadRequestException
+from app.modules.candidates.models import Candidate
+from app.modules.candidates.service import CandidateService
+
+
+@pytest.fixture
+def token() -> str:
+    """Word no other row contains, so results do not depend on existing data."""
+    return f"zq{uuid.uuid4().hex[:12]}"
+
+
+async def _candidates(db, *profiles: dict) -> list[Candidate]:
+    candidates = [
+        Candidate(telegram_id=uuid.uuid4().int % 10**12, **profile) for profile in profiles
+    ]
+    db.add_all(candidates)
+    await db.flush()
+    return candidates
+
+
+async def test_name_matches_rank_above_achievements(db, token):
+    by_achievement, by_name = await _candidates(
+        db,
+        {"full_name": "Иванов Иван", "achievements": [f"Автор проекта {token}"]},
+        {"full_name": f"Петров {token}"},
+    )
+
+    rows, cursor = await CandidateService.search_candidates(db, query=token)
+
+    assert [row.id for row in rows] == [by_name.id, by_achievement.id]
+    assert rows[0].rank > rows[1].rank
+    assert cursor is None
+
+
+async def test_ranked_pages_follow_cursor(db, token):
+    candidates = await _candidates(
+        db, *({"full_name": f"Кандидат {token}", "university": token} for _ in range(3))
+    )
+
+    first, cursor = await CandidateService.search_candidates(db, query=token, limit=2)
+    second, _ = await CandidateService.search_candidates(db, query=token, limit=2, cursor=cursor)
+
+    assert len(first) == 2 and len(second) == 1
+    assert {row.id for row in first + second} == {candidate.id for candidate in candidates}
+
+
+async def test_jsonb_and_location_filters(db, token):
+    match, _, _ = await _candidates(
+        db,
+        {
+            "full_name": token,
+            "domains": ["ML", "Backend"],
+            "preferred_tracks": [2, 1],
+            "location": "Москва, Россия",
+            "course": 3,
+        },
+        {"full_name": token, "domains": ["ML"], "preferred_tracks": [2, 1], "course": 3},
+        {"full_name": token, "domains": ["ML", "Backend"], "location": "Санкт-Петербург"},
+    )
+
+    rows, _ = await CandidateService.search_candidates(
+        db, query=token, domains=["Backend", "ML"], preferred_tracks=[1], course=3, location="моск"
+    )
+
+    assert [row.id for row in rows] == [match.id]
+
+
+async def test_location_prefix_is_literal(db, token):
+    await _candidates(db, {"full_name": token, "location": "Москва"})
+
+    rows, _ = await CandidateService.search_candidates(db, query=token, location="%ква")
+
+    assert rows == []
+
+
+async def test_invalid_cursor(db):
+    with pytest.raises(BadRequestException):
+        await CandidateService.search_candidates(db, query="python", cursor="garbage")
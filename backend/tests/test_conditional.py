@@ -0,0 +1,100 @@
+"""Conditional GET validators and precedence."""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+
+import pytest
+from starlette.requests import Request
+
+from app.shared.conditional import (
+    check_not_modified,
+    has_preconditions,
+    is_not_modified,
+    make_etag,
+    validator_headers,
+)
+
+UPDATED_AT = datetime(2026, 10, 19, 12, 0, 0, 500_000, tzinfo=timezone.utc)
+ETAG = make_etag(42, UPDATED_AT)
+
+
+def _request(**headers: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "headers": [
+                (name.replace("_", "-").lower().encode(), value.encode())
+                for name, value in headers.items()
+            ],
+        }
+    )
+
+
+def _http_date(moment: datetime) -> str:
+    return format_datetime(moment, usegmt=True)
+
+
+def test_etag_changes_with_updated_at():
+    assert ETAG.startswith('W/"42-')
+    assert make_etag(42, UPDATED_AT + timedelta(microseconds=1)) != ETAG
+
+
+@pytest.mark.parametrize(
+    "if_none_match",
+    [ETAG, ETAG.removeprefix("W/"), f'"other", {ETAG}', "*"],
+)
+def test_if_none_match_matches(if_none_match):
+    assert is_not_modified(_request(if_none_match=if_none_match), ETAG, UPDATED_AT)
+
+
+def test_if_none_match_mismatch():
+    assert not is_not_modified(_request(if_none_match='W/"42-0"'), ETAG, UPDATED_AT)
+
+
+def test_if_none_match_takes_precedence_over_if_modified_since():
+    fresh_date = _http_date(UPDATED_AT + timedelta(days=1))
+    stale_date = _http_date(UPDATED_AT - timedelta(days=1))
+
+    assert not is_not_modified(
+        _request(if_none_match='W/"42-0"', if_modified_since=fresh_date), ETAG, UPDATED_AT
+    )
+    assert is_not_modified(
+        _request(if_none_match=ETAG, if_modified_since=stale_date), ETAG, UPDATED_AT
+    )
+
+
+def test_if_modified_since_uses_second_resolution():
+    # The HTTP date drops the microseconds of updated_at
+    same_second = _http_date(UPDATED_AT)
+
+    assert is_not_modified(_request(if_modified_since=same_second), ETAG, UPDATED_AT)
+    assert not is_not_modified(
+        _request(if_modified_since=_http_date(UPDATED_AT - timedelta(seconds=1))), ETAG, UPDATED_AT
+    )
+
+
+@pytest.mark.parametrize("if_modified_since", ["yesterday", "Mon, 19 Oct 2026 12:00:00"])
+def test_unusable_if_modified_since(if_modified_since):
+    assert not is_not_modified(_request(if_modified_since=if_modified_since), ETAG, UPDATED_AT)
+
+
+def test_no_preconditions():
+    request = _request()
+
+    assert not has_preconditions(request)
+    assert not is_not_modified(request, ETAG, UPDATED_AT)
+    assert has_preconditions(_request(if_modified_since=_http_date(UPDATED_AT)))
+
+
+def test_check_not_modified_returns_304_with_validators():
+    version = SimpleNamespace(id=42, updated_at=UPDATED_AT)
+
+    response = check_not_modified(_request(if_none_match=ETAG), version)
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == ETAG
+    assert response.headers["last-modified"] == validator_headers(version)["Last-Modified"]
+    assert check_not_modified(_request(if_none_match='W/"42-0"'), version) is None
+    assert check_not_modified(_request(if_none_match=ETAG), None) is None
@@ -0,0 +1,97 @@
+"""Connection timeouts, per-transaction overrides and pool wait accounting."""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from app.core.config import settings
+from app.core.database import SERVER_SETTINGS, CountingQueuePool, statement_timeouts
+
+
+@pytest.fixture
+async def small_engine() -> AsyncIterator[AsyncEngine]:
+    """Engine with a single pooled connection and no overflow."""
+    engine = create_async_engine(
+        settings.database_url,
+        poolclass=CountingQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        connect_args={"server_settings": SERVER_SETTINGS},
+    )
+    try:
+        async with engine.connect():
+            pass
+    except (OSError, DBAPIError) as exc:
+        await engine.dispose()
+        pytest.skip(f"Test database is not available: {exc}")
+    yield engine
+    await engine.dispose()
+
+
+async def _timeouts(session: AsyncSession) -> tuple[str, str]:
+    # pg_settings reports both in ms
+    result = await session.execute(
+        text(
+            "SELECT name, setting FROM pg_settings "
+            "WHERE name IN ('statement_timeout', 'lock_timeout')"
+        )
+    )
+    settings_ms = dict(result.all())
+    return settings_ms["statement_timeout"], settings_ms["lock_timeout"]
+
+
+async def test_connections_start_with_interactive_limits(small_engine):
+    async with AsyncSession(small_engine) as session:
+        assert await _timeouts(session) == (
+            str(settings.db_statement_timeout_ms),
+            str(settings.db_lock_timeout_ms),
+        )
+
+
+async def test_overrides_apply_per_transaction(small_engine):
+    with statement_timeouts(statement_ms=60000, lock_ms=0):
+        async with AsyncSession(small_engine) as session:
+            assert await _timeouts(session) == ("60000", "0")
+    with statement_timeouts(statement_ms=60000):
+        async with AsyncSession(small_engine) as session:
+            assert await _timeouts(session) == ("60000", str(settings.db_lock_timeout_ms))
+    # SET LOCAL: the pooled connection is returned with its own limits
+    async with AsyncSession(small_engine) as session:
+        assert await _timeouts(session) == (
+            str(settings.db_statement_timeout_ms),
+            str(settings.db_lock_timeout_ms),
+        )
+
+
+async def test_no_override_costs_no_statement(small_engine):
+    executed: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        executed.append(statement)
+
+    event.listen(small_engine.sync_engine, "before_cursor_execute", record)
+    with statement_timeouts():
+        async with AsyncSession(small_engine) as session:
+            await session.execute(text("SELECT 1"))
+
+    assert executed == ["SELECT 1"]
+
+
+async def test_only_callers_of_exhausted_pool_wait(small_engine):
+    pool = small_engine.pool
+
+    async with small_engine.connect():
+        assert pool.waiting == 0
+        assert pool.exhausted()
+        waiter = asyncio.create_task(small_engine.connect().start())
+        await asyncio.sleep(0.05)
+        assert pool.waiting == 1
+
+    connection = await waiter
+    assert pool.waiting == 0
+    await connection.close()
+    assert not pool.exhausted()
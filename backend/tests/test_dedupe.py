@@ -0,0 +1,181 @@
+"""Candidate deduplication: blocking keys, clustering and merge."""
+
+import uuid
+
+import pytest
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.modules.candidates.dedupe import _cluster, find_duplicates
+from app.modules.candidates.models import Candidate
+from app.modules.candidates.schemas import DuplicatePair
+from app.modules.candidates.service import CandidateService
+from app.modules.hiring_managers.models import HiringManager
+from app.modules.vacancies.models import CandidatePool, Track, Vacancy
+from app.shared.enums import CandidatePoolStatus
+
+
+@pytest.fixture
+def token() -> str:
+    """Name token no other row contains, so blocks only hold this test's rows."""
+    return f"zq{uuid.uuid4().hex[:12]}"
+
+
+async def _candidates(db, *profiles: dict) -> list[Candidate]:
+    candidates = [
+        Candidate(telegram_id=uuid.uuid4().int % 10**12, **profile) for profile in profiles
+    ]
+    db.add_all(candidates)
+    await db.flush()
+    return candidates
+
+
+async def _pairs(db, candidates: list[Candidate]) -> set[frozenset[uuid.UUID]]:
+    """Compared pairs among the given candidates."""
+    ids = {candidate.id for candidate in candidates}
+    report = await find_duplicates(db, limit=10**6)
+    return {
+        frozenset((pair.left_id, pair.right_id))
+        for cluster in report.clusters
+        for pair in cluster.pairs
+        if {pair.left_id, pair.right_id} <= ids
+    }
+
+
+def _pair(left: uuid.UUID, right: uuid.UUID) -> DuplicatePair:
+    return DuplicatePair(
+        left_id=left,
+        right_id=right,
+        score=1.0,
+        phone_match=True,
+        name_similarity=1.0,
+        university_match=True,
+    )
+
+
+def test_cluster_joins_connected_pairs():
+    a, b, c, d, e = (uuid.uuid4() for _ in range(5))
+    chain = [_pair(a, b), _pair(c, b)]
+    separate = [_pair(d, e)]
+
+    components = _cluster([chain[0], separate[0], chain[1]])
+
+    assert sorted(components, key=len) == [separate, chain]
+
+
+async def test_phone_and_reordered_name_are_one_cluster(db, token):
+    first, second, _ = await _candidates(
+        db,
+        {"full_name": f"Иванов {token}", "phone": "+7 (999) 123-45-67", "university": "МГУ"},
+        {"full_name": f"{token.upper()}  иванов", "phone": "89991234567", "university": "мгу"},
+        {"full_name": f"Петров {token}", "phone": "+7 (999) 765-43-21"},
+    )
+
+    report = await find_duplicates(db, limit=10**6)
+
+    cluster = next(
+        cluster
+        for cluster in report.clusters
+        if first.id in {candidate.id for candidate in cluster.candidates}
+    )
+    assert {candidate.id for candidate in cluster.candidates} == {first.id, second.id}
+    [pair] = cluster.pairs
+    assert pair.phone_match and pair.university_match
+    assert pair.name_similarity == pytest.approx(1.0)
+    assert pair.score == pytest.approx(1.0)
+
+
+async def test_only_candidates_sharing_a_key_are_compared(db, token, monkeypatch):
+    monkeypatch.setattr(settings, "dedupe_min_score", 0.0)
+    university = f"Университет {token}"
+    misspelled, original, other_university, other_name = await _candidates(
+        db,
+        {"full_name": f"Смирнова {token}", "university": university},
+        {"full_name": f"Смирнов {token}", "university": university.upper()},
+        {"full_name": f"Смирнов {token}", "university": "МГУ"},
+        {"full_name": f"Кузнецов {token}", "university": university},
+    )
+
+    pairs = await _pairs(db, [misspelled, original, other_university, other_name])
+
+    # Name prefixes + university, and the exact name; nothing else is compared
+    assert pairs == {
+        frozenset((misspelled.id, original.id)),
+        frozenset((original.id, other_university.id)),
+    }
+
+
+async def test_oversized_blocks_are_skipped(db, token, monkeypatch):
+    monkeypatch.setattr(settings, "dedupe_min_score", 0.0)
+    monkeypatch.setattr(settings, "dedupe_max_block_size", 2)
+    pair = await _candidates(db, *({"full_name": f"Сидоров {token}"} for _ in range(2)))
+    block = await _candidates(db, *({"full_name": f"Орлов {token}"} for _ in range(3)))
+
+    assert await _pairs(db, pair + block) == {frozenset(candidate.id for candidate in pair)}
+
+
+async def _vacancies(db, count: int) -> list[Vacancy]:
+    track = Track(name="Backend")
+    hiring_manager = HiringManager(
+        telegram_id=uuid.uuid4().int % 10**12, first_name="Пётр", last_name="Петров"
+    )
+    db.add_all([track, hiring_manager])
+    await db.flush()
+    vacancies = [
+        Vacancy(track_id=track.id, hiring_manager_id=hiring_manager.id, description="Python")
+        for _ in range(count)
+    ]
+    db.add_all(vacancies)
+    await db.flush()
+    return vacancies
+
+
+async def test_merge_fills_profile_and_moves_pool_entries(db, token):
+    shared, moved = await _vacancies(db, 2)
+    target, duplicate = await _candidates(
+        db,
+        {"full_name": f"Иванов {token}", "domains": ["ML"]},
+        {
+            "full_name": f"Иванов {token}",
+            "phone": "+79991234567",
+            "course": 3,
+            "domains": ["ML", "Backend"],
+        },
+    )
+    db.add_all(
+        [
+            CandidatePool(
+                vacancy_id=shared.id, candidate_id=target.id, status=CandidatePoolStatus.VIEWED
+            ),
+            CandidatePool(
+                vacancy_id=shared.id,
+                candidate_id=duplicate.id,
+                status=CandidatePoolStatus.SELECTED,
+            ),
+            CandidatePool(
+                vacancy_id=moved.id, candidate_id=duplicate.id, status=CandidatePoolStatus.SELECTED
+            ),
+        ]
+    )
+    await db.flush()
+    duplicate_id = duplicate.id
+
+    merged = await CandidateService.merge_candidates(db, target.id, [duplicate_id, target.id])
+
+    assert merged.id == target.id
+    assert (merged.phone, merged.course, merged.domains) == ("+79991234567", 3, ["ML", "Backend"])
+    assert await db.get(Candidate, duplicate_id) is None
+    entries = await db.execute(
+        select(CandidatePool.vacancy_id, CandidatePool.candidate_id, CandidatePool.status)
+        .where(CandidatePool.vacancy_id.in_([shared.id, moved.id]))
+    )
+    assert set(entries) == {
+        (shared.id, target.id, CandidatePoolStatus.VIEWED),
+        (moved.id, target.id, CandidatePoolStatus.SELECTED),
+    }
+
+
+async def test_merge_with_unknown_duplicate_returns_none(db, token):
+    [target] = await _candidates(db, {"full_name": f"Иванов {token}"})
+
+    assert await CandidateService.merge_candidates(db, target.id, [uuid.uuid4()]) is None
@@ -0,0 +1,124 @@
+"""Streaming CSV/NDJSON exports through the API."""
+
+import csv
+import io
+import json
+import uuid
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core import database
+from app.modules.candidates.schemas import CandidateCreate, CandidateResponse
+from app.modules.candidates.service import CandidateService
+from app.modules.hiring_managers.schemas import HiringManagerCreate
+from app.modules.hiring_managers.service import HiringManagerService
+from app.modules.vacancies.schemas import (
+    CandidatePoolCreate,
+    CandidatePoolWithDetailsResponse,
+    TrackCreate,
+    VacancyCreate,
+    VacancyResponse,
+)
+from app.modules.vacancies.service import CandidatePoolService, TrackService, VacancyService
+from app.shared import export
+
+
+def _telegram_id() -> int:
+    return uuid.uuid4().int % 10**12
+
+
+@pytest.fixture
+async def dataset(db) -> dict[str, int]:
+    """Track with one vacancy and two pooled candidates."""
+    track = await TrackService.create_track(db, TrackCreate(name=f"Backend {uuid.uuid4().hex}"))
+    hiring_manager = await HiringManagerService.create_hiring_manager(
+        db, HiringManagerCreate(telegram_id=_telegram_id(), first_name="Пётр", last_name="Петров")
+    )
+    vacancy = await VacancyService.create_vacancy(
+        db,
+        VacancyCreate(
+            track_id=track.id, hiring_manager_id=hiring_manager.id, description="Python, SQL"
+        ),
+    )
+    for name in ("Иванов Иван", "Петрова Анна"):
+        candidate = await CandidateService.create_candidate(
+            db,
+            CandidateCreate(
+                telegram_id=_telegram_id(),
+                full_name=name,
+                preferred_tracks=[track.id],
+                achievements=["ICPC, финал"],
+            ),
+        )
+        await CandidatePoolService.add_to_pool(
+            db, vacancy.id, CandidatePoolCreate(candidate_id=candidate.id)
+        )
+    return {"track_id": track.id, "vacancy_id": vacancy.id}
+
+
+@pytest.fixture
+def sessions(client, db, monkeypatch) -> dict[str, list[AsyncSession]]:
+    """Sessions opened by request dependencies and by export streams."""
+    opened: dict[str, list[AsyncSession]] = {"request": [], "export": []}
+    factory = async_sessionmaker(db.bind, class_=AsyncSession, expire_on_commit=False)
+
+    def recording(kind: str):
+        def open_session() -> AsyncSession:
+            session = factory()
+            opened[kind].append(session)
+            return session
+
+        return open_session
+
+    monkeypatch.setattr(database, "AsyncSessionLocal", recording("request"))
+    monkeypatch.setattr(export, "AsyncSessionLocal", recording("export"))
+    return opened
+
+
+def _exports(dataset: dict[str, int]) -> list[tuple[str, type]]:
+    return [
+        (f"/api/candidates/export?track_id={dataset['track_id']}", CandidateResponse),
+        (f"/api/vacancies/export?track_id={dataset['track_id']}", VacancyResponse),
+        (
+            f"/api/candidate-pools/export?vacancy_id={dataset['vacancy_id']}",
+            CandidatePoolWithDetailsResponse,
+        ),
+    ]
+
+
+async def test_csv_export_has_header_and_rows(client, dataset, sessions):
+    for url, schema in _exports(dataset):
+        response = await client.get(f"{url}&format=csv")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "text/csv; charset=utf-8"
+        header, *rows = list(csv.reader(io.StringIO(response.text)))
+        assert set(schema.model_fields) <= set(header)
+        assert len(rows) == (1 if schema is VacancyResponse else 2)
+        assert all(len(row) == len(header) for row in rows)
+
+    assert sessions["request"] == [] and len(sessions["export"]) == 3
+
+
+async def test_csv_export_encodes_json_arrays(client, dataset, sessions):
+    response = await client.get(_exports(dataset)[0][0])
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert {row["full_name"] for row in rows} == {"Иванов Иван", "Петрова Анна"}
+    assert [json.loads(row["achievements"]) for row in rows] == [["ICPC, финал"]] * 2
+
+
+async def test_ndjson_export_is_one_object_per_line(client, dataset, sessions):
+    for url, schema in _exports(dataset):
+        response = await client.get(f"{url}&format=ndjson")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert response.text.endswith("\n")
+        lines = response.text.splitlines()
+        assert len(lines) == (1 if schema is VacancyResponse else 2)
+        for line in lines:
+            schema.model_validate(json.loads(line))
+
+    assert sessions["request"] == [] and len(sessions["export"]) == 3
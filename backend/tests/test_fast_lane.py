@@ -0,0 +1,105 @@
+"""Core fast lane of the swipe loop."""
+
+import uuid
+
+from app.modules.candidates.models import Candidate
+from app.modules.hiring_managers.models import HiringManager
+from app.modules.vacancies.fast_lane import SwipeFastLane, _like_prefix, next_candidate_query
+from app.modules.vacancies.models import Track, Vacancy
+from app.modules.vacancies.schemas import NextCandidateFilters
+from app.shared.enums import CandidatePoolStatus
+
+
+def test_like_prefix_escapes_wildcards():
+    assert _like_prefix("МГУ") == "мгу%"
+    assert _like_prefix("100%_a/b") == "100/%/_a//b%"
+
+
+def test_query_binds_only_set_filters():
+    _, params = next_candidate_query(
+        7, NextCandidateFilters(university="МГУ", domains=("ML", "Backend"))
+    )
+
+    assert params == {"vacancy_id": 7, "university": "мгу%", "domains": ["ML", "Backend"]}
+
+
+def test_statement_is_memoized_per_filter_combination():
+    first, _ = next_candidate_query(1, NextCandidateFilters(course=3))
+    second, _ = next_candidate_query(2, NextCandidateFilters(course=4))
+    other, _ = next_candidate_query(1, NextCandidateFilters(location="Москва"))
+
+    assert first is second
+    assert first is not other
+
+
+async def _vacancy(db) -> Vacancy:
+    track = Track(name="Backend")
+    hiring_manager = HiringManager(
+        telegram_id=uuid.uuid4().int % 10**12, first_name="Пётр", last_name="Петров"
+    )
+    db.add_all([track, hiring_manager])
+    await db.flush()
+    vacancy = Vacancy(track_id=track.id, hiring_manager_id=hiring_manager.id, description="Python")
+    db.add(vacancy)
+    await db.flush()
+    return vacancy
+
+
+async def test_swipe_loop_skips_pooled_candidates(db):
+    vacancy = await _vacancy(db)
+    university = f"Университет {uuid.uuid4()}"
+    candidate = Candidate(
+        telegram_id=uuid.uuid4().int % 10**12, full_name="Иванов Иван", university=university
+    )
+    db.add(candidate)
+    await db.flush()
+    # Only this candidate matches, whatever else the database holds
+    filters = NextCandidateFilters(university=university)
+
+    assert await SwipeFastLane.vacancy_exists(db, vacancy.id)
+    assert not await SwipeFastLane.vacancy_exists(db, 2**31 - 1)
+    assert (await SwipeFastLane.next_candidate(db, vacancy.id, filters)).id == candidate.id
+
+    entry = await SwipeFastLane.add_to_pool(
+        db, vacancy.id, candidate.id, CandidatePoolStatus.VIEWED
+    )
+    assert entry.candidate_id == candidate.id
+    assert entry.status == CandidatePoolStatus.VIEWED
+    assert (
+        await SwipeFastLane.add_to_pool(db, vacancy.id, candidate.id, CandidatePoolStatus.SELECTED)
+        is None
+    )
+    assert await SwipeFastLane.next_candidate(db, vacancy.id, filters) is None
+
+
+async def test_next_candidate_follows_track_priority_then_course(db):
+    vacancy = await _vacancy(db)
+    other_track = vacancy.track_id + 1
+    university = f"Университет {uuid.uuid4()}"
+
+    def candidate(full_name: str, preferred_tracks: list[int], course: int) -> Candidate:
+        return Candidate(
+            telegram_id=uuid.uuid4().int % 10**12,
+            full_name=full_name,
+            university=university,
+            preferred_tracks=preferred_tracks,
+            course=course,
+        )
+
+    anyone = candidate("Без трека", [], 1)
+    fourth = candidate("Четвёртый выбор", [other_track] * 3 + [vacancy.track_id], 1)
+    second = candidate("Второй выбор", [other_track, vacancy.track_id], 1)
+    first_senior = candidate("Первый выбор, 4 курс", [vacancy.track_id], 4)
+    first_junior = candidate("Первый выбор, 2 курс", [vacancy.track_id], 2)
+    db.add_all([anyone, fourth, second, first_senior, first_junior])
+    await db.flush()
+    filters = NextCandidateFilters(university=university)
+
+    order = []
+    while next_candidate := await SwipeFastLane.next_candidate(db, vacancy.id, filters):
+        order.append(next_candidate.id)
+        await SwipeFastLane.add_to_pool(
+            db, vacancy.id, next_candidate.id, CandidatePoolStatus.VIEWED
+        )
+
+    assert order == [first_junior.id, first_senior.id, second.id, fourth.id, anyone.id]
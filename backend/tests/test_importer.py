@@ -0,0 +1,120 @@
+"""Candidate import parsing, row validation and COPY + merge."""
+
+import io
+
+from sqlalchemy import select
+
+from app.modules.candidates import importer
+from app.modules.candidates.importer import CandidateImporter, iter_raw_rows
+from app.modules.candidates.models import Candidate
+from app.shared.enums import ImportFormat
+
+CSV_HEADER = "telegram_id,full_name,course,domains,preferred_tracks\n"
+
+
+def _csv(*rows: str) -> io.StringIO:
+    return io.StringIO(CSV_HEADER + "".join(f"{row}\n" for row in rows))
+
+
+def test_csv_rows_and_list_cells():
+    lines = _csv('1,Иванов Иван,3,ML;Backend ; ,"[1, 2]"', "2,Петров Пётр,,,")
+
+    rows = list(iter_raw_rows(lines, ImportFormat.CSV))
+
+    assert rows == [
+        (
+            2,
+            {
+                "telegram_id": "1",
+                "full_name": "Иванов Иван",
+                "course": "3",
+                "domains": ["ML", "Backend"],
+                "preferred_tracks": [1, 2],
+            },
+            None,
+        ),
+        (3, {"telegram_id": "2", "full_name": "Петров Пётр"}, None),
+    ]
+
+
+def test_csv_invalid_list_cell():
+    [(line, row, error)] = iter_raw_rows(_csv('1,Иванов Иван,,,"[1,"'), ImportFormat.CSV)
+
+    assert (line, row) == (2, None)
+    assert error.startswith("Invalid list value")
+
+
+def test_ndjson_rows():
+    lines = io.StringIO('{"telegram_id": 1, "full_name": "Иванов Иван"}\n\n[1]\n{oops\n')
+
+    rows = list(iter_raw_rows(lines, ImportFormat.NDJSON))
+
+    assert rows[0] == (1, {"telegram_id": 1, "full_name": "Иванов Иван"}, None)
+    assert rows[1] == (3, None, "Expected a JSON object")
+    assert rows[2][0] == 4 and rows[2][2].startswith("Invalid JSON")
+
+
+def test_validate_rejects_invalid_and_repeated_rows():
+    candidate_importer = CandidateImporter(db=None)
+    rows = [
+        (2, {"telegram_id": 1, "full_name": "Иванов Иван", "course": 3}, None),
+        (3, {"telegram_id": "x", "full_name": "Петров Пётр"}, None),
+        (4, {"telegram_id": 2, "full_name": "Сидоров", "course": 9}, None),
+        (5, {"telegram_id": 1, "full_name": "Иванов Иван"}, None),
+        (6, None, "Invalid JSON: Expecting value"),
+    ]
+
+    records = list(candidate_importer._validate(rows))
+
+    assert [record[1:4] for record in records] == [(1, "Иванов Иван", None)]
+    assert candidate_importer.total_rows == 5
+    assert candidate_importer.rejected == 4
+    assert [(reject.line, reject.telegram_id) for reject in candidate_importer.rejects] == [
+        (3, None),
+        (4, 2),
+        (5, 1),
+        (6, None),
+    ]
+    assert candidate_importer.rejects[1].error.startswith("course:")
+    assert candidate_importer.rejects[2].error == "Duplicate telegram_id in file"
+
+
+def test_reported_rejects_are_capped(monkeypatch):
+    monkeypatch.setattr(importer, "MAX_REPORTED_REJECTS", 2)
+    candidate_importer = CandidateImporter(db=None)
+
+    list(candidate_importer._validate((line, None, "bad") for line in range(5)))
+
+    assert candidate_importer.rejected == 5
+    assert len(candidate_importer.rejects) == 2
+
+
+async def test_run_copies_in_batches_and_merges(db, monkeypatch):
+    monkeypatch.setattr(importer, "IMPORT_BATCH_SIZE", 2)
+    db.add(Candidate(telegram_id=900000000001, full_name="Старое имя"))
+    await db.flush()
+    lines = _csv(
+        "900000000001,Новое имя,2,,",
+        "900000000002,Иванов Иван,,ML,",
+        "900000000003,Петров Пётр,,,",
+        "bad,Без ID,,,",
+    )
+
+    report = await CandidateImporter(db).run(iter_raw_rows(lines, ImportFormat.CSV))
+
+    assert (report.total_rows, report.inserted, report.updated, report.rejected) == (4, 2, 1, 1)
+    result = await db.execute(
+        select(Candidate.full_name).where(Candidate.telegram_id == 900000000001)
+    )
+    assert result.scalar_one() == "Новое имя"
+
+
+async def test_run_skips_existing(db):
+    db.add(Candidate(telegram_id=900000000011, full_name="Старое имя"))
+    await db.flush()
+
+    report = await CandidateImporter(db, update_existing=False).run(
+        iter_raw_rows(_csv("900000000011,Новое имя,,,"), ImportFormat.CSV)
+    )
+
+    assert (report.inserted, report.updated, report.skipped) == (0, 0, 1)
@@ -0,0 +1,57 @@
+"""Invalidation listener resilience."""
+
+import asyncio
+import logging
+
+import pytest
+
+from app.core import local_cache
+
+
+async def _run_listener_until(calls: list[int], count: int) -> None:
+    task = asyncio.create_task(local_cache._listen())
+    try:
+        while len(calls) < count:
+            await asyncio.sleep(0.01)
+    finally:
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+
+async def test_unexpected_errors_are_logged_and_retried(monkeypatch, caplog):
+    calls: list[int] = []
+
+    async def connect(dsn: str):
+        calls.append(1)
+        raise RuntimeError("unexpected")
+
+    monkeypatch.setattr(local_cache.asyncpg, "connect", connect)
+    monkeypatch.setattr(local_cache, "LISTENER_RETRY_DELAY", 0)
+
+    with caplog.at_level(logging.ERROR, logger=local_cache.logger.name):
+        await asyncio.wait_for(_run_listener_until(calls, 2), 1)
+
+    assert "Cache invalidation listener failed" in caplog.text
+    assert "RuntimeError: unexpected" in caplog.text
+    assert not local_cache.local_cache.ready
+
+
+async def test_failing_subscriber_does_not_stop_listener(monkeypatch, caplog):
+    calls: list[int] = []
+
+    def handler(key: str | None) -> None:
+        raise KeyError(key)
+
+    async def connect(dsn: str):
+        calls.append(1)
+        raise OSError("connection refused")
+
+    monkeypatch.setitem(local_cache._subscribers, "broken", handler)
+    monkeypatch.setattr(local_cache.asyncpg, "connect", connect)
+    monkeypatch.setattr(local_cache, "LISTENER_RETRY_DELAY", 0)
+
+    with caplog.at_level(logging.WARNING, logger=local_cache.logger.name):
+        await asyncio.wait_for(_run_listener_until(calls, 2), 1)
+
+    assert "Cache invalidation listener failed" in caplog.text
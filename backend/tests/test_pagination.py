@@ -0,0 +1,120 @@
+"""Keyset cursor encoding and page splitting."""
+
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.core.exceptions import BadRequestException
+from app.modules.candidates.models import Candidate
+from app.shared.enums import CandidatePoolStatus
+from app.shared.pagination import (
+    decode_cursor,
+    encode_cursor,
+    paginate_by,
+    paginate_by_created_at,
+    split_page,
+    split_page_by,
+)
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2026, 10, 19, 12, 30, tzinfo=timezone.utc)
+    row_id = uuid.uuid4()
+
+    cursor = encode_cursor(created_at, row_id)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (created_at.isoformat(), str(row_id))
+
+
+def test_cursor_encodes_enum_value():
+    cursor = encode_cursor(CandidatePoolStatus.SELECTED, 7)
+
+    assert decode_cursor(cursor) == (CandidatePoolStatus.SELECTED.value, "7")
+
+
+@pytest.mark.parametrize("cursor", ["not base64!", "e30", "WzFd", "bnVsbA"])
+def test_malformed_cursor(cursor):
+    with pytest.raises(BadRequestException):
+        decode_cursor(cursor)
+
+
+def test_paginate_filters_after_cursor():
+    created_at = datetime(2026, 10, 19, tzinfo=timezone.utc)
+    row_id = uuid.uuid4()
+    query = paginate_by_created_at(
+        select(Candidate), Candidate, encode_cursor(created_at, row_id), limit=20
+    )
+
+    compiled = query.compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+
+    assert "(candidates.created_at, candidates.id) > (" in sql
+    assert "ORDER BY candidates.created_at, candidates.id" in sql
+    assert list(compiled.params.values()) == [created_at, row_id, 21]
+
+
+def test_paginate_descending():
+    query = paginate_by(
+        select(Candidate), Candidate.course, Candidate.id, None, limit=5, descending=True
+    )
+
+    sql = str(query.compile(dialect=postgresql.dialect()))
+
+    assert "ORDER BY candidates.course DESC, candidates.id DESC" in sql
+    assert "WHERE" not in sql
+
+
+def test_cursor_of_wrong_type():
+    cursor = encode_cursor("yesterday", uuid.uuid4())
+
+    with pytest.raises(BadRequestException):
+        paginate_by_created_at(select(Candidate), Candidate, cursor, limit=20)
+
+
+def test_skip_without_cursor_is_an_offset():
+    query = paginate_by_created_at(select(Candidate), Candidate, None, limit=20, skip=40)
+
+    compiled = query.compile(dialect=postgresql.dialect())
+
+    assert "OFFSET" in str(compiled)
+    assert sorted(compiled.params.values()) == [21, 40]
+
+
+def test_skip_with_cursor_is_rejected():
+    cursor = encode_cursor(datetime(2026, 10, 19, tzinfo=timezone.utc), uuid.uuid4())
+
+    with pytest.raises(BadRequestException):
+        paginate_by_created_at(select(Candidate), Candidate, cursor, limit=20, skip=1)
+
+
+@pytest.mark.parametrize("path", ["/api/candidates/", "/api/tracks/", "/api/vacancies/"])
+async def test_skip_with_cursor_is_400(client, path):
+    cursor = encode_cursor(datetime(2026, 10, 19, tzinfo=timezone.utc), 1)
+
+    response = await client.get(path, params={"skip": 1, "cursor": cursor})
+
+    assert response.status_code == 400
+
+
+def test_split_page_builds_next_cursor():
+    rows = [
+        SimpleNamespace(id=index, created_at=datetime(2026, 10, index + 1, tzinfo=timezone.utc))
+        for index in range(3)
+    ]
+
+    items, cursor = split_page(rows, limit=2)
+
+    assert items == rows[:2]
+    assert decode_cursor(cursor) == (rows[1].created_at.isoformat(), "1")
+
+
+def test_split_last_page():
+    rows = [SimpleNamespace(id=1, score=10), SimpleNamespace(id=2, score=20)]
+
+    assert split_page_by(rows, limit=2, sort_key="score") == (rows, None)
+    assert split_page_by([], limit=2, sort_key="score") == ([], None)
@@ -0,0 +1,125 @@
+"""Password hashing pool and verified token cache."""
+
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from app.core import security
+from app.core.config import settings
+from app.core.security import (
+    PasswordHasher,
+    VerifiedTokenCache,
+    create_access_token,
+    decode_access_token,
+    password_needs_rehash,
+)
+
+
+@pytest.fixture
+def hasher():
+    hasher = PasswordHasher(workers=1, max_waiters=1)
+    yield hasher
+    hasher.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def cheap_bcrypt(monkeypatch):
+    """Lowest bcrypt cost, so hashing takes milliseconds."""
+    monkeypatch.setattr(settings, "bcrypt_rounds", 4)
+
+
+async def test_hash_and_verify_round_trip(hasher):
+    hashed = await hasher.hash("correct horse")
+
+    assert hashed.startswith("$2b$04$")
+    assert await hasher.verify("correct horse", hashed)
+    assert not await hasher.verify("wrong horse", hashed)
+    assert hasher.get_stats()["completed"] == 3
+
+
+async def test_rehash_needed_on_cost_change(hasher, monkeypatch):
+    hashed = await hasher.hash("correct horse")
+    assert not password_needs_rehash(hashed)
+
+    monkeypatch.setattr(settings, "bcrypt_rounds", 5)
+
+    assert password_needs_rehash(hashed)
+
+
+@pytest.mark.parametrize("hashed", ["", "plain", "$2b$", "$2b$xx$salt"])
+def test_malformed_hash_needs_rehash(hashed):
+    assert password_needs_rehash(hashed)
+
+
+async def test_full_queue_rejects_with_503(hasher, monkeypatch):
+    release = threading.Event()
+
+    def blocking_hash(password: str) -> str:
+        release.wait()
+        return password
+
+    monkeypatch.setattr(security, "get_password_hash", blocking_hash)
+    running = asyncio.create_task(hasher.hash("running"))
+    queued = asyncio.create_task(hasher.hash("queued"))
+    await asyncio.sleep(0)
+
+    with pytest.raises(HTTPException) as rejected:
+        await hasher.hash("rejected")
+    release.set()
+
+    assert rejected.value.status_code == 503
+    assert "Retry-After" in rejected.value.headers
+    assert await asyncio.gather(running, queued) == ["running", "queued"]
+    stats = hasher.get_stats()
+    assert (stats["completed"], stats["rejected"], stats["max_queued"]) == (2, 1, 1)
+
+
+def test_token_cache_expires_at_exp(monkeypatch):
+    cache = VerifiedTokenCache(max_entries=10)
+    digest = cache.digest("token")
+    payload = {"sub": "user", "exp": 1000}
+    cache.put(digest, payload)
+
+    monkeypatch.setattr(security.time, "time", lambda: 999.0)
+    assert cache.get(digest) is payload
+    monkeypatch.setattr(security.time, "time", lambda: 1000.0)
+    assert cache.get(digest) is None
+
+    assert cache.get_stats() == {"entries": 0, "hits": 1, "misses": 1}
+
+
+def test_token_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(security.time, "time", lambda: 0.0)
+    cache = VerifiedTokenCache(max_entries=2)
+    first, second, third = (cache.digest(token) for token in ("first", "second", "third"))
+    cache.put(first, {"exp": 1})
+    cache.put(second, {"exp": 1})
+
+    assert cache.get(first) is not None
+    cache.put(third, {"exp": 1})
+
+    assert cache.get(second) is None
+    assert cache.get(first) is not None and cache.get(third) is not None
+    assert cache.get_stats()["entries"] == 2
+
+
+def test_token_cache_skips_tokens_without_exp_and_when_disabled():
+    enabled, disabled = VerifiedTokenCache(max_entries=10), VerifiedTokenCache(max_entries=0)
+    enabled.put(enabled.digest("no-exp"), {"sub": "user"})
+    disabled.put(disabled.digest("token"), {"exp": 2**40})
+
+    assert enabled.get_stats()["entries"] == disabled.get_stats()["entries"] == 0
+
+
+def test_decode_reuses_verified_payload(monkeypatch):
+    monkeypatch.setattr(security, "verified_tokens", VerifiedTokenCache(max_entries=10))
+    token = create_access_token({"sub": "user"})
+
+    payload = decode_access_token(token)
+
+    assert payload["sub"] == "user"
+    assert decode_access_token(token) is payload
+    assert decode_access_token(token + "x") is None
+    assert security.verified_tokens.get_stats() == {"entries": 1, "hits": 1, "misses": 2}
@@ -0,0 +1,131 @@
+"""Refresh token sessions and their store failures."""
+
+import uuid
+
+import pytest
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeRedis
+from fastapi import HTTPException
+
+from app.modules.auth import sessions
+from app.modules.auth.schemas import RefreshRequest
+from app.modules.auth.service import AuthService
+
+
+@pytest.fixture
+def server(monkeypatch) -> FakeServer:
+    server = FakeServer()
+    monkeypatch.setattr(sessions, "get_redis", lambda: FakeRedis(server=server))
+    return server
+
+
+@pytest.fixture
+def redis(server) -> FakeRedis:
+    return FakeRedis(server=server)
+
+
+def _index(user_id: uuid.UUID) -> str:
+    return sessions._user_key(user_id)
+
+
+def _session_id(refresh_token: str) -> str:
+    return refresh_token.split(".")[1]
+
+
+def _session(user_id: uuid.UUID, refresh_token: str) -> str:
+    return sessions._session_key(user_id, _session_id(refresh_token))
+
+
+async def test_rotation_replaces_token_and_renews_index(redis):
+    user_id = uuid.uuid4()
+    token = await sessions.create_session(user_id)
+    await redis.expire(_index(user_id), 60)
+
+    rotated_user_id, new_token = await sessions.rotate_session(token)
+
+    assert rotated_user_id == user_id
+    assert _session_id(new_token) == _session_id(token) and new_token != token
+    assert await redis.ttl(_index(user_id)) > 60
+    assert await redis.smembers(_index(user_id)) == {_session_id(token).encode()}
+
+
+async def test_keys_of_a_user_share_one_cluster_slot(redis):
+    user_id = uuid.uuid4()
+    token = await sessions.create_session(user_id)
+
+    assert f"{{{user_id}}}" in _session(user_id, token)
+    assert f"{{{user_id}}}" in _index(user_id)
+
+
+async def test_reused_token_revokes_session(redis):
+    user_id = uuid.uuid4()
+    token = await sessions.create_session(user_id)
+    _, new_token = await sessions.rotate_session(token)
+
+    assert await sessions.rotate_session(token) is None
+
+    assert await sessions.rotate_session(new_token) is None
+    assert not await redis.exists(_session(user_id, token))
+    assert await redis.smembers(_index(user_id)) == set()
+
+
+async def test_expired_session_leaves_index_when_presented(redis):
+    user_id = uuid.uuid4()
+    expired, active = [await sessions.create_session(user_id) for _ in range(2)]
+    await redis.delete(_session(user_id, expired))
+
+    assert await sessions.rotate_session(expired) is None
+
+    assert await redis.smembers(_index(user_id)) == {_session_id(active).encode()}
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        "",
+        "no-secret",
+        f"{uuid.uuid4().hex}.session",
+        "not-a-uuid.session.secret",
+        f"{uuid.uuid4().hex}.{uuid.uuid4().hex}.secret",
+    ],
+)
+async def test_unknown_token_is_rejected(server, token):
+    assert await sessions.rotate_session(token) is None
+
+
+async def test_logout_removes_session_from_index(redis):
+    user_id = uuid.uuid4()
+    token, other = [await sessions.create_session(user_id) for _ in range(2)]
+
+    await sessions.revoke_session(token)
+
+    assert await sessions.rotate_session(token) is None
+    assert await redis.smembers(_index(user_id)) == {_session_id(other).encode()}
+
+
+async def test_revoke_user_sessions_closes_all(redis):
+    user_id = uuid.uuid4()
+    expired, *tokens = [await sessions.create_session(user_id) for _ in range(3)]
+    await redis.delete(_session(user_id, expired))
+
+    assert await sessions.revoke_user_sessions(user_id) == 2
+
+    for token in tokens:
+        assert await sessions.rotate_session(token) is None
+    assert not await redis.exists(_index(user_id))
+
+
+@pytest.mark.parametrize("call", ["refresh", "logout", "logout_all"])
+async def test_store_failure_is_503(server, call):
+    service = AuthService(db=None)
+    server.connected = False
+
+    with pytest.raises(HTTPException) as exc_info:
+        if call == "logout_all":
+            await service.logout_all(str(uuid.uuid4()))
+        else:
+            token = f"{uuid.uuid4().hex}.session.secret"
+            await getattr(service, call)(RefreshRequest(refresh_token=token))
+
+    assert exc_info.value.status_code == 503
+    assert "Retry-After" in exc_info.value.headers
@@ -0,0 +1,112 @@
+"""Single-flight coalescing and XFetch early refresh."""
+
+import asyncio
+
+import pytest
+
+from app.core import singleflight
+from app.core.singleflight import SingleFlight, should_refresh_early
+
+
+async def test_concurrent_calls_share_one_computation():
+    flight = SingleFlight()
+    release = asyncio.Event()
+    calls = 0
+
+    async def compute() -> str:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "value"
+
+    callers = [asyncio.create_task(flight.do("key", compute)) for _ in range(5)]
+    await asyncio.sleep(0)
+    assert flight.in_flight("key")
+    release.set()
+
+    assert await asyncio.gather(*callers) == ["value"] * 5
+    assert calls == 1
+    assert flight.get_stats() == {"in_flight": 0, "shared": 4}
+
+
+async def test_finished_key_computes_again():
+    flight = SingleFlight()
+    results = iter([1, 2])
+
+    async def compute() -> int:
+        return next(results)
+
+    assert await flight.do("key", compute) == 1
+    assert await flight.do("key", compute) == 2
+
+
+async def test_keys_are_independent():
+    flight = SingleFlight()
+
+    async def compute(value: str) -> str:
+        await asyncio.sleep(0)
+        return value
+
+    assert await asyncio.gather(
+        flight.do("a", lambda: compute("a")), flight.do("b", lambda: compute("b"))
+    ) == ["a", "b"]
+
+
+async def test_exception_reaches_every_caller():
+    flight = SingleFlight()
+
+    async def compute() -> None:
+        await asyncio.sleep(0)
+        raise LookupError("missing")
+
+    results = await asyncio.gather(
+        flight.do("key", compute), flight.do("key", compute), return_exceptions=True
+    )
+
+    assert [type(result) for result in results] == [LookupError, LookupError]
+    assert not flight.in_flight("key")
+
+
+async def test_cancelled_caller_does_not_cancel_computation():
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def compute() -> str:
+        await release.wait()
+        return "value"
+
+    first = asyncio.create_task(flight.do("key", compute))
+    second = asyncio.create_task(flight.do("key", compute))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert await second == "value"
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+def test_refresh_early_never_without_cost(monkeypatch):
+    monkeypatch.setattr(singleflight.time, "time", lambda: 1000.0)
+
+    assert not should_refresh_early(0, expires_at=1000.5)
+    assert not should_refresh_early(1.0, expires_at=1000.5, beta=0)
+
+
+def test_refresh_early_grows_with_cost_and_proximity(monkeypatch):
+    monkeypatch.setattr(singleflight.time, "time", lambda: 1000.0)
+    # -log(0.5) ~ 0.69: the refresh window is 0.69 * delta * beta seconds
+    monkeypatch.setattr(singleflight.random, "random", lambda: 0.5)
+
+    assert should_refresh_early(1.0, expires_at=1000.5)
+    assert not should_refresh_early(1.0, expires_at=1001.0)
+    assert should_refresh_early(1.0, expires_at=1001.0, beta=2.0)
+    assert should_refresh_early(2.0, expires_at=1001.0)
+
+
+def test_expired_value_is_always_refreshed(monkeypatch):
+    monkeypatch.setattr(singleflight.time, "time", lambda: 1000.0)
+    monkeypatch.setattr(singleflight.random, "random", lambda: 1.0)
+
+    assert should_refresh_early(0.1, expires_at=1000.0)
+    assert not should_refresh_early(0.1, expires_at=1000.1)
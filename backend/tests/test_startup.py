@@ -0,0 +1,30 @@
+"""The API worker starts within budget and without heavy integrations."""
+
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "startup_budget.py"
+
+
+def _load_startup_budget():
+    spec = importlib.util.spec_from_file_location("startup_budget", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_app_import_skips_bot_worker_and_ml_packages():
+    startup_budget = _load_startup_budget()
+
+    sample = startup_budget.measure_once()
+
+    assert sample["forbidden"] == []
+    assert sample["elapsed_ms"] > 0
+
+
+def test_startup_budget_check_passes():
+    result = subprocess.run([sys.executable, str(SCRIPT)], capture_output=True, text=True)
+
+    assert result.returncode == 0, result.stdout + result.stderr
@@ -0,0 +1,54 @@
+"""Typeahead query normalization and debouncing."""
+
+import asyncio
+
+import pytest
+from pydantic import TypeAdapter
+
+from app.shared.typeahead import MAX_LIMIT, normalize_query, phone_digits, typeahead_response
+
+adapter = TypeAdapter(list[str])
+
+
+def test_normalize_query():
+    assert normalize_query("  Иванов \t ИВАН\n") == "иванов иван"
+
+
+@pytest.mark.parametrize(
+    ("query", "digits"),
+    [
+        ("+7 (999) 123-45", "799912345"),
+        ("912", "912"),
+        ("91", None),
+        ("+7 ()", None),
+        ("иванов 999", None),
+    ],
+)
+def test_phone_digits(query, digits):
+    assert phone_digits(query) == digits
+
+
+async def test_short_query_skips_the_database():
+    async def search(session, query, limit):
+        raise AssertionError("short queries must not be searched")
+
+    response = await typeahead_response("candidates:typeahead", " Ив ", 10, adapter, search)
+
+    assert response.body == b"[]"
+
+
+async def test_identical_concurrent_queries_share_one_search():
+    calls = []
+
+    async def search(session, query, limit):
+        calls.append((query, limit))
+        await asyncio.sleep(0.01)
+        return [query]
+
+    responses = await asyncio.gather(
+        typeahead_response("candidates:typeahead", "Иванов  Иван", 100, adapter, search),
+        typeahead_response("candidates:typeahead", "иванов иван", 100, adapter, search),
+    )
+
+    assert calls == [("иванов иван", MAX_LIMIT)]
+    assert [response.body for response in responses] == ['["иванов иван"]'.encode()] * 2
@@ -0,0 +1,97 @@
+"""Paginated with-candidates view with embedded records."""
+
+import uuid
+
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from app.modules.candidates.models import Candidate
+from app.modules.hiring_managers.models import HiringManager
+from app.modules.vacancies.models import CandidatePool, InterviewFeedback, Track, Vacancy
+from app.modules.vacancies.schemas import CandidatePoolEmbeddedResponse
+from app.modules.vacancies.service import CandidatePoolService
+from app.shared.enums import CandidatePoolStatus, PoolEmbed
+
+
+async def _pool(db, size: int) -> tuple[Vacancy, list[CandidatePool]]:
+    track = Track(name="Backend")
+    hiring_manager = HiringManager(
+        telegram_id=uuid.uuid4().int % 10**12, first_name="Пётр", last_name="Петров"
+    )
+    db.add_all([track, hiring_manager])
+    await db.flush()
+    vacancy = Vacancy(track_id=track.id, hiring_manager_id=hiring_manager.id, description="Python")
+    candidates = [
+        Candidate(telegram_id=uuid.uuid4().int % 10**12, full_name=f"Кандидат {index}")
+        for index in range(size)
+    ]
+    db.add(vacancy)
+    db.add_all(candidates)
+    await db.flush()
+    entries = [
+        CandidatePool(
+            vacancy_id=vacancy.id, candidate_id=candidate.id, status=CandidatePoolStatus.VIEWED
+        )
+        for candidate in candidates
+    ]
+    db.add_all(entries)
+    await db.flush()
+    return vacancy, entries
+
+
+async def test_embeds_are_loaded_by_one_statement(db, statements):
+    vacancy, entries = await _pool(db, 2)
+    db.add(
+        InterviewFeedback(pool_id=entries[0].id, feedback_text="Сильный", decision="to_finalist")
+    )
+    await db.flush()
+
+    statements.clear()
+    rows, cursor = await CandidatePoolService.get_vacancy_pool_page(
+        db, vacancy.id, embed=frozenset(PoolEmbed)
+    )
+
+    assert len(statements) == 1
+    assert cursor is None
+    by_id = {row.id: CandidatePoolEmbeddedResponse.model_validate(row) for row in rows}
+    assert by_id[entries[0].id].candidate.full_name == "Кандидат 0"
+    assert by_id[entries[0].id].feedback.decision == "to_finalist"
+    assert by_id[entries[1].id].feedback is None
+
+
+async def test_page_without_embeds(db):
+    vacancy, entries = await _pool(db, 1)
+
+    [row], _ = await CandidatePoolService.get_vacancy_pool_page(db, vacancy.id)
+
+    assert "candidate" not in row._mapping
+    assert "feedback" not in row._mapping
+    assert row.id == entries[0].id
+
+
+async def test_pages_follow_cursor_and_status(db):
+    vacancy, entries = await _pool(db, 3)
+    entries[0].status = CandidatePoolStatus.REJECTED
+    await db.flush()
+
+    first, cursor = await CandidatePoolService.get_vacancy_pool_page(db, vacancy.id, limit=2)
+    second, last_cursor = await CandidatePoolService.get_vacancy_pool_page(
+        db, vacancy.id, limit=2, cursor=cursor
+    )
+    rejected, _ = await CandidatePoolService.get_vacancy_pool_page(
+        db, vacancy.id, status=CandidatePoolStatus.REJECTED
+    )
+
+    assert len(first) == 2 and len(second) == 1 and last_cursor is None
+    assert {row.id for row in first + second} == {entry.id for entry in entries}
+    assert [row.id for row in rejected] == [entries[0].id]
+
+
+def test_unknown_embed_is_rejected():
+    # Validated before the lazy session touches the database
+    client = TestClient(create_app())
+
+    response = client.get("/api/vacancies/1/with-candidates", params={"embed": "candidate,score"})
+
+    assert response.status_code == 400
+    assert "candidate, feedback" in response.json()["detail"]
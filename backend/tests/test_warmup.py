@@ -0,0 +1,98 @@
+"""Startup warm-up never aborts or stalls startup."""
+
+import asyncio
+import logging
+
+from app import main
+from app.core import warmup
+from app.core.config import settings
+from app.core.local_cache import LocalCache
+
+
+class FakeConnection:
+    def __init__(self, fail_connect: bool = False, fail_ping: bool = False) -> None:
+        self.fail_connect = fail_connect
+        self.fail_ping = fail_ping
+        self.closed = False
+
+    async def start(self) -> "FakeConnection":
+        if self.fail_connect:
+            raise ConnectionRefusedError("refused")
+        return self
+
+    async def execute(self, statement) -> None:
+        if self.fail_ping:
+            raise TimeoutError("statement timeout")
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeEngine:
+    def __init__(self, connections: list[FakeConnection]) -> None:
+        self._connections = iter(connections)
+
+    def connect(self) -> FakeConnection:
+        return next(self._connections)
+
+
+async def test_failed_pings_are_logged_and_connections_closed(monkeypatch, caplog):
+    connections = [
+        FakeConnection(),
+        FakeConnection(fail_ping=True),
+        FakeConnection(fail_connect=True),
+    ]
+    monkeypatch.setattr(warmup, "engine", FakeEngine(connections))
+
+    with caplog.at_level(logging.WARNING, logger=warmup.logger.name):
+        assert await warmup.warm_db_pool(3) == 1
+
+    assert connections[0].closed and connections[1].closed
+    assert "Warmed 1 of 3 DB connections" in caplog.text
+
+
+async def test_nothing_to_warm(monkeypatch):
+    monkeypatch.setattr(warmup, "engine", FakeEngine([]))
+
+    assert await warmup.warm_db_pool(0) == 0
+
+
+async def test_wait_ready_returns_at_once_without_listener():
+    assert await asyncio.wait_for(LocalCache(max_entries=1).wait_ready(timeout=60), 1) is False
+
+
+async def test_priming_skipped_without_local_cache(monkeypatch):
+    async def wait_ready(timeout: float) -> bool:
+        raise AssertionError("waited for the listener")
+
+    monkeypatch.setattr(settings, "local_cache_enabled", False)
+    monkeypatch.setattr(main.local_cache, "wait_ready", wait_ready)
+
+    await main.prime_local_caches()
+
+
+async def test_ml_ping_runs_after_startup(monkeypatch):
+    release = asyncio.Event()
+    pinged: list[bool] = []
+
+    async def ping_ml_service() -> bool:
+        await release.wait()
+        pinged.append(True)
+        return True
+
+    async def noop(*args) -> None:
+        return None
+
+    for name in ("warm_db_pool", "ping_redis", "prime_local_caches", "stop_invalidation_listener",
+                 "close_redis"):
+        monkeypatch.setattr(main, name, noop)
+    monkeypatch.setattr(main, "start_invalidation_listener", lambda: None)
+    monkeypatch.setattr(main, "ping_ml_service", ping_ml_service)
+    monkeypatch.setattr(main.password_hasher, "shutdown", lambda: None)
+    monkeypatch.setattr(main, "engine", type("FakeEngine", (), {"dispose": noop})())
+
+    async with main.lifespan(main.FastAPI()):
+        assert pinged == []
+        release.set()
+
+    assert pinged == [True]
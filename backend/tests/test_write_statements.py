@@ -0,0 +1,222 @@
+"""Every create, update and delete of the CRUD services is one statement.
+
+The services return rows with ``INSERT/UPDATE/DELETE ... RETURNING`` and
+leave commits to ``get_db``; an extra lookup or flush shows up here as a
+second statement. The request tests count what a whole API request sends,
+route dependencies included.
+"""
+
+import uuid
+
+import pytest
+
+from app.modules.candidates.schemas import CandidateCreate, CandidateUpdate
+from app.modules.candidates.service import CandidateService
+from app.modules.hiring_managers.schemas import HiringManagerCreate, HiringManagerUpdate
+from app.modules.hiring_managers.service import HiringManagerService
+from app.modules.vacancies.schemas import (
+    CandidatePoolCreate,
+    CandidatePoolUpdate,
+    TrackCreate,
+    TrackUpdate,
+    VacancyCreate,
+    VacancyUpdate,
+)
+from app.modules.vacancies.service import CandidatePoolService, TrackService, VacancyService
+from app.shared.enums import CandidatePoolStatus
+
+
+def _telegram_id() -> int:
+    return uuid.uuid4().int % 10**12
+
+
+async def _hiring_manager(db):
+    return await HiringManagerService.create_hiring_manager(
+        db, HiringManagerCreate(telegram_id=_telegram_id(), first_name="Пётр", last_name="Петров")
+    )
+
+
+async def _vacancy(db):
+    track = await TrackService.create_track(db, TrackCreate(name="Backend"))
+    hiring_manager = await _hiring_manager(db)
+    return await VacancyService.create_vacancy(
+        db,
+        VacancyCreate(
+            track_id=track.id, hiring_manager_id=hiring_manager.id, description="Python developer"
+        ),
+    )
+
+
+async def _candidate(db):
+    return await CandidateService.create_candidate(
+        db, CandidateCreate(telegram_id=_telegram_id(), full_name="Иванов Иван")
+    )
+
+
+async def test_track_writes(db, statements):
+    statements.clear()
+    track = await TrackService.create_track(db, TrackCreate(name="Backend"))
+    assert len(statements) == 1
+
+    statements.clear()
+    updated = await TrackService.update_track(db, track.id, TrackUpdate(is_active=False))
+    assert len(statements) == 1
+    assert updated.is_active is False
+
+    statements.clear()
+    assert await TrackService.delete_track(db, track.id) is True
+    assert len(statements) == 1
+
+
+async def test_vacancy_writes(db, statements):
+    track = await TrackService.create_track(db, TrackCreate(name="Backend"))
+    hiring_manager = await _hiring_manager(db)
+
+    statements.clear()
+    vacancy = await VacancyService.create_vacancy(
+        db,
+        VacancyCreate(
+            track_id=track.id, hiring_manager_id=hiring_manager.id, description="Python developer"
+        ),
+    )
+    assert len(statements) == 1
+
+    statements.clear()
+    updated = await VacancyService.update_vacancy(
+        db, vacancy.id, VacancyUpdate(description="Senior Python developer")
+    )
+    assert len(statements) == 1
+    assert updated.description == "Senior Python developer"
+
+    statements.clear()
+    assert await VacancyService.delete_vacancy(db, vacancy.id) is True
+    assert len(statements) == 1
+
+
+async def test_pool_writes(db, statements):
+    vacancy = await _vacancy(db)
+    candidate = await _candidate(db)
+
+    statements.clear()
+    entry = await CandidatePoolService.add_to_pool(
+        db, vacancy.id, CandidatePoolCreate(candidate_id=candidate.id)
+    )
+    assert len(statements) == 1
+
+    statements.clear()
+    assert (
+        await CandidatePoolService.add_to_pool(
+            db, vacancy.id, CandidatePoolCreate(candidate_id=candidate.id)
+        )
+        is None
+    )
+    assert len(statements) == 1
+
+    statements.clear()
+    updated = await CandidatePoolService.update_pool_entry(
+        db, entry.id, CandidatePoolUpdate(status=CandidatePoolStatus.SELECTED)
+    )
+    assert len(statements) == 1
+    assert updated.status == CandidatePoolStatus.SELECTED
+
+    statements.clear()
+    assert await CandidatePoolService.remove_candidate_from_pool(db, entry.id) is True
+    assert len(statements) == 1
+
+
+async def test_candidate_writes(db, statements):
+    data = CandidateCreate(telegram_id=_telegram_id(), full_name="Иванов Иван")
+
+    statements.clear()
+    candidate = await CandidateService.create_candidate(db, data)
+    assert len(statements) == 1
+
+    statements.clear()
+    assert await CandidateService.create_candidate(db, data) is None
+    assert len(statements) == 1
+
+    statements.clear()
+    updated = await CandidateService.update_candidate(
+        db, candidate.id, CandidateUpdate(course=3)
+    )
+    assert len(statements) == 1
+    assert updated.course == 3
+
+    statements.clear()
+    assert await CandidateService.delete_candidate(db, candidate.id) is True
+    assert len(statements) == 1
+
+
+async def test_hiring_manager_writes(db, statements):
+    statements.clear()
+    hiring_manager = await _hiring_manager(db)
+    assert len(statements) == 1
+
+    statements.clear()
+    updated = await HiringManagerService.update_hiring_manager(
+        db, hiring_manager.id, HiringManagerUpdate(calendly_id="petrov")
+    )
+    assert len(statements) == 1
+    assert updated.calendly_id == "petrov"
+
+    statements.clear()
+    assert await HiringManagerService.delete_hiring_manager(db, hiring_manager.id) is True
+    assert len(statements) == 1
+
+
+@pytest.mark.parametrize(
+    "delete",
+    [
+        TrackService.delete_track,
+        VacancyService.delete_vacancy,
+    ],
+)
+async def test_delete_missing_row(db, statements, delete):
+    statements.clear()
+    assert await delete(db, 2**31 - 1) is False
+    assert len(statements) == 1
+
+
+async def test_create_request_is_one_statement(client, statements):
+    track = (await client.post("/api/tracks/", json={"name": "Backend"})).json()
+    hiring_manager = (
+        await client.post(
+            "/api/hiring-managers/",
+            json={"telegram_id": _telegram_id(), "first_name": "Пётр", "last_name": "Петров"},
+        )
+    ).json()
+
+    statements.clear()
+    response = await client.post(
+        "/api/vacancies/",
+        json={
+            "track_id": track["id"],
+            "hiring_manager_id": hiring_manager["id"],
+            "description": "Python developer",
+        },
+    )
+
+    assert response.status_code == 201
+    assert len(statements) == 1
+
+
+async def test_swipe_request_is_one_statement(client, db, statements):
+    vacancy = await _vacancy(db)
+    candidate = await _candidate(db)
+
+    statements.clear()
+    response = await client.post(f"/api/vacancies/{vacancy.id}/candidates/{candidate.id}/select")
+
+    assert response.status_code == 201
+    assert len(statements) == 1
+
+
+async def test_bulk_route_pays_for_its_timeout_override(client, db, statements):
+    vacancy = await _vacancy(db)
+
+    statements.clear()
+    response = await client.delete(f"/api/vacancies/{vacancy.id}")
+
+    assert response.status_code == 204
+    assert len(statements) == 2
+    assert "set_config('statement_timeout'" in statements[0]